@@ -4,6 +4,47 @@
 # License           : MIT license <Check LICENSE>
 # Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
 # Date              : 08.09.2024
-# Last Modified Date: 28.09.2024
-from .jtag_axi_hw import JtagToAXIFTDI
+# Last Modified Date: 19.10.2026
+import sys
+from .jtag_axi_calib import calibrate_freq
+from .jtag_axi_profile import discover_profile, apply_discovered_profile
+from .jtag_axi_transport import open, register_transport, transports
+from . import jtag_base as _jtag_base
 from .jtag_base import *
+
+# Drivers are imported on first access so pyftdi is only loaded when the
+# FTDI transport is actually used
+_LAZY_DRIVERS = {
+    "JtagToAXIDriver": ".jtag_axi_driver",
+    "JtagToAXIFTDI": ".jtag_axi_hw",
+    "VirtualJtagToAXI": ".jtag_axi_virtual",
+}
+
+# open() is left out on purpose, a star import would shadow builtins.open,
+# use jtag_axi.open() instead. The drivers are not exported either, a star
+# import would load them all (pyftdi included).
+__all__ = _jtag_base.__all__ + [
+    "calibrate_freq",
+    "discover_profile",
+    "register_transport",
+    "transports",
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_DRIVERS:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY_DRIVERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    # No module __getattr__ (PEP 562) before 3.7, pyftdi may be missing
+    from .jtag_axi_driver import JtagToAXIDriver
+    from .jtag_axi_virtual import VirtualJtagToAXI
+
+    try:
+        from .jtag_axi_hw import JtagToAXIFTDI
+    except ImportError:
+        pass
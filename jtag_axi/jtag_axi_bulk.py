@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_bulk.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import sys
+from array import array
+from .jtag_base import JDRStatusAXI, JTAGToAXIStatus, bits_to_ff_hex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+JTAG_AXI_OKAY_CODE = JTAGToAXIStatus.JTAG_AXI_OKAY.value
+# Raw STATUS words decoded at once by read_axi_block()
+BULK_DECODE_WORDS = 4096
+# array typecode per word size in bytes
+WORD_TYPECODES = {array(code).itemsize: code for code in ("L", "Q", "I", "H", "B")}
+
+
+def _data_array(data_width):
+    # Unsigned 64-bit words when they fit, plain ints otherwise
+    return array("Q") if data_width <= 64 else []
+
+
+def decode_status_words(words, data_width: int = 32):
+    """Split raw STATUS_AXI_REG values into (data, status code) arrays.
+
+    With NumPy and STATUS words up to 64 bits the decoding is vectorised and
+    NumPy arrays are returned, otherwise array('Q') (a list for buses wider
+    than 64 bits) and array('B').
+    """
+    mask = bits_to_ff_hex(data_width)
+    if np is not None and data_width + 4 <= 64:
+        raw = np.asarray(words, dtype=np.uint64)
+        status = (raw & np.uint64(0xF)).astype(np.uint8)
+        data = (raw >> np.uint64(4)) & np.uint64(mask)
+        return data, status
+    data = _data_array(data_width)
+    status = array("B")
+    for word in words:
+        data.append((word >> 4) & mask)
+        status.append(word & 0xF)
+    return data, status
+
+
+class AXIBlock:
+    """Results of a bulk read as parallel data/status arrays, no per word
+    objects are kept. Indexing builds a JDRStatusAXI on demand."""
+
+    __slots__ = ("address", "stride", "data_width", "data", "status")
+
+    def __init__(self, address: int, stride: int, data_width: int = 32):
+        self.address = address
+        self.stride = stride
+        self.data_width = data_width
+        self.data = _data_array(data_width)
+        self.status = array("B")
+
+    def extend(self, words):
+        """Append a list of raw STATUS_AXI_REG values, decoded with
+        decode_status_words()."""
+        data, status = decode_status_words(words, self.data_width)
+        if np is not None and isinstance(data, np.ndarray):
+            # Both sides are native unsigned 64/8-bit words
+            self.data.frombytes(data.tobytes())
+            self.status.frombytes(status.tobytes())
+        else:
+            self.data += data
+            self.status += status
+
+    def __len__(self):
+        return len(self.status)
+
+    def __getitem__(self, idx):
+        return JDRStatusAXI(
+            data_rd=self.data[idx], status=self.status[idx], data_width=self.data_width
+        )
+
+    @property
+    def ok(self):
+        """True when every read came back JTAG_AXI_OKAY."""
+        return self.status.count(JTAG_AXI_OKAY_CODE) == len(self.status)
+
+    def failed(self):
+        """Indexes of the reads that did not come back JTAG_AXI_OKAY."""
+        return [
+            idx for idx, code in enumerate(self.status) if code != JTAG_AXI_OKAY_CODE
+        ]
+
+    def tobytes(self):
+        """Data words as a little endian byte string."""
+        bus_bytes = self.data_width // 8
+        typecode = WORD_TYPECODES.get(bus_bytes)
+        if typecode is None:
+            return b"".join(word.to_bytes(bus_bytes, "little") for word in self.data)
+        words = array(typecode, self.data)
+        if sys.byteorder != "little":
+            words.byteswap()
+        return words.tobytes()
+
+    def to_numpy(self):
+        """Structured array with address, data and status fields."""
+        if np is None:
+            raise ImportError("[JTAG_to_AXI] NumPy is required for to_numpy()")
+        count = len(self)
+        dtype = np.uint64 if self.data_width <= 64 else object
+        out = np.zeros(
+            count, dtype=[("address", np.uint64), ("data", dtype), ("status", np.uint8)]
+        )
+        out["address"] = self.address + (np.arange(count, dtype=np.uint64) * self.stride)
+        out["data"] = np.asarray(self.data, dtype=dtype)
+        out["status"] = np.frombuffer(self.status, dtype=np.uint8)
+        return out
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_cache.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import json
+import os
+
+
+def cache_dir():
+    """Return the folder used to store the jtag_axi per-board cache files."""
+    return os.environ.get(
+        "JTAG_AXI_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "jtag_axi")
+    )
+
+
+def _cache_file(name):
+    return os.path.join(cache_dir(), f"{name}.json")
+
+
+def cache_load(name, key, default=None):
+    """Return the entry stored under key in the cache file name."""
+    try:
+        with open(_cache_file(name), "r") as fh:
+            return json.load(fh).get(key, default)
+    except (OSError, ValueError):
+        return default
+
+
+def cache_store(name, key, value):
+    """Store value under key in the cache file name (atomic replace)."""
+    path = _cache_file(name)
+    try:
+        with open(path, "r") as fh:
+            entries = json.load(fh)
+    except (OSError, ValueError):
+        entries = {}
+    entries[key] = value
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as fh:
+        json.dump(entries, fh, indent=2, sort_keys=True)
+    os.replace(tmp, path)
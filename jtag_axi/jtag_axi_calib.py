@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_calib.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import random
+import logging
+from .jtag_base import InstJTAG
+from .jtag_axi_cache import cache_load, cache_store
+
+# TCK frequencies swept during calibration (Hz), FTDI H-series tops at 30 MHz
+DEFAULT_FREQS = (1e6, 2e6, 3e6, 5e6, 6e6, 7.5e6, 10e6, 15e6, 20e6, 30e6)
+BYPASS_PATTERN_LEN = 64
+
+log = logging.getLogger(__name__)
+
+
+def board_key(jtag, idcode):
+    """Cache key of a board: adapter URL plus the IDCODE behind it."""
+    return f"{jtag.device}:{idcode:#010x}"
+
+
+def _check_idcode(jtag, idcode):
+    return jtag._shift_jdr(InstJTAG.IDCODE, 0) == idcode
+
+
+def _check_bypass(jtag):
+    # BYPASS delays TDI by a single TCK, so TDO must be the pattern shifted by 1
+    pattern = random.getrandbits(BYPASS_PATTERN_LEN)
+    tdo = jtag._shift_jdr(InstJTAG.BYPASS, pattern, length=BYPASS_PATTERN_LEN + 1)
+    return (tdo >> 1) == pattern
+
+
+def _check_userdata(jtag):
+    # USERDATA captures the last updated value, so each shift returns the previous
+    mask = (1 << jtag.userdata_width) - 1
+    first = random.getrandbits(jtag.userdata_width)
+    second = first ^ mask
+    jtag._shift_jdr(InstJTAG.USERDATA, first)
+    return jtag._shift_jdr(InstJTAG.USERDATA, second) == first
+
+
+def check_scan_integrity(jtag, idcode, iterations=8, userdata=True):
+    """Run IDCODE, BYPASS and USERDATA read-back checks at the current TCK."""
+    for _ in range(iterations):
+        if not _check_idcode(jtag, idcode):
+            return False
+        if not _check_bypass(jtag):
+            return False
+        if userdata and not _check_userdata(jtag):
+            return False
+    return True
+
+
+def _reset_tap(jtag):
+    # A failed step leaves the TAP in any state, possibly with a corrupted IR
+    # loaded, so nothing is shifted before it is reset. Those scans may also
+    # have updated any DR, the AXI shadows cannot be trusted anymore.
+    jtag.reset()
+    jtag.addr_axi_jdr = None
+    jtag.data_write_axi_jdr = None
+    jtag.ctrl_axi_jdr = None
+    jtag.wstrb_axi_jdr = None
+
+
+def calibrate_freq(
+    jtag,
+    freqs=DEFAULT_FREQS,
+    margin: float = 0.2,
+    iterations: int = 8,
+    userdata: bool = True,
+    cache: bool = True,
+):
+    """Find the highest reliable TCK frequency and program it on the adapter.
+
+    Frequencies are swept in ascending order until the first one that fails
+    the scan integrity checks, the highest passing frequency is then derated
+    by margin. The result is cached per board unless cache is False. After
+    a failing step the TAP is reset at the lowest frequency before USERDATA
+    is restored.
+    """
+    freqs = sorted(freqs)
+    jtag.set_frequency(freqs[0])
+    idcode = jtag._shift_jdr(InstJTAG.IDCODE, 0)
+    key = board_key(jtag, idcode)
+
+    if cache:
+        entry = cache_load("freq", key)
+        if entry is not None:
+            freq = jtag.set_frequency(entry["freq"])
+            if check_scan_integrity(jtag, idcode, iterations=1, userdata=False):
+                log.debug("Using cached TCK of %.3f MHz", freq / 1e6)
+                return freq
+            jtag.set_frequency(freqs[0])
+            _reset_tap(jtag)
+
+    # Keep the value driven to the design intact across the USERDATA checks
+    userdata_saved = jtag._get_jdr(InstJTAG.USERDATA) if userdata else None
+
+    max_ok = None
+    failed = False
+    for freq in freqs:
+        actual = jtag.set_frequency(freq)
+        if not check_scan_integrity(jtag, idcode, iterations, userdata):
+            log.debug("Scan integrity failed at %.3f MHz", actual / 1e6)
+            failed = True
+            break
+        max_ok = actual
+
+    jtag.set_frequency(freqs[0])
+    if failed:
+        _reset_tap(jtag)
+    if userdata_saved is not None:
+        jtag._shift_jdr(InstJTAG.USERDATA, userdata_saved)
+        jtag.userdata_jdr = userdata_saved
+
+    if max_ok is None:
+        raise RuntimeError(
+            f"[JTAG_to_AXI] Scan integrity failed at the lowest TCK of {freqs[0]} Hz"
+        )
+
+    freq = jtag.set_frequency(max(freqs[0], max_ok * (1 - margin)))
+    log.debug("Max. reliable TCK %.3f MHz, using %.3f MHz", max_ok / 1e6, freq / 1e6)
+    if cache:
+        cache_store("freq", key, {"freq": freq, "max_ok": max_ok})
+    return freq
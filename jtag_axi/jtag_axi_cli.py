@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_cli.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import time
+import random
+import shlex
+import logging
+import argparse
+from .jtag_base import JTAGToAXIStatus, TxnType, enable_logging
+from .jtag_axi_daemon import OP, OP_READ, OP_WRITE
+from .jtag_axi_journal import JOURNAL_CHUNK, JOURNAL_VERIFY, journaled_load, resume_load
+from .jtag_axi_transport import open as open_transport
+
+# Ops queued before a pipelined batch is shifted in batch mode
+CLI_BATCH_OPS = 256
+
+
+def _int(text):
+    return int(text, 0)
+
+
+def _address(text):
+    # host:port for TCP, anything else is a Unix socket path
+    host, sep, port = text.rpartition(":")
+    if sep and port.isdigit():
+        return (host or "127.0.0.1", int(port))
+    return text
+
+
+def connect(args):
+    """Open the driver selected by the command line options."""
+    if args.bridge:
+        from .jtag_axi_daemon import BridgeClient
+
+        return BridgeClient(_address(args.bridge))
+    profile = {
+        "addr_width": args.addr_width,
+        "data_width": args.data_width,
+        "async_fifo_depth": args.fifo_depth,
+    }
+    return open_transport(
+        args.device,
+        freq=args.freq,
+        calibrate=args.calibrate,
+        discover=args.discover,
+        idle_wait=args.idle_wait,
+        **profile,
+    )
+
+
+class Session:
+    """Runs read/write ops as pipelined batches, reads and writes are never
+    merged in the same batch as AXI does not order them between channels."""
+
+    def __init__(self, jtag, out=None):
+        self.jtag = jtag
+        self.bus_bytes = jtag.data_width // 8
+        self.out = out or sys.stdout
+        self.errors = 0
+        self._txn_type = None
+        self._ops = []
+
+    def queue(self, txn_type, address, data=0, wstrb=None, report=None):
+        """Queue an op, report(address, status_axi) is called once it ran."""
+        if txn_type is not self._txn_type or len(self._ops) >= CLI_BATCH_OPS:
+            self.flush()
+        self._txn_type = txn_type
+        if wstrb is None:
+            wstrb = (1 << self.bus_bytes) - 1
+        self._ops.append((address, data, wstrb, report))
+
+    def flush(self):
+        ops, self._ops = self._ops, []
+        if not ops:
+            return
+        if self._txn_type is TxnType.AXI_READ:
+            results = self.jtag.read_axi_batch([op[0] for op in ops])
+        else:
+            results = self.jtag.write_axi_batch([op[:3] for op in ops])
+        for (address, _, _, report), status_axi in zip(ops, results):
+            failed = status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY
+            if failed:
+                self.errors += 1
+            if report is not None:
+                report(address, status_axi)
+            elif failed:
+                self._print_error(address, status_axi)
+
+    def _print_error(self, address, status_axi):
+        print(f"{address:#010x}: {status_axi.status.name}", file=sys.stderr)
+
+    def _print_word(self, address, status_axi):
+        if status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+            self._print_error(address, status_axi)
+            return
+        digits = 2 * self.bus_bytes
+        print(f"{address:#010x}: {status_axi.data_rd:#0{digits + 2}x}", file=self.out)
+
+    # Commands
+    def read(self, address, count=1):
+        for idx in range(count):
+            self.queue(
+                TxnType.AXI_READ, address + idx * self.bus_bytes, report=self._print_word
+            )
+
+    def write(self, address, *values):
+        for idx, value in enumerate(values):
+            self.queue(TxnType.AXI_WRITE, address + idx * self.bus_bytes, value)
+
+    def fill(self, address, length, value):
+        for offset in range(0, length, self.bus_bytes):
+            self.queue(TxnType.AXI_WRITE, address + offset, value)
+
+    def load(self, address, data):
+        bus = self.bus_bytes
+        for offset in range(0, len(data), bus):
+            chunk = data[offset : offset + bus]
+            self.queue(
+                TxnType.AXI_WRITE,
+                address + offset,
+                int.from_bytes(chunk, "little"),
+                (1 << len(chunk)) - 1,
+            )
+
+    def dump(self, address, length, fh):
+        def report(word_address, status_axi):
+            if status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+                # Keep the file offsets, the failed word reads as zeros
+                self._print_error(word_address, status_axi)
+            data = status_axi.data_rd.to_bytes(self.bus_bytes, "little")
+            fh.write(data[: address + length - word_address])
+
+        for offset in range(0, length, self.bus_bytes):
+            self.queue(TxnType.AXI_READ, address + offset, report=report)
+
+    def wait(self, address, mask, value, timeout=1.0):
+        self.flush()
+        if not hasattr(self.jtag, "wait_for"):
+            raise ValueError("[JTAG_to_AXI] wait is not supported by this connection")
+        self.jtag.wait_for(address, mask, value, timeout=timeout)
+
+    def run_line(self, line):
+        """Run a text batch line: read/write/fill/load/dump/wait <args>."""
+        words = shlex.split(line, comments=True)
+        if not words:
+            return
+        cmd, args = words[0], words[1:]
+        if cmd == "read":
+            self.read(*(_int(arg) for arg in args))
+        elif cmd == "write":
+            self.write(*(_int(arg) for arg in args))
+        elif cmd == "fill":
+            self.fill(*(_int(arg) for arg in args))
+        elif cmd == "load":
+            with open(args[1], "rb") as fh:
+                self.load(_int(args[0]), fh.read())
+        elif cmd == "dump":
+            with open(args[2], "wb") as fh:
+                self.dump(_int(args[0]), _int(args[1]), fh)
+                self.flush()
+        elif cmd == "wait":
+            self.wait(*(_int(arg) for arg in args[:3]), *(float(a) for a in args[3:]))
+        else:
+            raise ValueError(f"[JTAG_to_AXI] Unknown batch command {cmd}")
+
+    def run_binary(self, fh, out):
+        """Run OP records (same encoding as the bridge daemon requests, the
+        size field is ignored as full bus words are moved), writes a status
+        byte plus the bus bytes read per op to out."""
+
+        def report(address, status_axi):
+            out.write(bytes((status_axi.status.value,)))
+            out.write(status_axi.data_rd.to_bytes(self.bus_bytes, "little"))
+
+        while True:
+            header = fh.read(OP.size)
+            if len(header) < OP.size:
+                break
+            opcode, size, wstrb, address = OP.unpack(header)
+            if opcode == OP_WRITE:
+                data = int.from_bytes(fh.read(self.bus_bytes), "little")
+                self.queue(TxnType.AXI_WRITE, address, data, wstrb, report)
+            elif opcode == OP_READ:
+                self.queue(TxnType.AXI_READ, address, report=report)
+            else:
+                raise ValueError(f"[JTAG_to_AXI] Unknown batch opcode {opcode}")
+        self.flush()
+
+
+def _bench(jtag, address, words):
+    bus = jtag.data_width // 8
+    data = [random.getrandbits(8 * bus) for _ in range(words)]
+    addresses = [address + idx * bus for idx in range(words)]
+    start = time.perf_counter()
+    jtag.write_axi_batch(list(zip(addresses, data)))
+    write_s = time.perf_counter() - start
+    start = time.perf_counter()
+    results = jtag.read_axi_batch(addresses)
+    read_s = time.perf_counter() - start
+    errors = sum(1 for got, exp in zip(results, data) if got.data_rd != exp)
+    for name, seconds in (("write", write_s), ("read", read_s)):
+        print(
+            f"{name}: {words} words in {seconds:.3f}s, "
+            f"{words / seconds:.0f} txn/s, {words * bus / seconds / 1024:.1f} KiB/s"
+        )
+    return 1 if errors else 0
+
+
+def _print_load(report):
+    print(
+        f"load: {report.written} bytes written, {report.skipped} already done"
+        f" ({report.verified} verified) in {report.seconds:.3f}s"
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="jtag-axi", description="JTAG to AXI bridge")
+    parser.add_argument(
+        "--device", default="ftdi://ftdi:2232/1", help="Transport URL (ftdi://, virtual://, ..)"
+    )
+    parser.add_argument("--bridge", help="Bridge daemon, host:port or Unix socket path")
+    parser.add_argument("--freq", type=float, default=1e6)
+    parser.add_argument("--addr-width", type=int, default=32)
+    parser.add_argument("--data-width", type=int, default=32)
+    parser.add_argument("--fifo-depth", type=int, default=4)
+    parser.add_argument("--discover", action="store_true", help="Probe the design profile")
+    parser.add_argument("--calibrate", action="store_true", help="Calibrate TCK")
+    parser.add_argument("--idle-wait", action="store_true")
+    parser.add_argument("-v", "--verbose", action="count", default=0)
+    sub = parser.add_subparsers(dest="cmd")
+    sub.required = True
+
+    cmd = sub.add_parser("read", help="Read words")
+    cmd.add_argument("address", type=_int)
+    cmd.add_argument("count", type=_int, nargs="?", default=1)
+    cmd = sub.add_parser("write", help="Write consecutive words")
+    cmd.add_argument("address", type=_int)
+    cmd.add_argument("values", type=_int, nargs="+")
+    cmd = sub.add_parser("dump", help="Dump memory to a file (hex to stdout if none)")
+    cmd.add_argument("address", type=_int)
+    cmd.add_argument("length", type=_int)
+    cmd.add_argument("-o", "--output")
+    cmd = sub.add_parser("load", help="Load a binary file into memory")
+    cmd.add_argument("address", type=_int)
+    cmd.add_argument("file")
+    cmd.add_argument("--journal", help="Journal completed chunks, see resume")
+    cmd.add_argument("--chunk", type=_int, default=JOURNAL_CHUNK)
+    cmd = sub.add_parser("resume", help="Carry on a journaled load")
+    cmd.add_argument("journal")
+    cmd.add_argument("--file", help="Image to load (the one in the journal by default)")
+    cmd.add_argument("--verify", type=_int, default=JOURNAL_VERIFY)
+    cmd = sub.add_parser("sample", help="Sample addresses to a file (.npy or columns)")
+    cmd.add_argument("addresses", type=_int, nargs="+")
+    cmd.add_argument("-o", "--output", required=True)
+    cmd.add_argument("--duration", type=float, default=1.0)
+    cmd.add_argument("--period", type=float, help="Seconds between samples")
+    cmd = sub.add_parser("fill", help="Fill memory with a word")
+    cmd.add_argument("address", type=_int)
+    cmd.add_argument("length", type=_int)
+    cmd.add_argument("value", type=_int)
+    cmd = sub.add_parser("bench", help="Write/read throughput")
+    cmd.add_argument("address", type=_int, nargs="?", default=0)
+    cmd.add_argument("--words", type=_int, default=4096)
+    cmd = sub.add_parser("batch", help="Run a command file or stdin in one session")
+    cmd.add_argument("file", nargs="?", default="-")
+    cmd.add_argument("--binary", action="store_true", help="OP records instead of text")
+    cmd = sub.add_parser("serve", help="Share the adapter through a bridge daemon")
+    cmd.add_argument("--listen", default="127.0.0.1:4444")
+    cmd = sub.add_parser("gdb", help="GDB remote serial protocol memory server")
+    cmd.add_argument("--port", type=int, default=3333)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.verbose:
+        enable_logging(logging.DEBUG if args.verbose > 1 else logging.INFO)
+    try:
+        return _run(args)
+    except _errors() as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+
+def _errors():
+    # Errors reported as a one-line message, the pyftdi cable errors only
+    # when the FTDI transport was actually loaded
+    errors = (ValueError, RuntimeError, TimeoutError, OSError)
+    if "pyftdi" in sys.modules:
+        from pyftdi.jtag import JtagError
+        from pyftdi.usbtools import UsbToolsError
+
+        errors += (JtagError, UsbToolsError)
+    return errors
+
+
+def _batch(session, fh, binary):
+    if binary:
+        session.run_binary(fh, sys.stdout.buffer)
+    else:
+        for line in fh:
+            session.run_line(line)
+
+
+def _run(args):
+    jtag = connect(args)
+    session = Session(jtag)
+    if args.cmd == "read":
+        session.read(args.address, args.count)
+    elif args.cmd == "write":
+        session.write(args.address, *args.values)
+    elif args.cmd == "fill":
+        session.fill(args.address, args.length, args.value)
+    elif args.cmd == "load":
+        with open(args.file, "rb") as fh:
+            data = fh.read()
+        if args.journal:
+            report = journaled_load(
+                jtag,
+                args.address,
+                data,
+                args.journal,
+                chunk=args.chunk,
+                source=os.path.abspath(args.file),
+            )
+            _print_load(report)
+        else:
+            session.load(args.address, data)
+    elif args.cmd == "resume":
+        data = None
+        if args.file:
+            with open(args.file, "rb") as fh:
+                data = fh.read()
+        _print_load(resume_load(jtag, args.journal, data, verify=args.verify))
+    elif args.cmd == "dump":
+        if args.output:
+            with open(args.output, "wb") as fh:
+                session.dump(args.address, args.length, fh)
+                session.flush()
+        else:
+            session.read(args.address, -(-args.length // session.bus_bytes))
+    elif args.cmd == "sample":
+        from .jtag_axi_sampler import Sampler
+
+        report = Sampler(jtag, args.addresses, args.output, period=args.period).run(
+            duration=args.duration
+        )
+        print(
+            f"sample: {report.samples} samples in {report.seconds:.3f}s,"
+            f" {report.rate:.0f} samples/s, {report.dropped} dropped"
+            f" in {len(report.intervals)} intervals"
+        )
+    elif args.cmd == "bench":
+        return _bench(jtag, args.address, args.words)
+    elif args.cmd == "batch":
+        # Lines are parsed as they are read, ops queue into pipelined batches
+        if args.file == "-":
+            _batch(session, sys.stdin.buffer if args.binary else sys.stdin, args.binary)
+        else:
+            with open(args.file, "rb" if args.binary else "r") as fh:
+                _batch(session, fh, args.binary)
+    elif args.cmd == "serve":
+        from .jtag_axi_daemon import BridgeDaemon
+
+        BridgeDaemon(jtag, address=_address(args.listen)).serve_forever()
+    elif args.cmd == "gdb":
+        from .jtag_axi_gdb import GdbServer
+
+        GdbServer(jtag, port=args.port).serve_forever()
+    session.flush()
+    return 1 if session.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_daemon.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import socket
+import struct
+import logging
+import threading
+from collections import deque
+from .jtag_base import JDRStatusAXI, TxnType
+
+log = logging.getLogger(__name__)
+
+# Wire protocol, all fields little endian:
+#   server hello: magic, version, addr_width, data_width, async_fifo_depth
+#   request:      FRAME(body length, request id, op count) + ops
+#                 op = OP(opcode, size, wstrb, address) + bus bytes of data
+#                 (writes only)
+#   reply:        FRAME(body length, request id, op count) + per op the
+#                 JTAGToAXIStatus value (STATUS_REJECTED if the request was
+#                 refused, STATUS_FAILED if its batch failed on the cable
+#                 before the op completed)
+#                 and the bus bytes read (zeros for writes)
+DAEMON_MAGIC = b"JTAX"
+DAEMON_VERSION = 1
+HELLO = struct.Struct("<4sBHHH")
+FRAME = struct.Struct("<IIH")
+OP = struct.Struct("<BBIQ")
+OP_READ = TxnType.AXI_READ.value
+OP_WRITE = TxnType.AXI_WRITE.value
+STATUS_REJECTED = 0xFF
+STATUS_FAILED = 0xFE
+MAX_FRAME_OPS = 0xFFFF
+
+
+def _recv_exact(sock, length: int):
+    data = bytearray()
+    while len(data) < length:
+        chunk = sock.recv(length - len(data))
+        if not chunk:
+            raise ConnectionError("[JTAG_to_AXI] Bridge connection closed")
+        data += chunk
+    return bytes(data)
+
+
+def _socket_for(address):
+    # A str is a Unix socket path, anything else a (host, port) pair
+    if isinstance(address, str):
+        return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+class _Request:
+    def __init__(self, client, request_id, txns, rejected=False):
+        self.client = client
+        self.request_id = request_id
+        self.txns = txns
+        self.results = [None] * len(txns)
+        self.next = 0
+        self.done = 0
+        self.rejected = rejected
+
+
+class _Client:
+    def __init__(self, sock, peer):
+        self.sock = sock
+        self.peer = peer
+        self.requests = deque()
+        self.send_lock = threading.Lock()
+
+
+class BridgeDaemon:
+    """Owns a host driver and shares it with local clients.
+
+    Each client request carries a batch of AXI ops. The scheduler takes up
+    to quantum ops from every client with pending work in round robin order
+    and runs them as one pipelined batch on the driver, so concurrent
+    clients share the AFIFO pipeline instead of queueing whole scripts.
+    """
+
+    def __init__(self, jtag, address=("127.0.0.1", 4444), quantum: int = None):
+        self.jtag = jtag
+        self.address = address
+        self.quantum = quantum or (4 * jtag.async_fifo_depth)
+        self.bus_bytes = jtag.data_width // 8
+        self.batches = 0
+        self._clients = []
+        self._turn = 0
+        self._cond = threading.Condition()
+        self._running = False
+        if isinstance(address, str) and os.path.exists(address):
+            os.unlink(address)
+        self.sock = _socket_for(address)
+        if not isinstance(address, str):
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(address)
+        self.sock.listen(8)
+        self.address = self.sock.getsockname()
+
+    def serve_forever(self):
+        """Accept clients in the background and schedule their batches here
+        until close()."""
+        self._running = True
+        threading.Thread(target=self._accept, daemon=True).start()
+        while self._running:
+            with self._cond:
+                picked = self._pick()
+                if not picked:
+                    self._cond.wait(0.1)
+                    continue
+            self._run(picked)
+
+    def close(self):
+        self._running = False
+        self.sock.close()
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
+        with self._cond:
+            for client in self._clients:
+                client.sock.close()
+            self._cond.notify_all()
+
+    def _accept(self):
+        while self._running:
+            try:
+                sock, peer = self.sock.accept()
+            except OSError:
+                return
+            client = _Client(sock, peer)
+            sock.sendall(
+                HELLO.pack(
+                    DAEMON_MAGIC,
+                    DAEMON_VERSION,
+                    self.jtag.addr_width,
+                    self.jtag.data_width,
+                    self.jtag.async_fifo_depth,
+                )
+            )
+            with self._cond:
+                self._clients.append(client)
+            log.info("Bridge client connected: %s", peer or "unix")
+            threading.Thread(target=self._reader, args=(client,), daemon=True).start()
+
+    def _reader(self, client):
+        try:
+            while self._running:
+                length, request_id, count = FRAME.unpack(
+                    _recv_exact(client.sock, FRAME.size)
+                )
+                body = _recv_exact(client.sock, length)
+                request = self._parse(client, request_id, count, body)
+                if request.rejected or not request.txns:
+                    self._reply(request)
+                    continue
+                with self._cond:
+                    client.requests.append(request)
+                    self._cond.notify()
+        except (ConnectionError, OSError, struct.error):
+            pass
+        with self._cond:
+            if client in self._clients:
+                self._clients.remove(client)
+        client.sock.close()
+        log.info("Bridge client disconnected: %s", client.peer or "unix")
+
+    def _parse(self, client, request_id, count, body):
+        txns = []
+        offset = 0
+        try:
+            for _ in range(count):
+                opcode, size, wstrb, address = OP.unpack_from(body, offset)
+                offset += OP.size
+                data = 0
+                if opcode == OP_WRITE:
+                    data = int.from_bytes(body[offset : offset + self.bus_bytes], "little")
+                    offset += self.bus_bytes
+                elif opcode != OP_READ:
+                    raise ValueError(f"unknown opcode {opcode}")
+                # Strobes are bus lanes, only the ones of the transfer may be set
+                lanes = ((1 << size) - 1) << (address % self.bus_bytes & -size)
+                if (
+                    address >= 2**self.jtag.addr_width
+                    or not 0 < size <= self.bus_bytes
+                    or size & (size - 1)
+                    or wstrb & ~lanes
+                ):
+                    raise ValueError(
+                        f"invalid op @ {hex(address)} / size {size} / wstrb {hex(wstrb)}"
+                    )
+                txns.append((TxnType(opcode), address, data, size, wstrb))
+        except (ValueError, struct.error) as exc:
+            log.warning("Bridge request %d rejected: %s", request_id, exc)
+            return _Request(client, request_id, [None] * count, rejected=True)
+        return _Request(client, request_id, txns)
+
+    def _pick(self):
+        # Round robin, up to quantum ops per client, starting one client
+        # further every round
+        picked = []
+        clients = self._clients[self._turn :] + self._clients[: self._turn]
+        self._turn = (self._turn + 1) % max(1, len(self._clients))
+        for client in clients:
+            budget = self.quantum
+            for request in client.requests:
+                if budget <= 0:
+                    break
+                take = min(budget, len(request.txns) - request.next)
+                for idx in range(request.next, request.next + take):
+                    picked.append((request, idx))
+                request.next += take
+                budget -= take
+            while client.requests and client.requests[0].next == len(
+                client.requests[0].txns
+            ):
+                client.requests.popleft()
+        return picked
+
+    def _run(self, picked):
+        txns = [request.txns[idx] for request, idx in picked]
+        results = []
+        try:
+            # Responses come back chunk by chunk, the ops resolved before an
+            # error completed on the bus and keep their status
+            for value in self.jtag._axi_batch_raw(txns):
+                results.append(
+                    JDRStatusAXI.from_jdr(value, data_width=self.jtag.data_width)
+                )
+        except Exception as exc:
+            # Any transport error (FTDI, XVC, OpenOCD...) only fails the rest
+            # of this batch, the scheduler keeps serving the clients
+            log.warning(
+                "Bridge batch failed after %d/%d ops: %s", len(results), len(txns), exc
+            )
+            results += [None] * (len(txns) - len(results))
+            self._recover()
+        self.batches += 1
+        for (request, idx), status_axi in zip(picked, results):
+            request.results[idx] = status_axi
+            request.done += 1
+            if request.done == len(request.txns):
+                self._reply(request)
+
+    def _recover(self):
+        # The TAP may be left in any state (and the FTDI pipeline failed),
+        # responses left in the AFIFO would be taken by the next batch and
+        # the shadows may hold values that never reached the design
+        self.jtag.addr_axi_jdr = None
+        self.jtag.data_write_axi_jdr = None
+        self.jtag.wstrb_axi_jdr = None
+        try:
+            self.jtag.reset()
+            self.jtag._drain_responses()
+        except Exception as exc:
+            log.warning("Bridge could not drain the AXI responses: %s", exc)
+
+    def _reply(self, request):
+        body = bytearray()
+        for status_axi in request.results:
+            if request.rejected:
+                body.append(STATUS_REJECTED)
+                body += bytes(self.bus_bytes)
+            elif status_axi is None:
+                body.append(STATUS_FAILED)
+                body += bytes(self.bus_bytes)
+            else:
+                body.append(status_axi.status.value)
+                body += status_axi.data_rd.to_bytes(self.bus_bytes, "little")
+        try:
+            with request.client.send_lock:
+                request.client.sock.sendall(
+                    FRAME.pack(len(body), request.request_id, len(request.results))
+                    + body
+                )
+        except OSError:
+            pass
+
+
+class BridgeClient:
+    """Client of a BridgeDaemon with the AXI API of the host drivers
+    (read_axi/write_axi and their _batch variants), so RegisterMap, Watcher
+    or GdbServer can run on top of it."""
+
+    def __init__(self, address=("127.0.0.1", 4444)):
+        self.sock = _socket_for(address)
+        self.sock.connect(address)
+        magic, version, addr_width, data_width, depth = HELLO.unpack(
+            _recv_exact(self.sock, HELLO.size)
+        )
+        if magic != DAEMON_MAGIC or version != DAEMON_VERSION:
+            raise ConnectionError("[JTAG_to_AXI] Not a jtag_axi bridge daemon")
+        self.addr_width = addr_width
+        self.data_width = data_width
+        self.async_fifo_depth = depth
+        self.bus_bytes = data_width // 8
+        self._request_id = 0
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def batch(self, txns):
+        """Run (TxnType, address, data, size, wstrb) txns, returns a
+        JDRStatusAXI per txn (in order)."""
+        results = []
+        for first in range(0, len(txns), MAX_FRAME_OPS):
+            results += self._frame(txns[first : first + MAX_FRAME_OPS])
+        return results
+
+    def _frame(self, txns):
+        body = bytearray()
+        for txn_type, address, data, size, wstrb in txns:
+            body += OP.pack(txn_type.value, size, wstrb, address)
+            if txn_type is TxnType.AXI_WRITE:
+                body += data.to_bytes(self.bus_bytes, "little")
+        self._request_id = (self._request_id + 1) & 0xFFFFFFFF
+        self.sock.sendall(FRAME.pack(len(body), self._request_id, len(txns)) + body)
+        length, request_id, count = FRAME.unpack(_recv_exact(self.sock, FRAME.size))
+        body = _recv_exact(self.sock, length)
+        results = []
+        step = 1 + self.bus_bytes
+        for offset in range(0, count * step, step):
+            if body[offset] == STATUS_REJECTED:
+                raise ValueError("[JTAG_to_AXI] Request rejected by the bridge daemon")
+            if body[offset] == STATUS_FAILED:
+                raise RuntimeError("[JTAG_to_AXI] Request failed on the bridge daemon")
+            data = int.from_bytes(body[offset + 1 : offset + step], "little")
+            results.append(
+                JDRStatusAXI(data_rd=data, status=body[offset], data_width=self.data_width)
+            )
+        return results
+
+    def read_axi(self, address, size=None):
+        return self.read_axi_batch([address], size)[0]
+
+    def write_axi(self, address, data, size=None, wstrb=None):
+        return self.write_axi_batch([(address, data)], size, wstrb)[0]
+
+    def read_axi_batch(self, addresses, size=None):
+        if size is None:
+            size = self.bus_bytes
+        return self.batch([(TxnType.AXI_READ, address, 0, size, 0) for address in addresses])
+
+    def write_axi_batch(self, writes, size=None, wstrb=None):
+        if size is None:
+            size = self.bus_bytes
+        if wstrb is None:
+            wstrb = (1 << size) - 1
+        txns = []
+        for write in writes:
+            txn_wstrb = write[2] if len(write) > 2 else wstrb
+            txns.append((TxnType.AXI_WRITE, write[0], write[1], size, txn_wstrb))
+        return self.batch(txns)
@@ -0,0 +1,762 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_driver.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import time
+import logging
+from abc import abstractmethod
+from .jtag_base import *
+from .jtag_axi_calib import calibrate_freq
+from .jtag_axi_profile import apply_discovered_profile
+from .jtag_axi_idle import IdleWait
+from .jtag_axi_bulk import BULK_DECODE_WORDS, AXIBlock
+
+log = logging.getLogger(__name__)
+
+
+class JtagToAXIDriver(BaseJtagToAXI):
+    """Host driver of the jtag_axi design, independent of the JTAG cable.
+
+    Everything is expressed as scan programs (see ScanOp) run by _execute().
+    A transport subclass only has to provide _open(), _shift_scans(),
+    reset() and set_frequency(), see JtagToAXIFTDI or VirtualJtagToAXI.
+    """
+
+    def __init__(
+        self,
+        device=None,
+        name: str = "JTAG to AXI IP",
+        freq: int = 1e6,
+        trst: bool = False,
+        debug: bool = False,
+        calibrate: bool = False,
+        lazy: bool = True,
+        discover: bool = False,
+        idle_wait: bool = False,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.device = device
+        self.freq = freq
+        self.debug = debug
+        if idle_wait:
+            self.idle_wait = IdleWait()
+        if debug:
+            enable_logging(logging.DEBUG)
+        self._open(device, freq, trst)
+
+        # Only IDCODE is read up front, the remaining shadow JDRs start unknown
+        # (None) so the first access always shifts them, unless lazy is False
+        # where they are all loaded through a merged scan batch.
+        self.idcode_jdr = self._shift_jdr(InstJTAG.IDCODE, 0)
+        self.ic_reset_jdr = None
+        self.addr_axi_jdr = None
+        self.data_write_axi_jdr = None
+        self.status_axi_jdr = None
+        self.ctrl_axi_jdr = None
+        self.wstrb_axi_jdr = None
+        self.usercode_jdr = None
+        self.userdata_jdr = None
+        if discover:
+            apply_discovered_profile(self)
+        if not lazy:
+            self._load_jdrs()
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("---- Init Device ----")
+            log.debug("Init device \t%s", device)
+            if freq >= 1e6:
+                log.debug("Frequency \t%.3f MHz", freq / 1e6)
+            elif freq >= 1e3:
+                log.debug("Frequency \t%.3f kHz", freq / 1e3)
+            else:
+                log.debug("Frequency \t%.3f Hz", freq)
+            log.debug("IDCODE    \t%#x", self.idcode_jdr)
+            log.debug("AXI Address width\t%d", self.addr_width)
+            log.debug("AXI Data width  \t%d", self.data_width)
+            log.debug("AFIFO Depth  \t%d", self.async_fifo_depth)
+            log.debug("IC RESET width  \t%d", self.ic_reset_width)
+            log.debug("USERDATA width  \t%d", self.userdata_width)
+
+        if calibrate:
+            calibrate_freq(self)
+
+    @abstractmethod
+    def _open(self, device, freq, trst):
+        """Open the cable selected by device."""
+
+    @abstractmethod
+    def set_frequency(self, freq):
+        """Change the TCK frequency, returns the actual frequency programmed."""
+
+    @abstractmethod
+    def reset(self):
+        """Reset the JTAG interface."""
+
+    @abstractmethod
+    def _shift_scans(self, scans):
+        """Shift a scan program, returns the TDO value of every ScanOp.DR."""
+
+    def _execute(self, scans):
+        """Run a scan program, returns the TDO value of every ScanOp.DR entry."""
+        self._count_scans(scans)
+        if self.recorder is None:
+            return self._shift_scans(scans)
+        timestamp = time.perf_counter()
+        tdo = self._shift_scans(scans)
+        self.recorder.record(timestamp, scans, tdo)
+        return tdo
+
+    def _submit(self, scans):
+        """Start a scan program behind the ones already submitted, returns a
+        ticket for _collect(). Transports without a pipeline (everything but
+        JtagToAXIFTDI) simply run it here."""
+        return self._execute(scans)
+
+    def _collect(self, ticket):
+        """TDO value of every ScanOp.DR entry of a _submit() program, tickets
+        have to be collected in submission order."""
+        return ticket
+
+    def _get_jdr(self, jdr: InstJTAG):
+        jdr_len = self.enc.dr_length[jdr]
+        jdr_value = self._execute([(ScanOp.IR, jdr), (ScanOp.DR, 0, jdr_len)])[0]
+        # Shift back the old value that we replaced with 0s
+        self._execute([(ScanOp.DR, jdr_value, jdr_len)])
+        return jdr_value
+
+    def _load_jdrs(self):
+        # All registers are read in one batch and the RW ones restored in a
+        # second one, instead of three scans with a round trip per register.
+        jdrs = list(JDR_SHADOWS.items())
+        scans = []
+        for jdr, _ in jdrs:
+            scans += [(ScanOp.IR, jdr), (ScanOp.DR, 0, self.enc.dr_length[jdr])]
+        values = self._execute(scans)
+        restore = []
+        for (jdr, attr), value in zip(jdrs, values):
+            setattr(self, attr, value)
+            if jdr is InstJTAG.CTRL_AXI_REG:
+                # Never restore START, it would dispatch a new AXI txn
+                value &= ~(1 << (self.enc.dr_length[jdr] - 1))
+            if jdr.value[2] is AccessMode.RW:
+                restore += [(ScanOp.IR, jdr), (ScanOp.DR, value, self.enc.dr_length[jdr])]
+        self._execute(restore)
+
+    def read_jdrs(self):
+        self._load_jdrs()
+
+        print(f"\n[JTAG_to_AXI] ---- Print JDRs ----")
+        print(f"[JTAG_to_AXI] IDCODE     \t{hex(self.idcode_jdr)}")
+        print(f"[JTAG_to_AXI] USERCODE   \t{hex(self.usercode_jdr)}")
+        print(f"[JTAG_to_AXI] IC_RESET   \t{hex(self.ic_reset_jdr)}")
+        print(f"[JTAG_to_AXI] ADDR_AXI   \t{hex(self.addr_axi_jdr)}")
+        print(f"[JTAG_to_AXI] DATA_AXI   \t{hex(self.data_write_axi_jdr)}")
+        print(f"[JTAG_to_AXI] CTRL_AXI   \t{hex(self.ctrl_axi_jdr)}")
+        print(f"[JTAG_to_AXI] WSTRB_AXI  \t{hex(self.wstrb_axi_jdr)}")
+        print(f"[JTAG_to_AXI] USERDATA   \t{hex(self.userdata_jdr)}")
+
+    def _shift_jdr(self, jdr: InstJTAG, val: int, length: int = None):
+        log.debug("Updating JDR: %s / Value: %d (%#x)", jdr.name, val, val)
+        if length is None:
+            length = self.enc.dr_length[jdr]
+        return self._execute([(ScanOp.IR, jdr), (ScanOp.DR, val, length)])[0]
+
+    def _shift_data_only(self, jdr: InstJTAG, val: int):
+        return self._execute([(ScanOp.DR, val, self.enc.dr_length[jdr])])[0]
+
+    def _update_current(self, info, current, new):
+        if current == new:
+            self.metrics.skips += 1
+            log.debug("Skipping %s shift due to value match", info)
+            return False
+        else:
+            return True
+
+    def _poll_status(self, address, txn_type, length=None):
+        """Scan STATUS_AXI_REG until the dispatched txn is no longer running,
+        idling in Run-Test/Idle in between when idle_wait is set. Only the
+        length LSBs are shifted, the Update-DR acks the response either way."""
+        wait = self.idle_wait
+        if length is None:
+            length = self.enc.dr_length[InstJTAG.STATUS_AXI_REG]
+        scans = [(ScanOp.IR, InstJTAG.STATUS_AXI_REG), (ScanOp.DR, 0, length)]
+        cycles = 0 if wait is None else wait.first_wait(address, txn_type)
+        start = self.metrics.tck_cycles
+        polls = 0
+        while True:
+            idle = [(ScanOp.IDLE, cycles)] if cycles else []
+            status_axi = JDRStatusAXI.from_jdr(
+                self._execute(idle + scans)[0], data_width=self.data_width
+            )
+            if status_axi.status != JTAGToAXIStatus.JTAG_RUNNING:
+                break
+            polls += 1
+            self.metrics.status_polls += 1
+            log.debug("Waiting TXN to complete: %s", status_axi.status)
+            if wait is not None:
+                cycles = wait.backoff(address, txn_type, polls)
+        if wait is not None:
+            # TCK cycles from the first poll up to the last STATUS Capture-DR
+            elapsed = self.metrics.tck_cycles - start - (length + 2)
+            wait.learn(address, txn_type, elapsed, polls)
+        return status_axi
+
+    def write_axi(self, address, data, size=None, wstrb=0xF):
+        start = time.perf_counter()
+        enc = self.enc
+        if size is None:
+            size = enc.bus_bytes
+
+        if address >= enc.addr_limit:
+            raise ValueError(
+                f"[JTAG_to_AXI] Address exceeds max of address width {self.addr_width}"
+            )
+
+        if data >= enc.data_limit:
+            raise ValueError(
+                f"[JTAG_to_AXI] Data write exceeds max of data width {self.data_width}"
+            )
+
+        if wstrb > enc.wstrb_max:
+            raise ValueError(
+                f"[JTAG_to_AXI] Write strobe exceeds max of {hex(enc.wstrb_max)}"
+            )
+
+        if size > enc.bus_bytes:
+            raise ValueError(
+                f"[JTAG_to_AXI] Number of bytes requested ({size}) is greater"
+                f" than max ({enc.bus_bytes})"
+            )
+
+        if self._update_current("address", self.addr_axi_jdr, address):
+            self._shift_jdr(InstJTAG.ADDR_AXI_REG, address)
+            self.addr_axi_jdr = address
+
+        if self._update_current("write data", self.data_write_axi_jdr, data):
+            self._shift_jdr(InstJTAG.DATA_W_AXI_REG, data)
+            self.data_write_axi_jdr = data
+
+        if self._update_current("write strobe", self.wstrb_axi_jdr, wstrb):
+            self._shift_jdr(InstJTAG.WSTRB_AXI_REG, wstrb)
+            self.wstrb_axi_jdr = wstrb
+
+        size_axi = self._convert_size(size)
+        empty_ctrl = enc.ctrl_idle
+        send_write = enc.ctrl_start[(TxnType.AXI_WRITE, size)]
+        current = JDRCtrlAXI.from_jdr(
+            self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl),
+            ocup_width=self.ocup_width,
+        )
+
+        # Check whether we have enough free slots to send
+        while current.fifo_ocup >= self.async_fifo_depth:
+            self.metrics.fifo_polls += 1
+            log.debug(
+                "Waiting ASYNC FIFO to have slots available, ocup: %d / %d",
+                current.fifo_ocup,
+                self.async_fifo_depth,
+            )
+            self._shift_jdr(InstJTAG.STATUS_AXI_REG, 0, length=4)
+            current = JDRCtrlAXI.from_jdr(
+                self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl),
+                ocup_width=self.ocup_width,
+            )
+
+        # Send the TXN
+        current = JDRCtrlAXI.from_jdr(
+            self._shift_jdr(InstJTAG.CTRL_AXI_REG, send_write),
+            ocup_width=self.ocup_width,
+        )
+        log.info(
+            "[WRITE] Addr = %#x / Data = %#x / Size = %s / WrStrb = %#x",
+            address,
+            data,
+            size_axi,
+            wstrb,
+        )
+        current = JDRCtrlAXI.from_jdr(
+            self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl),
+            ocup_width=self.ocup_width,
+        )
+        log.debug(
+            "Current AFIFO size: %d / %d", current.fifo_ocup, self.async_fifo_depth
+        )
+        status_axi = self._poll_status(
+            address, TxnType.AXI_WRITE, self._status_length(TxnType.AXI_WRITE)
+        )
+        self._txn_done("write", address, size, status_axi, time.perf_counter() - start)
+        return status_axi
+
+    def read_axi(self, address, size=None):
+        start = time.perf_counter()
+        enc = self.enc
+        if size is None:
+            size = enc.bus_bytes
+
+        if address >= enc.addr_limit:
+            raise ValueError(
+                f"[JTAG_to_AXI] Address exceeds max of address width {self.addr_width}"
+            )
+
+        if size > enc.bus_bytes:
+            raise ValueError(
+                f"[JTAG_to_AXI] Number of bytes requested ({size}) is greater"
+                f" than max ({enc.bus_bytes})"
+            )
+
+        if self._update_current("address", self.addr_axi_jdr, address):
+            self._shift_jdr(InstJTAG.ADDR_AXI_REG, address)
+            self.addr_axi_jdr = address
+
+        size_axi = self._convert_size(size)
+        empty_ctrl = enc.ctrl_idle
+        send_read = enc.ctrl_start[(TxnType.AXI_READ, size)]
+        current = JDRCtrlAXI.from_jdr(
+            self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl),
+            ocup_width=self.ocup_width,
+        )
+
+        # Check whether we have enough free slots to send
+        while current.fifo_ocup >= self.async_fifo_depth:
+            self.metrics.fifo_polls += 1
+            log.debug(
+                "Waiting ASYNC FIFO to have slots available, ocup: %d / %d",
+                current.fifo_ocup,
+                self.async_fifo_depth,
+            )
+            self._shift_jdr(InstJTAG.STATUS_AXI_REG, 0, length=4)
+            current = JDRCtrlAXI.from_jdr(
+                self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl),
+                ocup_width=self.ocup_width,
+            )
+
+        # Send the TXN
+        current = JDRCtrlAXI.from_jdr(
+            self._shift_jdr(InstJTAG.CTRL_AXI_REG, send_read),
+            ocup_width=self.ocup_width,
+        )
+        log.info("[READ] Addr = %#x / Size = %s", address, size_axi)
+        current = JDRCtrlAXI.from_jdr(
+            self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl),
+            ocup_width=self.ocup_width,
+        )
+        log.debug(
+            "Current AFIFO size: %d / %d", current.fifo_ocup, self.async_fifo_depth
+        )
+        status_axi = self._poll_status(
+            address,
+            TxnType.AXI_READ,
+            self._status_length(TxnType.AXI_READ, address, size),
+        )
+        self._txn_done("read", address, size, status_axi, time.perf_counter() - start)
+        return status_axi
+
+    def read_axi_batch(self, addresses, size=None):
+        """Pipelined reads, returns a JDRStatusAXI per address (in order)."""
+        if size is None:
+            size = self.data_width // 8
+        return self._axi_batch(
+            [(TxnType.AXI_READ, address, 0, size, 0) for address in addresses]
+        )
+
+    def write_axi_batch(self, writes, size=None, wstrb=None):
+        """Pipelined writes of (address, data) or (address, data, wstrb)
+        tuples, returns a JDRStatusAXI per write (in order)."""
+        if size is None:
+            size = self.data_width // 8
+        if wstrb is None:
+            wstrb = (1 << size) - 1
+        txns = []
+        for write in writes:
+            address, data = write[0], write[1]
+            txn_wstrb = write[2] if len(write) > 2 else wstrb
+            txns.append((TxnType.AXI_WRITE, address, data, size, txn_wstrb))
+        return self._axi_batch(txns)
+
+    def read_axi_block(self, address, count, size=None, stride=None):
+        """Pipelined reads of count words from address (stride bytes apart,
+        the bus width by default), returns them as a compact AXIBlock.
+
+        Chunks are submitted one ahead of the one being decoded, so the
+        range must be safe to read twice (memory, not FIFOs or
+        read-to-clear registers): a chunk that is still RUNNING when
+        decoded sends the following one again.
+        """
+        if size is None:
+            size = self.data_width // 8
+        if stride is None:
+            stride = self.data_width // 8
+        block = AXIBlock(address, stride, self.data_width)
+        # Only one decode block of txns exists at a time
+        for first in range(0, count, BULK_DECODE_WORDS):
+            txns = [
+                (TxnType.AXI_READ, address + (idx * stride), 0, size, 0)
+                for idx in range(first, min(count, first + BULK_DECODE_WORDS))
+            ]
+            block.extend(list(self._axi_batch_raw(txns, speculate=True)))
+        return block
+
+    def _axi_batch(self, txns):
+        return [
+            JDRStatusAXI.from_jdr(value, data_width=self.data_width)
+            for value in self._axi_batch_raw(txns)
+        ]
+
+    def _batch_scans(self, chunk):
+        # Dispatch of a chunk and its first STATUS scan per txn, returns
+        # (scans, STATUS length). A chunk fills the AFIFO, it has to be empty
+        # when the batch starts (checked on the CTRL TDO, the first one).
+        enc = self.enc
+        ctrl_start = enc.ctrl_start
+        ctrl_length = enc.dr_length[InstJTAG.CTRL_AXI_REG]
+        wstrb_length = enc.dr_length[InstJTAG.WSTRB_AXI_REG]
+        scans = [
+            (ScanOp.IR, InstJTAG.CTRL_AXI_REG),
+            (ScanOp.DR, enc.ctrl_idle, ctrl_length),
+        ]
+        for txn_type, address, data, size, wstrb in chunk:
+            if self._update_current("address", self.addr_axi_jdr, address):
+                scans += [
+                    (ScanOp.IR, InstJTAG.ADDR_AXI_REG),
+                    (ScanOp.DR, address, self.addr_width),
+                ]
+                self.addr_axi_jdr = address
+            if txn_type is TxnType.AXI_WRITE:
+                if self._update_current("write data", self.data_write_axi_jdr, data):
+                    scans += [
+                        (ScanOp.IR, InstJTAG.DATA_W_AXI_REG),
+                        (ScanOp.DR, data, self.data_width),
+                    ]
+                    self.data_write_axi_jdr = data
+                if self._update_current("write strobe", self.wstrb_axi_jdr, wstrb):
+                    scans += [
+                        (ScanOp.IR, InstJTAG.WSTRB_AXI_REG),
+                        (ScanOp.DR, wstrb, wstrb_length),
+                    ]
+                    self.wstrb_axi_jdr = wstrb
+            scans += [
+                (ScanOp.IR, InstJTAG.CTRL_AXI_REG),
+                (ScanOp.DR, ctrl_start[(txn_type, size)], ctrl_length),
+            ]
+        # START is sticky in CTRL, leave it cleared behind the batch
+        scans.append((ScanOp.DR, enc.ctrl_idle, ctrl_length))
+        length = max(
+            self._status_length(txn_type, address, size)
+            for txn_type, address, _, size, _ in chunk
+        )
+        if self.idle_wait is not None:
+            cycles = self.idle_wait.first_wait(chunk[0][1], chunk[0][0])
+            if cycles:
+                scans.append((ScanOp.IDLE, cycles))
+        scans.append((ScanOp.IR, InstJTAG.STATUS_AXI_REG))
+        scans += [(ScanOp.DR, 0, length)] * len(chunk)
+        return scans, length
+
+    def _axi_batch_raw(self, txns, speculate: bool = False):
+        """Dispatch up to async_fifo_depth txns per scan batch, each with its
+        own ADDR/DATA/WSTRB shifts (sampled by the design at dispatch), then
+        read STATUS once per txn in the same batch. Responses come back in
+        order, RUNNING reads do not ack anything and are simply repeated.
+        As with single txns, a response landing while a STATUS scan is being
+        shifted is lost, idle_wait keeps the first STATUS scans late enough.
+
+        With speculate, chunk N+1 is submitted before chunk N is decoded.
+        If N turns out to have RUNNING txns, N+1 already took some of their
+        responses: it is discarded, the AFIFO drained and everything from the
+        first unresolved txn of N is sent again, so only use it for txns
+        that can be repeated. Yields the raw STATUS_AXI_REG value of every
+        txn, in order."""
+        enc = self.enc
+        for txn_type, address, data, size, wstrb in txns:
+            if address >= enc.addr_limit:
+                raise ValueError(
+                    f"[JTAG_to_AXI] Address exceeds max of address width {self.addr_width}"
+                )
+            if size > enc.bus_bytes:
+                raise ValueError(
+                    f"[JTAG_to_AXI] Number of bytes requested ({size}) is greater"
+                    f" than max ({enc.bus_bytes})"
+                )
+            if data >= enc.data_limit:
+                raise ValueError(
+                    f"[JTAG_to_AXI] Data write exceeds max of data width {self.data_width}"
+                )
+            if (txn_type, size) not in enc.ctrl_start:
+                raise ValueError(f"No asize value found for {size} number of bytes")
+
+        depth = self.async_fifo_depth
+        first = 0
+        ahead = None
+        missed = False
+        while first < len(txns):
+            if ahead is None:
+                chunk = txns[first : first + depth]
+                scans, length = self._batch_scans(chunk)
+                ahead = (chunk, length, time.perf_counter(), self._submit(scans))
+            chunk, length, start, ticket = ahead
+            ahead = None
+            following = txns[first + len(chunk) : first + len(chunk) + depth]
+            if speculate and following and not missed:
+                scans, following_length = self._batch_scans(following)
+                ahead = (
+                    following,
+                    following_length,
+                    time.perf_counter(),
+                    self._submit(scans),
+                )
+            tdo = self._collect(ticket)
+            ocup = JDRCtrlAXI.from_jdr(tdo[0], ocup_width=self.ocup_width)
+            if ocup.fifo_ocup:
+                if ahead is not None:
+                    self._collect(ahead[3])
+                raise RuntimeError(
+                    f"[JTAG_to_AXI] Batch started with {ocup.fifo_ocup} txns"
+                    f" already in the AFIFO, responses cannot be matched"
+                )
+            tdo = tdo[-len(chunk) :]
+            pending = list(chunk)
+            statuses = []
+            polls = 0
+            missed = False
+            while True:
+                for value in tdo:
+                    code = value & 0xF
+                    if code == JTAG_RUNNING_CODE:
+                        self.metrics.status_polls += 1
+                        continue
+                    if code == JTAG_IDLE_CODE:
+                        if ahead is not None:
+                            self._collect(ahead[3])
+                        raise RuntimeError(
+                            f"[JTAG_to_AXI] AXI response lost in a batch, "
+                            f"{len(pending)} txns had no response"
+                        )
+                    statuses.append(value)
+                    pending.pop(0)
+                if not pending:
+                    break
+                if ahead is not None:
+                    # The next chunk was shifted behind this one and its
+                    # STATUS scans acked responses of the RUNNING txns
+                    self._collect(ahead[3])
+                    ahead = None
+                    self._drain_responses()
+                    missed = True
+                    log.debug(
+                        "Batch chunk at %#x still running, %d txns sent again",
+                        pending[0][1],
+                        len(pending),
+                    )
+                    break
+                polls += 1
+                scans = []
+                if self.idle_wait is not None:
+                    cycles = self.idle_wait.backoff(pending[0][1], pending[0][0], polls)
+                    if cycles:
+                        scans.append((ScanOp.IDLE, cycles))
+                scans.append((ScanOp.IR, InstJTAG.STATUS_AXI_REG))
+                scans += [(ScanOp.DR, 0, length)] * len(pending)
+                tdo = self._execute(scans)
+            self._observe_txns(chunk, statuses, time.perf_counter() - start)
+            first += len(statuses)
+            yield from statuses
+
+    def wait_for(
+        self,
+        address,
+        mask,
+        value,
+        timeout=1.0,
+        max_iterations=None,
+        size=None,
+        burst=16,
+    ):
+        """Read address until (data_rd & mask) == value, returns the number of
+        reads it took. data_rd is the raw bus word, as with read_axi.
+
+        The address is latched once, each read then costs a CTRL start and a
+        STATUS scan. Reads are shifted in bursts growing up to burst per scan
+        batch, and the Run-Test/Idle wait in front of every STATUS scan
+        adapts to how long the responses take. Raises TimeoutError after
+        timeout seconds (None to disable) or max_iterations reads.
+        """
+        start = time.perf_counter()
+        enc = self.enc
+        if size is None:
+            size = enc.bus_bytes
+        if address >= enc.addr_limit:
+            raise ValueError(
+                f"[JTAG_to_AXI] Address exceeds max of address width {self.addr_width}"
+            )
+        if size > enc.bus_bytes:
+            raise ValueError(
+                f"[JTAG_to_AXI] Number of bytes requested ({size}) is greater"
+                f" than max ({enc.bus_bytes})"
+            )
+        send_read = enc.ctrl_start.get((TxnType.AXI_READ, size))
+        if send_read is None:
+            raise ValueError(f"No asize value found for {size} number of bytes")
+        deadline = None if timeout is None else start + timeout
+        ctrl_length = enc.dr_length[InstJTAG.CTRL_AXI_REG]
+        length = self._status_length(TxnType.AXI_READ, address, size)
+
+        scans = []
+        if self._update_current("address", self.addr_axi_jdr, address):
+            scans += [
+                (ScanOp.IR, InstJTAG.ADDR_AXI_REG),
+                (ScanOp.DR, address, self.addr_width),
+            ]
+            self.addr_axi_jdr = address
+        pace = 0
+        if self.idle_wait is not None:
+            pace = self.idle_wait.first_wait(address, TxnType.AXI_READ)
+        iterations = 0
+        count = 1
+        found = None
+        while found is None:
+            for _ in range(count):
+                scans += [
+                    (ScanOp.IR, InstJTAG.CTRL_AXI_REG),
+                    (ScanOp.DR, send_read, ctrl_length),
+                ]
+                if pace:
+                    scans.append((ScanOp.IDLE, pace))
+                scans += [
+                    (ScanOp.IR, InstJTAG.STATUS_AXI_REG),
+                    (ScanOp.DR, 0, length),
+                ]
+            # TDO of the CTRL/STATUS pairs, the ADDR shift may lead the first
+            tdo = self._execute(scans)[-2 * count + 1 :: 2]
+            scans = []
+            running = False
+            for status_tdo in tdo:
+                status_axi = JDRStatusAXI.from_jdr(status_tdo, data_width=self.data_width)
+                if status_axi.status == JTAGToAXIStatus.JTAG_RUNNING:
+                    self.metrics.status_polls += 1
+                    running = True
+                    continue
+                if status_axi.status == JTAGToAXIStatus.JTAG_IDLE:
+                    continue
+                iterations += 1
+                if status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+                    found = status_axi
+                    break
+                if (status_axi.data_rd & mask) == value:
+                    found = status_axi
+                    break
+            if found is None:
+                if max_iterations is not None and iterations >= max_iterations:
+                    self._drain_responses()
+                    raise TimeoutError(
+                        f"[JTAG_to_AXI] wait_for({hex(address)}) not met after"
+                        f" {iterations} reads"
+                    )
+                if deadline is not None and time.perf_counter() > deadline:
+                    self._drain_responses()
+                    raise TimeoutError(
+                        f"[JTAG_to_AXI] wait_for({hex(address)}) timed out after"
+                        f" {iterations} reads"
+                    )
+                count = min(burst, count * 2)
+            if running:
+                pace = min(1 << 16, max(1, pace * 2))
+            else:
+                pace -= pace // 8
+        self._drain_responses()
+        self._txn_done("wait", address, size, found, time.perf_counter() - start)
+        if found.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+            raise RuntimeError(
+                f"[JTAG_to_AXI] wait_for({hex(address)}) read failed:"
+                f" {found.status.name}"
+            )
+        return iterations
+
+    def _drain_responses(self):
+        """Clear START and ack every pending response until STATUS is idle,
+        responses left behind would be matched to the following txns."""
+        scans = [
+            (ScanOp.IR, InstJTAG.CTRL_AXI_REG),
+            (ScanOp.DR, self.enc.ctrl_idle, self.enc.dr_length[InstJTAG.CTRL_AXI_REG]),
+            (ScanOp.IR, InstJTAG.STATUS_AXI_REG),
+        ]
+        scans += [(ScanOp.DR, 0, 4)] * (self.async_fifo_depth + 1)
+        while True:
+            tdo = self._execute(scans)[-(self.async_fifo_depth + 1) :]
+            if any(status & 0xF == JTAGToAXIStatus.JTAG_IDLE.value for status in tdo):
+                return
+            scans = [(ScanOp.IR, InstJTAG.STATUS_AXI_REG)]
+            scans += [(ScanOp.DR, 0, 4)] * (self.async_fifo_depth + 1)
+
+    def write_ic_reset(self, value):
+        if value >= 2**self.ic_reset_width:
+            raise ValueError(
+                f"[JTAG_to_AXI] Value to write on IC_RESET ({value}) is greater than max {2**self.ic_reset_width}"
+            )
+        log.debug("Writing %d in IC_RESET JDR", value)
+        self._shift_jdr(InstJTAG.IC_RESET, value)
+        self.ic_reset_jdr = value
+
+    def write_userdata(self, value):
+        if value >= 2**self.userdata_width:
+            raise ValueError(
+                f"[JTAG_to_AXI] Value to write on USERDATA ({value}) is greater than max {2**self.userdata_width}"
+            )
+        log.debug("Writing %d in USERDATA JDR", value)
+        self._shift_jdr(InstJTAG.USERDATA, value)
+        self.userdata_jdr = value
+
+    def stream_userdata(self, data, batch: int = 4096):
+        """Shift data (bytes or an iterable of words) through USERDATA.
+
+        Words are userdata_width bits wide, the IR is selected once and every
+        Update-DR goes straight to Select-DR/Capture-DR/Shift-DR, with up to
+        batch words per USB round trip. Batches are submitted one ahead of
+        the one being collected, so the next one is packed while the
+        previous one is shifted. Returns a StreamReport.
+        """
+        width = self.userdata_width
+        start = time.perf_counter()
+        scans = [(ScanOp.IR, InstJTAG.USERDATA)]
+        tdo, words, word = [], 0, None
+        ahead = None
+        for word in pack_words(data, width):
+            scans.append((ScanOp.DR, word, width))
+            words += 1
+            if len(scans) >= batch:
+                ticket = self._submit(scans)
+                if ahead is not None:
+                    tdo += self._collect(ahead)
+                ahead = ticket
+                scans = []
+        if scans:
+            ticket = self._submit(scans)
+            if ahead is not None:
+                tdo += self._collect(ahead)
+            ahead = ticket
+        if ahead is not None:
+            tdo += self._collect(ahead)
+        if word is not None:
+            self.userdata_jdr = word
+        seconds = time.perf_counter() - start
+        bits = words * width
+        report = StreamReport(words, bits, seconds, (bits / 8) / seconds, tdo)
+        log.debug(
+            "USERDATA stream: %d words in %.6f s (%.1f B/s)",
+            words,
+            seconds,
+            report.bandwidth,
+        )
+        return report
+
+    def write_fwd_userdata(self, value):
+        if value >= 2**self.userdata_width:
+            raise ValueError(
+                f"[JTAG_to_AXI] Value to write on USERDATA ({value}) is greater than max {2**self.userdata_width}"
+            )
+        log.debug("Writing %d in USERDATA JDR", value)
+        self.userdata_jdr = value
+        return self._shift_data_only(InstJTAG.USERDATA, value)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_gdb.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import socket
+import logging
+from .jtag_base import JTAGToAXIStatus
+
+log = logging.getLogger(__name__)
+
+GDB_PACKET_SIZE = 0x4000
+GDB_ESCAPE = 0x7D
+
+
+def gdb_checksum(data: bytes):
+    return sum(data) & 0xFF
+
+
+def gdb_packet(payload: bytes):
+    return b"$" + payload + b"#" + b"%02x" % gdb_checksum(payload)
+
+
+def gdb_unescape(data: bytes):
+    """Decode the binary payload of an X packet."""
+    out = bytearray()
+    escaped = False
+    for byte in data:
+        if escaped:
+            out.append(byte ^ 0x20)
+            escaped = False
+        elif byte == GDB_ESCAPE:
+            escaped = True
+        else:
+            out.append(byte)
+    return bytes(out)
+
+
+class AXIMemory:
+    """Byte addressed view of the AXI space with an optional line read cache.
+
+    Reads fetch only the bus words covering the request by default, as one
+    pipelined read batch. With cache=True the missing cache lines are
+    fetched instead and kept until a write touches them or invalidate() is
+    called, which suits plain memories but not MMIO. Writes are split into
+    bus words with their byte strobes (no read back needed for partial
+    words) and issued as one pipelined write batch.
+    """
+
+    def __init__(self, jtag, line_size: int = 64, cache: bool = False):
+        self.jtag = jtag
+        self.bus_bytes = jtag.data_width // 8
+        self.line_size = max(line_size, self.bus_bytes)
+        self.cache = cache
+        self.lines = {}
+
+    def invalidate(self):
+        self.lines.clear()
+
+    def _read_words(self, first: int, end: int):
+        data = bytearray()
+        results = self.jtag.read_axi_batch(list(range(first, end, self.bus_bytes)))
+        for status_axi in results:
+            if status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+                raise RuntimeError(
+                    f"[JTAG_to_AXI] Memory read failed: {status_axi.status.name}"
+                )
+            data += status_axi.data_rd.to_bytes(self.bus_bytes, "little")
+        return bytes(data)
+
+    def _fetch(self, lines):
+        addresses = []
+        for line in lines:
+            addresses += range(line, line + self.line_size, self.bus_bytes)
+        results = self.jtag.read_axi_batch(addresses)
+        data = bytearray()
+        for status_axi in results:
+            if status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+                return None
+            data += status_axi.data_rd.to_bytes(self.bus_bytes, "little")
+        fetched = {}
+        for idx, line in enumerate(lines):
+            fetched[line] = bytes(
+                data[idx * self.line_size : (idx + 1) * self.line_size]
+            )
+        self.lines.update(fetched)
+        return fetched
+
+    def read(self, address: int, length: int):
+        first = address - (address % self.bus_bytes)
+        end = address + length
+        if not self.cache:
+            return self._read_words(first, end)[address - first : end - first]
+        first_line = address - (address % self.line_size)
+        lines = list(range(first_line, end, self.line_size))
+        fetched = self._fetch([line for line in lines if line not in self.lines])
+        if fetched is None:
+            # A line may reach past the end of a region, only read the words
+            # that were asked for
+            return self._read_words(first, end)[address - first : end - first]
+        data = bytearray()
+        for line in lines:
+            data += fetched[line] if line in fetched else self.lines[line]
+        offset = address - first_line
+        return bytes(data[offset : offset + length])
+
+    def write(self, address: int, data: bytes):
+        writes = []
+        end = address + len(data)
+        word = address - (address % self.bus_bytes)
+        while word < end:
+            value, wstrb = 0, 0
+            for lane in range(self.bus_bytes):
+                if address <= word + lane < end:
+                    value |= data[word + lane - address] << (8 * lane)
+                    wstrb |= 1 << lane
+            writes.append((word, value, wstrb))
+            word += self.bus_bytes
+        for line in range(
+            address - (address % self.line_size), end, self.line_size
+        ):
+            self.lines.pop(line, None)
+        for status_axi in self.jtag.write_axi_batch(writes):
+            if status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+                raise RuntimeError(
+                    f"[JTAG_to_AXI] Memory write failed: {status_axi.status.name}"
+                )
+
+
+class GdbServer:
+    """GDB remote serial protocol endpoint for the AXI memory space.
+
+    Only memory access is served (m, M, X, qSupported and the packets GDB
+    needs to attach), there is no CPU behind it: connect with
+    "target remote localhost:<port>" and use x/dump/restore/load. Reads go
+    to the bus every time unless cache=True, then the read cache is dropped
+    on every write and with "monitor flush".
+    """
+
+    def __init__(
+        self,
+        jtag,
+        host: str = "127.0.0.1",
+        port: int = 3333,
+        packet_size: int = GDB_PACKET_SIZE,
+        line_size: int = 64,
+        cache: bool = False,
+    ):
+        self.memory = AXIMemory(jtag, line_size=line_size, cache=cache)
+        self.packet_size = packet_size
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((host, port))
+        self.sock.listen(1)
+        self.port = self.sock.getsockname()[1]
+        self._running = False
+
+    def serve_forever(self):
+        """Serve GDB connections one at a time until close()."""
+        self._running = True
+        while self._running:
+            try:
+                conn, peer = self.sock.accept()
+            except OSError:
+                break
+            log.info("GDB connected from %s:%d", *peer)
+            with conn:
+                try:
+                    self.handle(conn)
+                except Exception:
+                    # A broken session (socket or cable) must not stop the server
+                    log.exception("GDB session from %s:%d failed", *peer)
+            # The target may have changed while nobody was attached
+            self.memory.invalidate()
+
+    def close(self):
+        self._running = False
+        self.sock.close()
+
+    def handle(self, conn):
+        """Run a GDB session over a connected socket."""
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        buffer = b""
+        ack = True
+        while True:
+            start = buffer.find(b"$")
+            end = buffer.find(b"#", start)
+            if start < 0 or end < 0 or len(buffer) < end + 3:
+                chunk = conn.recv(self.packet_size + 16)
+                if not chunk:
+                    return
+                buffer += chunk
+                continue
+            payload = buffer[start + 1 : end]
+            checksum = buffer[end + 1 : end + 3]
+            buffer = buffer[end + 3 :]
+            if ack:
+                try:
+                    valid = int(checksum, 16) == gdb_checksum(payload)
+                except ValueError:
+                    valid = False
+                if not valid:
+                    conn.sendall(b"-")
+                    continue
+                conn.sendall(b"+")
+            reply = self.dispatch(payload)
+            if reply is None:
+                conn.sendall(gdb_packet(b"OK"))
+                return
+            if payload == b"QStartNoAckMode":
+                ack = False
+            conn.sendall(gdb_packet(reply))
+
+    def dispatch(self, payload: bytes):
+        """Reply to a packet, None ends the session."""
+        try:
+            return self._dispatch(payload)
+        except (ValueError, RuntimeError) as exc:
+            log.warning("GDB packet %r failed: %s", payload[:32], exc)
+            return b"E01"
+
+    def _dispatch(self, payload: bytes):
+        cmd = payload[:1]
+        if cmd == b"m":
+            address, length = (int(x, 16) for x in payload[1:].split(b","))
+            return self.memory.read(address, length).hex().encode()
+        if cmd in (b"M", b"X"):
+            header, data = payload[1:].split(b":", 1)
+            address, length = (int(x, 16) for x in header.split(b","))
+            data = bytes.fromhex(data.decode()) if cmd == b"M" else gdb_unescape(data)
+            if len(data) != length:
+                raise ValueError(f"[JTAG_to_AXI] Expected {length} bytes, got {len(data)}")
+            if length:
+                self.memory.write(address, data)
+            return b"OK"
+        if payload.startswith(b"qSupported"):
+            return b"PacketSize=%x;QStartNoAckMode+" % self.packet_size
+        if payload == b"QStartNoAckMode":
+            return b"OK"
+        if payload.startswith(b"qRcmd,"):
+            command = bytes.fromhex(payload[6:].decode()).strip()
+            if command == b"flush":
+                self.memory.invalidate()
+                return b"OK"
+            return b""
+        if cmd == b"?":
+            return b"S05"
+        if payload == b"qAttached":
+            return b"1"
+        if cmd == b"H":
+            return b"OK"
+        if cmd in (b"k", b"D"):
+            return None
+        # Registers, breakpoints, execution control: not supported
+        return b""
@@ -4,325 +4,289 @@
 # License           : MIT license <Check LICENSE>
 # Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
 # Date              : 15.09.2024
-# Last Modified Date: 01.10.2024
-import os
+# Last Modified Date: 19.10.2026
+import time
+import queue
+import logging
+import threading
+from os import environ
 from .jtag_base import *
-from enum import Enum
-from pyftdi.jtag import JtagEngine, JtagTool
+from pyftdi.jtag import JtagEngine, JtagTool, JtagError
 from pyftdi.ftdi import Ftdi
-from os import environ
-from pyftdi.bits import BitSequence
 from pyftdi.usbtools import UsbToolsError
-from contextlib import suppress 
-
-
-def bin_to_num(binary_list):
-    # Join the list into a string and convert to an integer using base 2
-    binary_string = "".join(map(str, binary_list))
-    return int(binary_string, 2)
+from .jtag_axi_driver import JtagToAXIDriver
+
+# Max. scan programs queued between the caller, the USB writer and the TDO
+# reader, each stage holds at most this many programs ahead of the next one
+FTDI_PIPELINE_DEPTH = 2
+# Seconds without a single TDO byte coming back before a read is given up
+FTDI_READ_TIMEOUT = 5.0
+
+log = logging.getLogger(__name__)
+
+
+def encode_scans(scans, state=JTAGState.UPDATE_DR):
+    """MPSSE commands of a scan program, starting from state (Test-Logic-Reset,
+    Run-Test/Idle or Update-DR/IR). Returns (commands, DR lengths, end state).
+
+    Every DR scan shifts length - 1 bits with TDO read back and leaves
+    Shift-DR with the last bit on the Exit1 TMS read, as with
+    JtagController.write_with_read(use_last=True).
+    """
+    cmd = bytearray()
+    lengths = []
+    for scan in scans:
+        # Test-Logic-Reset goes through Run-Test/Idle (TMS 0) first
+        lead = 1 if state is JTAGState.TEST_LOGIC_RESET else 0
+        if scan[0] is ScanOp.IR:
+            code = IR_CODES[scan[1]]
+            # Select-DR, Select-IR, Capture-IR, Shift-IR, 3 bits, Exit1/Update-IR
+            cmd += bytes(
+                (
+                    Ftdi.WRITE_BITS_TMS_NVE, 3 + lead, 0b0011 << lead,
+                    Ftdi.WRITE_BITS_NVE_LSB, 2, code & 0x7,
+                    Ftdi.WRITE_BITS_TMS_NVE, 1, 0b11 | ((code >> 3) << 7),
+                )
+            )
+            state = JTAGState.UPDATE_IR
+        elif scan[0] is ScanOp.DR:
+            value, length = scan[1], scan[2]
+            bits = length - 1
+            byte_count, bit_count = bits >> 3, bits & 0x7
+            # Select-DR, Capture-DR, Shift-DR
+            cmd += bytes((Ftdi.WRITE_BITS_TMS_NVE, 2 + lead, 0b001 << lead))
+            if byte_count:
+                blen = byte_count - 1
+                cmd += bytes((Ftdi.RW_BYTES_PVE_NVE_LSB, blen & 0xFF, (blen >> 8) & 0xFF))
+                cmd += (value & ((1 << (8 * byte_count)) - 1)).to_bytes(
+                    byte_count, "little"
+                )
+            if bit_count:
+                cmd += bytes(
+                    (
+                        Ftdi.RW_BITS_PVE_NVE_LSB,
+                        bit_count - 1,
+                        (value >> (8 * byte_count)) & ((1 << bit_count) - 1),
+                    )
+                )
+            # Exit1-DR, Update-DR with the MSB on TDI
+            cmd += bytes(
+                (Ftdi.RW_BITS_TMS_PVE_NVE, 1, 0b11 | (((value >> bits) & 0x1) << 7))
+            )
+            lengths.append(length)
+            state = JTAGState.UPDATE_DR
+        else:
+            cycles = scan[1] + (0 if state is JTAGState.RUN_TEST_IDLE else 1)
+            while cycles > 0:
+                cmd += bytes((Ftdi.WRITE_BITS_TMS_NVE, min(cycles, 7) - 1, 0))
+                cycles -= 7
+            state = JTAGState.RUN_TEST_IDLE
+    if lengths:
+        # Flush the TDO bytes now instead of at the next latency timer tick
+        cmd.append(Ftdi.SEND_IMMEDIATE)
+    return cmd, lengths, state
+
+
+def tdo_bytes(lengths):
+    """Number of bytes read back for DR scans of the given lengths."""
+    return sum(((length + 6) >> 3) + 1 for length in lengths)
+
+
+def decode_tdo(data, lengths):
+    """TDO values of the DR scans from the bytes read back: the full bytes,
+    the partial one (bits come in from the MSB) and the Exit1 TMS byte,
+    whose bit 6 holds the last TDO bit."""
+    tdo = []
+    pos = 0
+    for length in lengths:
+        bits = length - 1
+        byte_count, bit_count = bits >> 3, bits & 0x7
+        value = int.from_bytes(data[pos : pos + byte_count], "little")
+        pos += byte_count
+        if bit_count:
+            value |= (data[pos] >> (8 - bit_count)) << (8 * byte_count)
+            pos += 1
+        tdo.append(value | (((data[pos] >> 6) & 0x1) << bits))
+        pos += 1
+    return tdo
+
+
+class _Ticket:
+    __slots__ = ("lengths", "tdo", "error", "done")
+
+    def __init__(self, lengths):
+        self.lengths = lengths
+        self.tdo = []
+        self.error = None
+        self.done = threading.Event()
+
+
+class MPSSEPipeline:
+    """Double buffered submission of encoded scan programs to an FTDI.
+
+    While the caller encodes program N+1, the writer thread has program N
+    on USB and the reader thread pulls and decodes the TDO of program N-1.
+    Both hand-offs are bounded queues, so the caller blocks instead of
+    running ahead of the adapter, and programs complete in submission order.
+    The first USB error fails every program behind it until drain().
+    """
+
+    def __init__(self, ftdi, depth: int = FTDI_PIPELINE_DEPTH, timeout=FTDI_READ_TIMEOUT):
+        self.ftdi = ftdi
+        self.timeout = timeout
+        self.error = None
+        self._tx = queue.Queue(depth)
+        self._rx = queue.Queue(depth)
+        self._threads = [
+            threading.Thread(target=self._writer, name="jtag_axi-usb-wr", daemon=True),
+            threading.Thread(target=self._reader, name="jtag_axi-usb-rd", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, cmd, lengths):
+        """Queue the MPSSE commands of a program reading back DR scans of the
+        given lengths, returns a ticket for collect()."""
+        ticket = _Ticket(lengths)
+        self._tx.put((ticket, cmd))
+        return ticket
+
+    def collect(self, ticket):
+        """Wait for a submitted program, returns the TDO of its DR scans."""
+        ticket.done.wait()
+        if ticket.error is not None:
+            raise ticket.error
+        return ticket.tdo
+
+    def drain(self):
+        """Wait until every program submitted so far is on USB and its TDO
+        read back, so the FTDI handle can be used directly. Their tickets
+        can still be collected afterwards.
+
+        After a USB error every ticket in flight has failed once this
+        returns: the FTDI buffers, which may hold part of a program, are
+        purged and the pipeline accepts programs again. The TAP state is
+        unknown by then, the caller has to reset it."""
+        self.submit(b"", []).done.wait()
+        if self.error is not None:
+            log.warning("Recovering the MPSSE pipeline after: %s", self.error)
+            self.ftdi.purge_buffers()
+            self.error = None
+
+    def close(self):
+        self._tx.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _writer(self):
+        while True:
+            item = self._tx.get()
+            if item is None:
+                self._rx.put(None)
+                return
+            ticket, cmd = item
+            if self.error is None and cmd:
+                try:
+                    self.ftdi.write_data(cmd)
+                except Exception as exc:
+                    self.error = exc
+            self._rx.put(ticket)
+
+    def _reader(self):
+        while True:
+            ticket = self._rx.get()
+            if ticket is None:
+                return
+            if self.error is None and ticket.lengths:
+                try:
+                    data = self._read(tdo_bytes(ticket.lengths))
+                    ticket.tdo = decode_tdo(data, ticket.lengths)
+                except Exception as exc:
+                    self.error = exc
+            ticket.error = self.error
+            ticket.done.set()
+
+    def _read(self, count: int):
+        data = bytearray()
+        deadline = time.monotonic() + self.timeout
+        while len(data) < count:
+            chunk = self.ftdi.read_data_bytes(count - len(data), 4)
+            if chunk:
+                data += chunk
+                deadline = time.monotonic() + self.timeout
+            elif time.monotonic() > deadline:
+                raise JtagError(
+                    f"[JTAG_to_AXI] Unable to read data from FTDI,"
+                    f" got {len(data)} out of {count} bytes"
+                )
+        return data
 
 
-def bin_list(value, bits):
-    # Convert the number to its binary representation and remove the '0b' prefix
-    bin_str = bin(value & ((1 << bits) - 1))[2:].zfill(bits)
-    # Convert the string representation of the binary number to a list of integers
-    return [int(bit) for bit in bin_str]
+class JtagToAXIFTDI(JtagToAXIDriver):
+    """JtagToAXIDriver over an FTDI MPSSE adapter (pyftdi).
 
+    Scan programs are encoded straight into MPSSE commands and go through
+    an MPSSEPipeline, so _submit() returns as soon as a program is queued
+    and the next one can be encoded while the adapter shifts it.
+    """
 
-class JtagToAXIFTDI(BaseJtagToAXI):
-    def __init__(
-        self,
-        device="ftdi://ftdi:2232/1",
-        name: str = "JTAG to AXI IP",
-        freq: int = 1e6,
-        trst: bool = False,
-        debug: bool = False,
-        **kwargs,
-    ):
-        super().__init__(**kwargs)
-        self.ftdi = Ftdi()
+    def __init__(self, device="ftdi://ftdi:2232/1", **kwargs):
+        super().__init__(device=device, **kwargs)
 
+    def _open(self, device, freq, trst):
+        # A single USB handle is opened, through the JTAG engine itself
+        self.jtag = JtagEngine(trst=trst, frequency=freq)
         try:
-            self.ftdi.open_from_url(device)
+            self.jtag.configure(environ.get("FTDI_DEVICE", device))
         except UsbToolsError:
-            print(f"[JTAG_to_AXI] Could not find the JTAG Adapter specified")
-            self.ftdi.show_devices()
-
-        self.jtag = JtagEngine(trst=trst, frequency=freq)
-        self.jtag.configure(environ.get("FTDI_DEVICE", device))
-        self.jtag.reset()
+            log.error("Could not find the JTAG Adapter specified")
+            Ftdi.show_devices()
+            raise
+        self.ftdi = self.jtag.controller.ftdi
+        self.pipeline = None
+        self.reset()
+        self.pipeline = MPSSEPipeline(self.ftdi)
 
         self.tool = JtagTool(self.jtag)
-        self.debug = debug
-        if self.debug:
-            print(f"[JTAG_to_AXI] ---- Init Device ----")
-            print(f"[JTAG_to_AXI] Init device \t{device}")
-            if freq >= 1e6:
-                print(f"[JTAG_to_AXI] Frequency \t{freq/1e6:.3f} MHz")
-            elif freq >= 1e3:
-                print(f"[JTAG_to_AXI] Frequency \t{freq/1e3:.3f} kHz")
-            else:
-                print(f"[JTAG_to_AXI] Frequency \t{freq:.3f} Hz")
-            print(f"[JTAG_to_AXI] IDCODE    \t{hex(self._get_jdr(InstJTAG.IDCODE))}")
-            print(f"[JTAG_to_AXI] AXI Address width\t{self.addr_width}")
-            print(f"[JTAG_to_AXI] AXI Data width  \t{self.data_width}")
-            print(f"[JTAG_to_AXI] AFIFO Depth  \t{self.async_fifo_depth}")
-            print(f"[JTAG_to_AXI] IC RESET width  \t{self.ic_reset_width}")
-            print(f"[JTAG_to_AXI] USERDATA width  \t{self.userdata_width}")
-
-        self.idcode_jdr = self._get_jdr(InstJTAG.IDCODE)
-        self.ic_reset_jdr = self._get_jdr(InstJTAG.IC_RESET)
-        self.addr_axi_jdr = self._get_jdr(InstJTAG.ADDR_AXI_REG)
-        self.data_write_axi_jdr = self._get_jdr(InstJTAG.DATA_W_AXI_REG)
-        self.status_axi_jdr = self._get_jdr(InstJTAG.STATUS_AXI_REG)
-        self.ctrl_axi_jdr = self._get_jdr(InstJTAG.CTRL_AXI_REG)
-        self.wstrb_axi_jdr = self._get_jdr(InstJTAG.WSTRB_AXI_REG)
-        self.usercode_jdr = self._get_jdr(InstJTAG.USERCODE)
-        self.userdata_jdr = self._get_jdr(InstJTAG.USERDATA)
-
-    def reset(self):
-        """Reset the JTAG interface."""
-        if self.debug:
-            print(f"[JTAG_to_AXI] Reset issued")
-        self.jtag.reset()
-
-    def _get_jdr(self, jdr: InstJTAG):
-        instruction = BitSequence(jdr.value[0][2:], msb=True, length=4)
-        self.jtag.change_state("shift_ir")
-        retval = self.jtag.shift_and_update_register(instruction)
-        self.jtag.go_idle()
-        self.jtag.change_state("shift_dr")
-        jdr_len = self._dr_length(jdr)
-        jdr_value = self.jtag.shift_and_update_register(BitSequence("0" * jdr_len))
-        # Shift back the old value that we replaced with 0s
-        self.jtag.change_state("shift_dr")
-        jdr_value_new = self.jtag.shift_and_update_register(jdr_value)
-        self.jtag.go_idle()
-        return int(jdr_value)
-
-    def read_jdrs(self):
-        self.idcode_jdr = self._get_jdr(InstJTAG.IDCODE)
-        self.usercode_jdr = self._get_jdr(InstJTAG.USERCODE)
-        self.ic_reset_jdr = self._get_jdr(InstJTAG.IC_RESET)
-        self.addr_axi_jdr = self._get_jdr(InstJTAG.ADDR_AXI_REG)
-        self.data_write_axi_jdr = self._get_jdr(InstJTAG.DATA_W_AXI_REG)
-        self.status_axi_jdr = self._get_jdr(InstJTAG.STATUS_AXI_REG)
-        self.ctrl_axi_jdr = self._get_jdr(InstJTAG.CTRL_AXI_REG)
-        self.wstrb_axi_jdr = self._get_jdr(InstJTAG.WSTRB_AXI_REG)
-        self.userdata_jdr = self._get_jdr(InstJTAG.USERDATA)
-
-        print(f"\n[JTAG_to_AXI] ---- Print JDRs ----")
-        print(f"[JTAG_to_AXI] IDCODE     \t{hex(self.idcode_jdr)}")
-        print(f"[JTAG_to_AXI] USERCODE   \t{hex(self.usercode_jdr)}")
-        print(f"[JTAG_to_AXI] IC_RESET   \t{hex(self.ic_reset_jdr)}")
-        print(f"[JTAG_to_AXI] ADDR_AXI   \t{hex(self.addr_axi_jdr)}")
-        print(f"[JTAG_to_AXI] DATA_AXI   \t{hex(self.data_write_axi_jdr)}")
-        print(f"[JTAG_to_AXI] CTRL_AXI   \t{hex(self.ctrl_axi_jdr)}")
-        print(f"[JTAG_to_AXI] WSTRB_AXI  \t{hex(self.wstrb_axi_jdr)}")
-        print(f"[JTAG_to_AXI] USERDATA   \t{hex(self.userdata_jdr)}")
-
-    def _shift_jdr(self, jdr: InstJTAG, val: int):
-        if self.debug:
-            print(f"[JTAG_to_AXI] ---- Shift JDR ----")
-        instruction = BitSequence(jdr.value[0][2:], msb=True, length=4)
-        if self.debug:
-            print(f"[JTAG_to_AXI] Updating JDR: {jdr.name} / Value: {val} ({hex(val)})")
-        self.jtag.change_state("shift_ir")
-        retval = self.jtag.shift_and_update_register(instruction)
-        # self.jtag.go_idle()
-        jdr_value = BitSequence(val, msb=False, length=self._dr_length(jdr))
-        self.jtag.change_state("shift_dr")
-        jdr_value = self.jtag.shift_and_update_register(jdr_value)
-        return int(jdr_value)
-
-    def _shift_data_only(self, jdr: InstJTAG, val: int):
-        jdr_value = BitSequence(val, msb=False, length=self._dr_length(jdr))
-        self.jtag.change_state("shift_dr")
-        jdr_value = self.jtag.shift_and_update_register(jdr_value)
-        return int(jdr_value)
-
-    def _update_current(self, info, current, new):
-        if current == new:
-            if self.debug:
-                print(f"[JTAG_to_AXI] Skipping {info} shift due to value match")
-            return False
-        else:
-            return True
-
-    def write_axi(self, address, data, size=None, wstrb=0xF):
-        if size is None:
-            size = self.data_width // 8
-
-        if address >= 2**self.addr_width:
-            raise ValueError(
-                f"[JTAG_to_AXI] Address exceeds max of address width {self.addr_width}"
-            )
 
-        if data >= 2**self.data_width:
-            raise ValueError(
-                f"[JTAG_to_AXI] Data write exceeds max of data width {self.data_width}"
-            )
+    def close(self):
+        self.pipeline.close()
+        self.jtag.close()
 
-        if wstrb > int("1" * (self.data_width // 8), 2):
-            raise ValueError(
-                f"[JTAG_to_AXI] Write strobe exceeds max of {hex(int('1'*(self.data_width//8),2))}"
-            )
+    def set_frequency(self, freq):
+        """Change the TCK frequency, returns the actual frequency programmed."""
+        # Programs already submitted are shifted at the previous frequency
+        self.pipeline.drain()
+        self.freq = self.ftdi.set_frequency(freq)
+        return self.freq
 
-        if size > (self.data_width // 8):
-            raise ValueError(
-                f"[JTAG_to_AXI] Number of bytes requested ({self.size}) is greater"
-                f" than max ({self.data_width // 8})"
-            )
-
-        if self._update_current("address", self.addr_axi_jdr, address):
-            self._shift_jdr(InstJTAG.ADDR_AXI_REG, address)
-            self.addr_axi_jdr = address
-
-        if self._update_current("write data", self.data_write_axi_jdr, data):
-            self._shift_jdr(InstJTAG.DATA_W_AXI_REG, data)
-            self.data_write_axi_jdr = data
-
-        if self._update_current("write strobe", self.wstrb_axi_jdr, wstrb):
-            self._shift_jdr(InstJTAG.WSTRB_AXI_REG, wstrb)
-            self.wstrb_axi_jdr = wstrb
-
-        empty_ctrl = JDRCtrlAXI(start=0).get_jdr()
-        send_write = JDRCtrlAXI(
-            start=1, txn_type=TxnType.AXI_WRITE, size_axi=self._convert_size(size)
-        )
-        current = JDRCtrlAXI.from_jdr(
-            self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl)
-        )
-
-        # Check whether we have enough free slots to send
-        while current.fifo_ocup >= self.async_fifo_depth:
-            if self.debug:
-                print(
-                    f"[JTAG_to_AXI] Waiting ASYNC FIFO to have slots "
-                    f"available, ocup: {current.fifo_ocup} / {self.async_fifo_depth}"
-                )
-            self._shift_jdr(InstJTAG.STATUS_AXI_REG, 0)
-            current = JDRCtrlAXI.from_jdr(
-                self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl)
-            )
-
-        # Send the TXN
-        current = JDRCtrlAXI.from_jdr(
-            self._shift_jdr(InstJTAG.CTRL_AXI_REG, send_write.get_jdr())
-        )
-        print(
-            f"[JTAG_to_AXI][WRITE] Addr = {hex(address)} / Data = {hex(data)}"
-            f" / Size = {self._convert_size(size)} / WrStrb = {bin(wstrb)}"
-        )
-        current = JDRCtrlAXI.from_jdr(
-            self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl)
-        )
-        if self.debug:
-            print(
-                f"[JTAG_to_AXI] Current AFIFO size: {current.fifo_ocup} / {self.async_fifo_depth}"
-            )
-        status_axi = JDRStatusAXI.from_jdr(
-            self._shift_jdr(InstJTAG.STATUS_AXI_REG, 0), data_width=self.data_width
-        )
-        while status_axi.status == JTAGToAXIStatus.JTAG_RUNNING:
-            if self.debug:
-                print(f"[JTAG_to_AXI] Waiting TXN to complete: " f"{status_axi.status}")
-            status_axi = JDRStatusAXI.from_jdr(
-                self._shift_jdr(InstJTAG.STATUS_AXI_REG, 0), data_width=self.data_width
-            )
-        return status_axi
-
-    def read_axi(self, address, size=None):
-        if size is None:
-            size = self.data_width // 8
-
-        if address >= 2**self.addr_width:
-            raise ValueError(
-                f"[JTAG_to_AXI] Address exceeds max of address width {self.addr_width}"
-            )
-
-        if size > (self.data_width // 8):
-            raise ValueError(
-                f"[JTAG_to_AXI] Number of bytes requested ({self.size}) is greater"
-                f" than max ({self.data_width // 8})"
-            )
-
-        if self._update_current("address", self.addr_axi_jdr, address):
-            self._shift_jdr(InstJTAG.ADDR_AXI_REG, address)
-            self.addr_axi_jdr = address
-
-        empty_ctrl = JDRCtrlAXI(start=0).get_jdr()
-        send_write = JDRCtrlAXI(
-            start=1, txn_type=TxnType.AXI_READ, size_axi=self._convert_size(size)
-        )
-        current = JDRCtrlAXI.from_jdr(
-            self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl)
-        )
-
-        # Check whether we have enough free slots to send
-        while current.fifo_ocup >= self.async_fifo_depth:
-            if self.debug:
-                print(
-                    f"[JTAG_to_AXI] Waiting ASYNC FIFO to have slots "
-                    f"available, ocup: {current.fifo_ocup} / {self.async_fifo_depth}"
-                )
-            self._shift_jdr(InstJTAG.STATUS_AXI_REG, 0)
-            current = JDRCtrlAXI.from_jdr(
-                self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl)
-            )
-
-        # Send the TXN
-        current = JDRCtrlAXI.from_jdr(
-            self._shift_jdr(InstJTAG.CTRL_AXI_REG, send_write.get_jdr())
-        )
-        print(
-            f"[JTAG_to_AXI][READ] Addr = {hex(address)}"
-            f" / Size = {self._convert_size(size)}"
-        )
-        current = JDRCtrlAXI.from_jdr(
-            self._shift_jdr(InstJTAG.CTRL_AXI_REG, empty_ctrl)
-        )
-        if self.debug:
-            print(
-                f"[JTAG_to_AXI] Current AFIFO size: {current.fifo_ocup} / {self.async_fifo_depth}"
-            )
-        status_axi = JDRStatusAXI.from_jdr(
-            self._shift_jdr(InstJTAG.STATUS_AXI_REG, 0), data_width=self.data_width
-        )
-        while status_axi.status == JTAGToAXIStatus.JTAG_RUNNING:
-            if self.debug:
-                print(f"[JTAG_to_AXI] Waiting TXN to complete: {status_axi.status}")
-            status_axi = JDRStatusAXI.from_jdr(
-                self._shift_jdr(InstJTAG.STATUS_AXI_REG, 0), data_width=self.data_width
-            )
-        return status_axi
-
-    def write_ic_reset(self, value):
-        if value >= 2**self.ic_reset_width:
-            raise ValueError(
-                f"[JTAG_to_AXI] Value to write on IC_RESET ({value}) is greater than max {2**self.ic_reset_width}"
-            )
-        if self.debug:
-            print(f"[JTAG_to_AXI] Writing {value} in IC_RESET JDR")
-        self._shift_jdr(InstJTAG.IC_RESET, value)
-        self.ic_reset_jdr = value
-
-    def write_userdata(self, value):
-        if value >= 2**self.userdata_width:
-            raise ValueError(
-                f"[JTAG_to_AXI] Value to write on USERDATA ({value}) is greater than max {2**self.userdata_width}"
-            )
-        if self.debug:
-            print(f"[JTAG_to_AXI] Writing {value} in USERDATA JDR")
-        self._shift_jdr(InstJTAG.USERDATA, value)
-        self.userdata_jdr = value
-
-    def write_fwd_userdata(self, value):
-        if value >= 2**self.userdata_width:
-            raise ValueError(
-                f"[JTAG_to_AXI] Value to write on USERDATA ({value}) is greater than max {2**self.userdata_width}"
-            )
-        if self.debug:
-            print(f"[JTAG_to_AXI] Writing {value} in USERDATA JDR")
-        self.userdata_jdr = value
-        return self._shift_data_only(InstJTAG.USERDATA, value)
+    def reset(self):
+        """Reset the JTAG interface, also after a USB error."""
+        log.debug("Reset issued")
+        if self.pipeline is not None:
+            # Neither MPSSE commands nor TDO bytes may interleave with the
+            # programs in flight, a failed pipeline is recovered here
+            self.pipeline.drain()
+        self.jtag.reset()
+        self.jtag.sync()
+        self._tap_state = JTAGState.TEST_LOGIC_RESET
+
+    def _start(self, scans):
+        cmd, lengths, self._tap_state = encode_scans(scans, self._tap_state)
+        self.metrics.usb_transfers += 1
+        return self.pipeline.submit(cmd, lengths)
+
+    def _submit(self, scans):
+        self._count_scans(scans)
+        return self._start(scans), scans, time.perf_counter()
+
+    def _collect(self, ticket):
+        ticket, scans, timestamp = ticket
+        tdo = self.pipeline.collect(ticket)
+        if self.recorder is not None:
+            self.recorder.record(timestamp, scans, tdo)
+        return tdo
+
+    def _shift_scans(self, scans):
+        """Shift a scan program with a single TDO read back at the end."""
+        return self.pipeline.collect(self._start(scans))
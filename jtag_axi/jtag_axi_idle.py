@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_idle.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+from .jtag_base import InstJTAG, ScanOp, scan_tck_cycles
+
+# TCK cycles from leaving Run-Test/Idle to the STATUS_AXI_REG Capture-DR
+STATUS_CAPTURE_OFFSET = scan_tck_cycles((ScanOp.IR, InstJTAG.STATUS_AXI_REG)) + 2
+
+
+class IdleWait:
+    """Learns the AXI txn latency (TCK cycles) per address region and txn type.
+
+    Before the first STATUS scan the driver idles in Run-Test/Idle for the
+    learned latency, then backs off exponentially while the txn is still
+    running. A txn that needed extra polls raises the estimate right away to
+    what it took, one that completed on the first scan lowers it slowly
+    (decay) so the estimate keeps tracking the fastest safe wait.
+
+    Undershooting is costly: when the response lands while STATUS is being
+    shifted, that scan captured JTAG_RUNNING but its Update-DR still acks the
+    response FIFO and the response is lost. So the decay is kept gentle,
+    decay=1.0 never lowers the estimate.
+    """
+
+    def __init__(
+        self,
+        region_bits: int = 12,
+        initial: int = 16,
+        max_cycles: int = 1 << 16,
+        decay: float = 0.99,
+        alpha: float = 0.25,
+    ):
+        self.region_bits = region_bits
+        self.initial = initial
+        self.max_cycles = max_cycles
+        self.decay = decay
+        self.alpha = alpha
+        self.estimates = {}
+
+    def _key(self, address, txn_type):
+        return (address >> self.region_bits, txn_type)
+
+    def estimate(self, address, txn_type):
+        """Learned TCK cycles from the first poll up to the txn completion."""
+        return self.estimates.get(self._key(address, txn_type), self.initial)
+
+    def first_wait(self, address, txn_type):
+        """Run-Test/Idle cycles before the first STATUS scan."""
+        return max(0, int(self.estimate(address, txn_type)) - STATUS_CAPTURE_OFFSET)
+
+    def backoff(self, address, txn_type, polls):
+        """Run-Test/Idle cycles before the STATUS scan number polls + 1."""
+        step = max(1, int(self.estimate(address, txn_type)) // 4)
+        return min(self.max_cycles, step << min(polls - 1, 16))
+
+    def learn(self, address, txn_type, cycles, polls):
+        """Account a txn that completed cycles TCKs after the first poll
+        started, polls being the number of extra STATUS scans it took."""
+        key = self._key(address, txn_type)
+        estimate = self.estimates.get(key, self.initial)
+        if polls > 0:
+            estimate = max(estimate, cycles)
+        else:
+            estimate += self.alpha * ((cycles * self.decay) - estimate)
+        self.estimates[key] = min(self.max_cycles, max(0.0, estimate))
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_journal.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import json
+import time
+import zlib
+import logging
+from collections import namedtuple
+from .jtag_base import JTAGToAXIStatus
+
+log = logging.getLogger(__name__)
+
+JOURNAL_VERSION = 1
+# Bytes written per journal record, rounded to whole bus words
+JOURNAL_CHUNK = 4096
+# Records appended between two fsync() of the journal
+JOURNAL_FSYNC_EVERY = 8
+# Journalled chunks read back by resume_load() before carrying on
+JOURNAL_VERIFY = 2
+
+# Returned by journaled_load()/resume_load(), written/skipped in bytes
+LoadReport = namedtuple("LoadReport", "written skipped verified seconds")
+
+
+class LoadJournal:
+    """Append-only record of a memory load, one JSON line per entry.
+
+    The first line describes the image (target address, size, CRC32 and
+    chunk size), then every chunk written is appended as
+    {"offset", "length", "crc"} once all its writes came back OKAY. A
+    {"rewind": offset} entry drops the chunks at and after offset, the file
+    itself is never rewritten. A torn last line (crash while appending) is
+    ignored. Records are fsync()ed every fsync_every chunks and on close.
+    """
+
+    def __init__(self, path, fsync_every: int = JOURNAL_FSYNC_EVERY):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.header = None
+        # {offset: (length, crc)} of the chunks known to be written
+        self.chunks = {}
+        self._fh = None
+        self._unsynced = 0
+        if os.path.exists(path):
+            self._parse()
+
+    def _parse(self):
+        with open(self.path, "r") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    log.warning("Ignoring torn journal line in %s", self.path)
+                    continue
+                if self.header is None:
+                    if entry.get("journal") != JOURNAL_VERSION:
+                        raise ValueError(
+                            f"[JTAG_to_AXI] {self.path} is not a load journal"
+                        )
+                    self.header = entry
+                elif "rewind" in entry:
+                    self.chunks = {
+                        offset: chunk
+                        for offset, chunk in self.chunks.items()
+                        if offset < entry["rewind"]
+                    }
+                else:
+                    self.chunks[entry["offset"]] = (entry["length"], entry["crc"])
+
+    def done(self):
+        """Number of image bytes covered by consecutive chunks from offset 0."""
+        offset = 0
+        while offset in self.chunks:
+            offset += self.chunks[offset][0]
+        return offset
+
+    def start(self, address: int, data: bytes, chunk: int, source=None):
+        """Begin a new journal for data loaded at address."""
+        if self.header is not None:
+            raise ValueError(f"[JTAG_to_AXI] Journal {self.path} already exists")
+        self.header = {
+            "journal": JOURNAL_VERSION,
+            "address": address,
+            "size": len(data),
+            "crc": zlib.crc32(data),
+            "chunk": chunk,
+            "source": source,
+        }
+        self._append(self.header, sync=True)
+
+    def match(self, data: bytes):
+        """Raise ValueError unless data is the image the journal was started for."""
+        if self.header is None:
+            raise ValueError(f"[JTAG_to_AXI] Journal {self.path} is empty")
+        if self.header["size"] != len(data) or self.header["crc"] != zlib.crc32(data):
+            raise ValueError(
+                f"[JTAG_to_AXI] Image does not match journal {self.path}"
+                f" ({self.header['size']} bytes, crc {self.header['crc']:#010x})"
+            )
+
+    def record(self, offset: int, chunk: bytes):
+        crc = zlib.crc32(chunk)
+        self.chunks[offset] = (len(chunk), crc)
+        self._append({"offset": offset, "length": len(chunk), "crc": crc})
+
+    def rewind(self, offset: int):
+        self.chunks = {
+            start: chunk for start, chunk in self.chunks.items() if start < offset
+        }
+        self._append({"rewind": offset}, sync=True)
+
+    def _append(self, entry, sync=False):
+        if self._fh is None:
+            self._fh = open(self.path, "a")
+            # Terminate a line torn by a crash, so this entry parses
+            if self._fh.tell() and not self._last_newline():
+                self._fh.write("\n")
+        self._fh.write(json.dumps(entry) + "\n")
+        self._unsynced += 1
+        if sync or self._unsynced >= self.fsync_every:
+            self.sync()
+
+    def _last_newline(self):
+        with open(self.path, "rb") as fh:
+            fh.seek(-1, os.SEEK_END)
+            return fh.read(1) == b"\n"
+
+    def sync(self):
+        if self._fh is not None and self._unsynced:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+            self._unsynced = 0
+
+    def close(self):
+        if self._fh is not None:
+            self.sync()
+            self._fh.close()
+            self._fh = None
+
+
+def _write_chunk(jtag, address: int, chunk: bytes):
+    bus = jtag.data_width // 8
+    writes = []
+    for offset in range(0, len(chunk), bus):
+        word = chunk[offset : offset + bus]
+        writes.append(
+            (address + offset, int.from_bytes(word, "little"), (1 << len(word)) - 1)
+        )
+    for (word_address, _, _), status_axi in zip(writes, jtag.write_axi_batch(writes)):
+        if status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+            raise RuntimeError(
+                f"[JTAG_to_AXI] Load write at {word_address:#x} failed:"
+                f" {status_axi.status.name}"
+            )
+
+
+def _read_chunk(jtag, address: int, length: int):
+    """Read length bytes back from address, None if any read failed. Uses
+    the bulk path of the host drivers, plain batches otherwise (BridgeClient)."""
+    bus = jtag.data_width // 8
+    count = -(-length // bus)
+    if hasattr(jtag, "read_axi_block"):
+        block = jtag.read_axi_block(address, count)
+        return block.tobytes()[:length] if block.ok else None
+    data = bytearray()
+    for status_axi in jtag.read_axi_batch([address + idx * bus for idx in range(count)]):
+        if status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+            return None
+        data += status_axi.data_rd.to_bytes(bus, "little")
+    return bytes(data[:length])
+
+
+def _load(jtag, journal, data: bytes, start: int):
+    address, chunk_size = journal.header["address"], journal.header["chunk"]
+    written = 0
+    try:
+        for offset in range(start, len(data), chunk_size):
+            chunk = data[offset : offset + chunk_size]
+            _write_chunk(jtag, address + offset, chunk)
+            journal.record(offset, chunk)
+            written += len(chunk)
+    finally:
+        journal.close()
+    return written
+
+
+def _check_alignment(jtag, address: int, chunk: int):
+    bus = jtag.data_width // 8
+    if address % bus or chunk % bus:
+        raise ValueError(
+            f"[JTAG_to_AXI] Journaled loads need address and chunk aligned"
+            f" to the bus width ({bus} bytes)"
+        )
+
+
+def journaled_load(
+    jtag,
+    address: int,
+    data: bytes,
+    journal_path,
+    chunk: int = JOURNAL_CHUNK,
+    fsync_every: int = JOURNAL_FSYNC_EVERY,
+    source=None,
+):
+    """Write data at address in chunks of pipelined writes, appending every
+    completed chunk to a new journal at journal_path. If the load is cut
+    short, resume_load() carries on from the journal. Returns a LoadReport."""
+    start = time.perf_counter()
+    chunk = max(chunk - chunk % (jtag.data_width // 8), jtag.data_width // 8)
+    _check_alignment(jtag, address, chunk)
+    journal = LoadJournal(journal_path, fsync_every)
+    journal.start(address, data, chunk, source)
+    written = _load(jtag, journal, data, 0)
+    return LoadReport(written, 0, 0, time.perf_counter() - start)
+
+
+def resume_load(
+    jtag,
+    journal_path,
+    data: bytes = None,
+    verify: int = JOURNAL_VERIFY,
+    fsync_every: int = JOURNAL_FSYNC_EVERY,
+):
+    """Carry on a journaled_load() over a new connection.
+
+    The last verify journalled chunks are read back and compared against
+    their CRC32 first, the load restarts from the first one that does not
+    match (the memory behind may have been lost with the glitch). data
+    defaults to the source file named in the journal. Returns a LoadReport.
+    """
+    start = time.perf_counter()
+    journal = LoadJournal(journal_path, fsync_every)
+    if data is None:
+        source = journal.header and journal.header.get("source")
+        if not source:
+            raise ValueError(f"[JTAG_to_AXI] Journal {journal_path} names no source file")
+        with open(source, "rb") as fh:
+            data = fh.read()
+    journal.match(data)
+    address = journal.header["address"]
+    _check_alignment(jtag, address, journal.header["chunk"])
+    done = journal.done()
+    offsets = sorted(offset for offset in journal.chunks if offset < done)
+    verified = 0
+    for offset in offsets[-verify:] if verify else []:
+        length, crc = journal.chunks[offset]
+        chunk = _read_chunk(jtag, address + offset, length)
+        if chunk is None or zlib.crc32(chunk) != crc:
+            log.warning("Journalled chunk at %#x does not read back", address + offset)
+            journal.rewind(offset)
+            done = offset
+            break
+        verified += length
+    log.info("Resuming load of %d bytes at offset %d", len(data), done)
+    written = _load(jtag, journal, data, done)
+    return LoadReport(written, done, verified, time.perf_counter() - start)
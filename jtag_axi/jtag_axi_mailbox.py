@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_mailbox.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import time
+from collections import deque
+from .jtag_base import InstJTAG, ScanOp, pack_words
+
+# Downlink (host -> design, USERDATA words): every frame starts on a word
+# boundary with SYNC, seq, length (16 bits LE) followed by the payload, the
+# padding bits of the last word are dropped by the design.
+MBOX_SYNC = 0xA5
+MBOX_HEADER_LEN = 4
+
+# Uplink (design -> host, USERCODE words):
+#   [31]    VALID
+#   [30:29] KIND
+#   [28:24] word sequence number (mod 32), a gap means lost words
+#   [23:0]  DATA: 3 payload bytes (LE), HEADER: {frame seq[7:0], length[15:0]}
+#           CREDIT: downlink words the design freed since the last grant
+MBOX_VALID = 1 << 31
+MBOX_KIND_DATA = 0
+MBOX_KIND_HEADER = 1
+MBOX_KIND_CREDIT = 2
+MBOX_WSEQ_MOD = 32
+MBOX_DATA_BYTES = 3
+
+
+def mbox_word(kind: int, wseq: int, payload: int):
+    return MBOX_VALID | (kind << 29) | ((wseq % MBOX_WSEQ_MOD) << 24) | payload
+
+
+def mbox_decode(word: int):
+    """Return (kind, wseq, payload) of an uplink word, None if not valid."""
+    if not word & MBOX_VALID:
+        return None
+    return ((word >> 29) & 0x3, (word >> 24) & 0x1F, word & 0xFFFFFF)
+
+
+def mbox_frame(seq: int, payload: bytes):
+    if len(payload) > 0xFFFF:
+        raise ValueError(f"[JTAG_to_AXI] Mailbox frame too long ({len(payload)})")
+    return bytes((MBOX_SYNC, seq & 0xFF)) + len(payload).to_bytes(2, "little") + payload
+
+
+class Mailbox:
+    """Framed duplex channel over USERDATA (downlink) and USERCODE (uplink).
+
+    Downlink words are delivered by each USERDATA Update-DR
+    (userdata_update_o) and consume a credit, credits are returned by the
+    design through CREDIT uplink words. Uplink words are read back to back:
+    on every usercode_update_o pulse the design loads usercode_i with its next
+    word (or 0 when it has none), so the word captured by a scan was always
+    loaded by the previous update and no handshake scan is needed. Every pump()
+    shifts the downlink words allowed plus uplink_reads USERCODE scans in a
+    single scan batch.
+    """
+
+    def __init__(self, jtag, credits: int = 16, uplink_reads: int = 16):
+        self.jtag = jtag
+        self.credits = credits
+        self.uplink_reads = uplink_reads
+        self.tx_words = deque()
+        self.tx_seq = 0
+        self.rx_frames = deque()
+        self.errors = 0
+        self._wseq = None
+        self._frame = None
+
+    def send(self, payload: bytes):
+        """Queue a frame, returns its sequence number."""
+        seq = self.tx_seq
+        self.tx_seq = (self.tx_seq + 1) & 0xFF
+        self.tx_words.extend(
+            pack_words(mbox_frame(seq, bytes(payload)), self.jtag.userdata_width)
+        )
+        return seq
+
+    def pump(self):
+        """Shift pending downlink words and read uplink words, returns the
+        number of valid uplink words received."""
+        width = self.jtag.userdata_width
+        scans = []
+        sent = min(self.credits, len(self.tx_words))
+        if sent:
+            scans.append((ScanOp.IR, InstJTAG.USERDATA))
+            for _ in range(sent):
+                scans.append((ScanOp.DR, self.tx_words.popleft(), width))
+            self.credits -= sent
+        scans.append((ScanOp.IR, InstJTAG.USERCODE))
+        scans += [(ScanOp.DR, 0, 32)] * self.uplink_reads
+        tdo = self.jtag._execute(scans)
+        if sent:
+            # USERDATA now holds the last word shifted, like stream_userdata()
+            self.jtag.userdata_jdr = scans[sent][1]
+        valid = 0
+        for word in tdo[sent:]:
+            decoded = mbox_decode(word)
+            if decoded is not None:
+                valid += 1
+                self._receive(*decoded)
+        return valid
+
+    def _receive(self, kind, wseq, payload):
+        if self._wseq is not None and wseq != self._wseq:
+            # Lost uplink words, the frame in progress is corrupted
+            self.errors += 1
+            self._frame = None
+        self._wseq = (wseq + 1) % MBOX_WSEQ_MOD
+        if kind == MBOX_KIND_CREDIT:
+            self.credits += payload & 0xFFFF
+        elif kind == MBOX_KIND_HEADER:
+            self._frame = [payload >> 16, payload & 0xFFFF, bytearray()]
+            self._frame_done()
+        elif kind == MBOX_KIND_DATA and self._frame is not None:
+            self._frame[2] += payload.to_bytes(MBOX_DATA_BYTES, "little")
+            self._frame_done()
+
+    def _frame_done(self):
+        seq, length, data = self._frame
+        if len(data) >= length:
+            self.rx_frames.append((seq, bytes(data[:length])))
+            self._frame = None
+
+    def flush(self, timeout: float = 1.0):
+        """Pump until every queued downlink word was shifted."""
+        deadline = time.monotonic() + timeout
+        while self.tx_words:
+            if time.monotonic() > deadline:
+                raise TimeoutError("[JTAG_to_AXI] Mailbox ran out of credits")
+            self.pump()
+
+    def recv(self, timeout: float = 1.0):
+        """Return the next (seq, payload) frame received, None on timeout."""
+        deadline = time.monotonic() + timeout
+        while not self.rx_frames:
+            if time.monotonic() > deadline:
+                return None
+            self.pump()
+        return self.rx_frames.popleft()
+
+
+class MailboxDevice:
+    """Reference model of the design side of the mailbox, it plugs into
+    VirtualTap (tap.sideband = MailboxDevice(...)) and documents what the RTL
+    or firmware behind userdata_o/usercode_i has to do.
+    """
+
+    def __init__(self, userdata_width: int = 4, rx_depth: int = 16):
+        self.userdata_width = userdata_width
+        self.rx_depth = rx_depth
+        self.rx_words = deque()
+        self.rx_frames = deque()
+        self.overflows = 0
+        self.tx_words = deque()
+        self.tx_seq = 0
+        self.presented = 0
+        self._wseq = 0
+        self._freed = 0
+        self._acc, self._nbits, self._frame = 0, 0, None
+
+    def send(self, payload: bytes):
+        seq = self.tx_seq
+        self.tx_seq = (self.tx_seq + 1) & 0xFF
+        self._push(MBOX_KIND_HEADER, (seq << 16) | len(payload))
+        for idx in range(0, len(payload), MBOX_DATA_BYTES):
+            chunk = payload[idx : idx + MBOX_DATA_BYTES]
+            self._push(MBOX_KIND_DATA, int.from_bytes(chunk, "little"))
+        return seq
+
+    def _push(self, kind, payload):
+        self.tx_words.append(mbox_word(kind, self._wseq, payload))
+        self._wseq = (self._wseq + 1) % MBOX_WSEQ_MOD
+
+    # VirtualTap side band interface
+    def usercode(self):
+        return self.presented
+
+    def usercode_update(self):
+        self.process()
+        self.presented = self.tx_words.popleft() if self.tx_words else 0
+
+    def userdata_update(self, value):
+        if len(self.rx_words) >= self.rx_depth:
+            self.overflows += 1
+        else:
+            self.rx_words.append(value)
+
+    def process(self):
+        """Firmware loop: drain the RX words and hand the credits back."""
+        while self.rx_words:
+            self._parse(self.rx_words.popleft())
+            self._freed += 1
+        if self._freed:
+            self._push(MBOX_KIND_CREDIT, self._freed)
+            self._freed = 0
+
+    def _parse(self, word):
+        self._acc |= word << self._nbits
+        self._nbits += self.userdata_width
+        while self._nbits >= 8:
+            byte = self._acc & 0xFF
+            self._acc >>= 8
+            self._nbits -= 8
+            if self._frame is None:
+                if byte == MBOX_SYNC:
+                    self._frame = bytearray()
+                continue
+            self._frame.append(byte)
+            if len(self._frame) >= MBOX_HEADER_LEN - 1:
+                length = int.from_bytes(self._frame[1:3], "little")
+                if len(self._frame) == length + MBOX_HEADER_LEN - 1:
+                    self.rx_frames.append((self._frame[0], bytes(self._frame[3:])))
+                    # Frames start on a word boundary, drop the padding
+                    self._acc, self._nbits, self._frame = 0, 0, None
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_metrics.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import json
+from bisect import bisect_left
+
+# Upper bounds (s) of the latency histogram buckets, +Inf is implicit
+LATENCY_BUCKETS = (
+    50e-6,
+    100e-6,
+    250e-6,
+    500e-6,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    10e-3,
+    25e-3,
+    50e-3,
+    100e-3,
+    250e-3,
+    500e-3,
+    1.0,
+)
+
+
+class LatencyHistogram:
+    """Fixed bucket latency histogram (seconds)."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float, count: int = 1):
+        self.counts[bisect_left(self.buckets, value)] += count
+        self.count += count
+        self.sum += value * count
+        if value > self.max:
+            self.max = value
+
+    def as_dict(self):
+        return {
+            "buckets": list(self.buckets),
+            "counts": list(self.counts),
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+        }
+
+
+class DriverMetrics:
+    """Counters and latency histograms of a host driver.
+
+    scans         DR scans per JDR name
+    tck_cycles    TCK cycles clocked by the scans
+    usb_transfers Host <-> adapter round trips (0 for the sim driver)
+    fifo_polls    Iterations spent waiting for a free AFIFO slot
+    status_polls  Extra STATUS scans while the txn was still running
+    skips         Register shifts avoided because the shadow value matched
+    status        AXI txn outcomes per JTAGToAXIStatus name
+    latency       LatencyHistogram per operation ("write", "read", ...)
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.scans = {}
+        self.tck_cycles = 0
+        self.usb_transfers = 0
+        self.fifo_polls = 0
+        self.status_polls = 0
+        self.skips = 0
+        self.status = {}
+        self.latency = {}
+
+    def count_scan(self, jdr_name: str):
+        self.scans[jdr_name] = self.scans.get(jdr_name, 0) + 1
+
+    def observe(self, op: str, seconds: float, status=None, count: int = 1):
+        """Account count finished operations of the same latency, status is
+        a JTAGToAXIStatus."""
+        hist = self.latency.get(op)
+        if hist is None:
+            hist = self.latency[op] = LatencyHistogram()
+        hist.observe(seconds, count)
+        if status is not None:
+            self.status[status.name] = self.status.get(status.name, 0) + count
+
+    def as_dict(self):
+        return {
+            "scans": dict(self.scans),
+            "tck_cycles": self.tck_cycles,
+            "usb_transfers": self.usb_transfers,
+            "fifo_polls": self.fifo_polls,
+            "status_polls": self.status_polls,
+            "skips": self.skips,
+            "status": dict(self.status),
+            "latency": {op: hist.as_dict() for op, hist in self.latency.items()},
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def to_prometheus(self, prefix: str = "jtag_axi", labels=None):
+        """Export in the Prometheus text exposition format.
+
+        labels is an optional dict added to every sample, e.g. {"board": "b0"}.
+        """
+        base = labels or {}
+
+        def fmt(extra=None):
+            merged = dict(base)
+            merged.update(extra or {})
+            if not merged:
+                return ""
+            items = ",".join(f'{key}="{val}"' for key, val in merged.items())
+            return f"{{{items}}}"
+
+        lines = []
+
+        def counter(name, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for extra, value in samples:
+                lines.append(f"{prefix}_{name}{fmt(extra)} {value}")
+
+        counter(
+            "scans_total",
+            "DR scans per JTAG data register",
+            [({"jdr": jdr}, count) for jdr, count in sorted(self.scans.items())],
+        )
+        counter("tck_cycles_total", "TCK cycles clocked", [(None, self.tck_cycles)])
+        counter(
+            "usb_transfers_total",
+            "Host to adapter round trips",
+            [(None, self.usb_transfers)],
+        )
+        counter(
+            "polls_total",
+            "Extra scans spent polling the design",
+            [
+                ({"kind": "fifo"}, self.fifo_polls),
+                ({"kind": "status"}, self.status_polls),
+            ],
+        )
+        counter("skips_total", "Shifts skipped on shadow match", [(None, self.skips)])
+        counter(
+            "txn_status_total",
+            "AXI txn outcomes",
+            [({"status": name}, count) for name, count in sorted(self.status.items())],
+        )
+
+        name = f"{prefix}_latency_seconds"
+        lines.append(f"# HELP {name} Latency per driver operation")
+        lines.append(f"# TYPE {name} histogram")
+        for op, hist in sorted(self.latency.items()):
+            cumulative = 0
+            for bound, count in zip(hist.buckets, hist.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{fmt({'op': op, 'le': bound})} {cumulative}")
+            lines.append(f"{name}_bucket{fmt({'op': op, 'le': '+Inf'})} {hist.count}")
+            lines.append(f"{name}_sum{fmt({'op': op})} {hist.sum}")
+            lines.append(f"{name}_count{fmt({'op': op})} {hist.count}")
+        return "\n".join(lines) + "\n"
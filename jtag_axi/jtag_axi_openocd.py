@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_openocd.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import socket
+import logging
+from .jtag_base import *
+from .jtag_axi_driver import JtagToAXIDriver
+from .jtag_axi_xvc import TapBitModel
+
+log = logging.getLogger(__name__)
+
+OPENOCD_RPC_PORT = 6666
+# Name of the TAP declared in the OpenOCD config with
+#   jtag newtap jtag_axi tap -irlen 4 -expected-id 0xbadc0ffe
+OPENOCD_TAP = "jtag_axi.tap"
+OPENOCD_RPC_END = b"\x1a"
+REMOTE_BITBANG_PORT = 4567
+
+
+def _address(device: str):
+    # openocd://host[:port][/tap]
+    rest = device.split("://", 1)[-1]
+    hostport, _, tap = rest.partition("/")
+    host, sep, port = hostport.rpartition(":")
+    if sep and port.isdigit():
+        address = (host or "127.0.0.1", int(port))
+    else:
+        address = (hostport or "127.0.0.1", OPENOCD_RPC_PORT)
+    return address, tap or OPENOCD_TAP
+
+
+class JtagToAXIOpenOCD(JtagToAXIDriver):
+    """JtagToAXIDriver over the Tcl RPC port of a running OpenOCD
+    (openocd://host:port/tap), for any cable OpenOCD supports.
+
+    Every scan program is sent as one Tcl script of irscan/drscan/runtest
+    commands, so a pipelined batch costs a single RPC round trip. The script
+    returns the drscan captures as a list of hex values.
+    """
+
+    def __init__(self, device=f"openocd://127.0.0.1:{OPENOCD_RPC_PORT}", **kwargs):
+        super().__init__(device=device, **kwargs)
+
+    def _open(self, device, freq, trst):
+        address, self.tap = _address(device)
+        self.sock = socket.create_connection(address)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.rpc_calls = 0
+        self.set_frequency(freq)
+        self.reset()
+
+    def close(self):
+        self.sock.close()
+
+    def rpc(self, script: str):
+        """Evaluate a Tcl script in OpenOCD, returns its result string."""
+        self.sock.sendall(script.encode() + OPENOCD_RPC_END)
+        reply = bytearray()
+        while not reply.endswith(OPENOCD_RPC_END):
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("[JTAG_to_AXI] OpenOCD RPC connection closed")
+            reply += chunk
+        self.rpc_calls += 1
+        return reply[:-1].decode(errors="replace").strip()
+
+    def set_frequency(self, freq):
+        """Change the TCK frequency, returns the actual frequency programmed."""
+        reply = self.rpc(f"adapter speed {max(1, int(freq // 1000))}")
+        khz = [word for word in reply.split() if word.isdigit()]
+        self.freq = int(khz[0]) * 1000 if khz else freq
+        return self.freq
+
+    def reset(self):
+        """Reset the JTAG interface (TMS reset of the scan chain)."""
+        self.rpc("jtag arp_init")
+
+    def _script(self, scans):
+        lines = ["set r {}"]
+        for scan in scans:
+            if scan[0] is ScanOp.IR:
+                lines.append(f"irscan {self.tap} {IR_CODES[scan[1]]:#x}")
+            elif scan[0] is ScanOp.DR:
+                value = scan[1] & ((1 << scan[2]) - 1)
+                lines.append(f"lappend r [drscan {self.tap} {scan[2]} {value:#x}]")
+            elif scan[1]:
+                lines.append(f"runtest {scan[1]}")
+        lines.append("set r")
+        return "\n".join(lines)
+
+    def _shift_scans(self, scans):
+        """Shift a scan program as a single Tcl RPC script."""
+        count = sum(1 for scan in scans if scan[0] is ScanOp.DR)
+        reply = self.rpc(self._script(scans))
+        words = reply.split()
+        try:
+            tdo = [int(word, 16) for word in words]
+        except ValueError:
+            tdo = []
+        if len(tdo) != count:
+            raise RuntimeError(f"[JTAG_to_AXI] OpenOCD scan failed: {reply[:200]}")
+        return tdo
+
+
+class RemoteBitbangServer:
+    """OpenOCD remote_bitbang server in front of a VirtualTap, so OpenOCD
+    (adapter driver remote_bitbang) can drive the simulated design. Serves
+    one connection at a time until close()."""
+
+    def __init__(self, tap, host: str = "127.0.0.1", port: int = REMOTE_BITBANG_PORT):
+        self.model = TapBitModel(tap)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((host, port))
+        self.sock.listen(1)
+        self.address = self.sock.getsockname()
+        self._running = False
+
+    def serve_forever(self):
+        self._running = True
+        while self._running:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                break
+            with conn:
+                try:
+                    self.handle(conn)
+                except OSError:
+                    pass
+
+    def close(self):
+        self._running = False
+        self.sock.close()
+
+    def handle(self, conn):
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        tck = tms = tdi = 0
+        while True:
+            data = conn.recv(4096)
+            if not data:
+                return
+            out = bytearray()
+            for cmd in data:
+                if 0x30 <= cmd <= 0x37:
+                    # '0'-'7': write tck, tms, tdi, the TAP clocks on TCK rising
+                    bits = cmd - 0x30
+                    new_tck, tms, tdi = (bits >> 2) & 0x1, (bits >> 1) & 0x1, bits & 0x1
+                    if new_tck and not tck:
+                        self.model.clock(tms, tdi)
+                    tck = new_tck
+                elif cmd == ord("R"):
+                    out.append(ord("1") if self.model.tdo() else ord("0"))
+                elif cmd == ord("Q"):
+                    if out:
+                        conn.sendall(out)
+                    return
+                # 'B'/'b' blink and 'r'-'u' reset lines are ignored
+            if out:
+                conn.sendall(out)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_profile.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+from .jtag_base import InstJTAG, ScanOp, AccessMode
+from .jtag_axi_cache import cache_load, cache_store
+
+# Longest DR we try to measure, must be >= the widest DR in the design
+MAX_DR_LENGTH = 512
+# DRs measured for a profile, CTRL_AXI_REG gives the AFIFO depth
+PROFILE_JDRS = (
+    InstJTAG.ADDR_AXI_REG,
+    InstJTAG.DATA_W_AXI_REG,
+    InstJTAG.IC_RESET,
+    InstJTAG.USERDATA,
+    InstJTAG.CTRL_AXI_REG,
+)
+
+
+def profile_key(idcode, lengths):
+    """Cache key of a design: IDCODE plus the PROFILE_JDRS lengths measured."""
+    return f"{idcode:#010x}:" + ",".join(str(lengths[jdr]) for jdr in PROFILE_JDRS)
+
+
+def measure_dr_lengths(jtag, jdrs, max_length: int = MAX_DR_LENGTH):
+    """Measure the length of several DRs through a flush pattern.
+
+    The pattern is max_length zeros, a single 1 and max_length zeros again,
+    so the register is left at zero (as with _get_jdr) and the 1 comes out
+    on TDO after max_length + DR length shifts. All the flush scans go in a
+    single scan program, the captured values of RW registers are shifted
+    back through a second one. Returns {jdr: length}.
+    """
+    scans = []
+    for jdr in jdrs:
+        scans += [(ScanOp.IR, jdr), (ScanOp.DR, 1 << max_length, (2 * max_length) + 1)]
+    lengths, restore, error = {}, [], None
+    for jdr, tdo in zip(jdrs, jtag._execute(scans)):
+        marker = tdo >> max_length
+        if marker == 0:
+            error = error or RuntimeError(
+                f"[JTAG_to_AXI] Could not measure {jdr.name} length, either the "
+                f"chain is broken or it is longer than {max_length} bits"
+            )
+            continue
+        length = (marker & -marker).bit_length() - 1
+        if length == 0:
+            error = error or RuntimeError(
+                f"[JTAG_to_AXI] {jdr.name} reported a zero DR length"
+            )
+            continue
+        lengths[jdr] = length
+        captured = tdo & ((1 << length) - 1)
+        if jdr is InstJTAG.CTRL_AXI_REG:
+            # Never restore START, it would dispatch a new AXI txn
+            captured &= ~(1 << (length - 1))
+        if jdr.value[2] is AccessMode.RW:
+            restore += [(ScanOp.IR, jdr), (ScanOp.DR, captured, length)]
+    if restore:
+        jtag._execute(restore)
+    if error is not None:
+        raise error
+    return lengths
+
+
+def measure_dr_length(jtag, jdr: InstJTAG, max_length: int = MAX_DR_LENGTH):
+    """Measure the length of a single DR, see measure_dr_lengths()."""
+    return measure_dr_lengths(jtag, [jdr], max_length)[jdr]
+
+
+def discover_profile(jtag, cache: bool = True):
+    """Return the device profile (widths and AFIFO depth) of the connected
+    design, measured through the DR lengths.
+
+    The lengths are measured on every call (one merged scan program), the
+    cache is keyed by IDCODE plus those lengths and not by USERCODE, which
+    is driven by the design at runtime and whose read back pulses
+    usercode_update_o. A cached entry wins over the derived profile, so it
+    can hold the exact AFIFO depth when that is not a power of two.
+    """
+    idcode = jtag._shift_jdr(InstJTAG.IDCODE, 0)
+    lengths = measure_dr_lengths(jtag, PROFILE_JDRS)
+    key = profile_key(idcode, lengths)
+
+    if cache:
+        profile = cache_load("profile", key)
+        if profile is not None:
+            return profile
+
+    profile = {
+        "addr_width": lengths[InstJTAG.ADDR_AXI_REG],
+        "data_width": lengths[InstJTAG.DATA_W_AXI_REG],
+        "ic_reset_width": lengths[InstJTAG.IC_RESET],
+        "userdata_width": lengths[InstJTAG.USERDATA],
+        # CTRL = {start, txn_type, fifo_ocup[clog2(depth):0], size[2:0]}
+        "async_fifo_depth": 1 << (lengths[InstJTAG.CTRL_AXI_REG] - 6),
+    }
+    if cache:
+        cache_store("profile", key, profile)
+    return profile
+
+
+def apply_discovered_profile(jtag, cache: bool = True):
+    """Discover the device profile and configure the interface with it."""
+    profile = discover_profile(jtag, cache=cache)
+    jtag.set_profile(profile)
+    # Registers measured were left with new values, forget their shadows
+    jtag.addr_axi_jdr = None
+    jtag.data_write_axi_jdr = None
+    jtag.ctrl_axi_jdr = None
+    return profile
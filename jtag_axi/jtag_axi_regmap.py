@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_regmap.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import json
+from contextlib import contextmanager
+from .jtag_base import AccessMode, JTAGToAXIStatus
+
+# Access strings accepted in register descriptions (SVD ones included)
+ACCESS_ALIASES = {
+    "rw": AccessMode.RW,
+    "ro": AccessMode.RO,
+    "wo": AccessMode.WO,
+    "read-write": AccessMode.RW,
+    "read-only": AccessMode.RO,
+    "write-only": AccessMode.WO,
+}
+
+
+def _int(value):
+    return int(value, 0) if isinstance(value, str) else int(value)
+
+
+def _size(desc, default):
+    # Register size in bytes, from "bytes" or the SVD "size" (in bits)
+    if "bytes" in desc:
+        return _int(desc["bytes"])
+    if "size" in desc:
+        bits = _int(desc["size"])
+        if bits <= 0 or bits % 8:
+            raise ValueError(
+                f"[JTAG_to_AXI] Register size of {bits} bits is not a whole"
+                f" number of bytes"
+            )
+        return bits // 8
+    return default
+
+
+def _access(value, default=AccessMode.RW):
+    if value is None:
+        return default
+    if isinstance(value, AccessMode):
+        return value
+    try:
+        return ACCESS_ALIASES[str(value).lower()]
+    except KeyError:
+        raise ValueError(f"[JTAG_to_AXI] Unknown register access mode {value}")
+
+
+class Field:
+    """Bit field of a register, mask and shift are computed once."""
+
+    def __init__(self, name: str, offset: int, width: int = 1, access=None):
+        self.name = name
+        self.offset = offset
+        self.width = width
+        self.access = access
+        self.max = (1 << width) - 1
+        self.mask = self.max << offset
+
+    @classmethod
+    def from_dict(cls, desc, access):
+        if "bits" in desc:
+            bits = str(desc["bits"]).strip("[]").split(":")
+            msb, lsb = _int(bits[0]), _int(bits[-1])
+            offset, width = lsb, msb - lsb + 1
+        else:
+            offset = _int(desc.get("offset", desc.get("bitOffset", 0)))
+            width = _int(desc.get("width", desc.get("bitWidth", 1)))
+        return cls(desc["name"], offset, width, _access(desc.get("access"), access))
+
+    def encode(self, value: int):
+        if value > self.max or value < 0:
+            raise ValueError(
+                f"[JTAG_to_AXI] Value {value} does not fit in field {self.name}"
+                f" ({self.width} bits)"
+            )
+        return value << self.offset
+
+    def decode(self, reg_value: int):
+        return (reg_value & self.mask) >> self.offset
+
+
+class Register:
+    """Register description, fields are looked up by name.
+
+    Write-only and non-volatile registers (volatile=False, the design never
+    changes them behind the host) are shadowed by the register map, so a
+    read or a read-modify-write of them costs no AXI read.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        address: int,
+        size: int = 4,
+        access=AccessMode.RW,
+        reset: int = None,
+        volatile: bool = True,
+        fields=(),
+    ):
+        self.name = name
+        self.address = address
+        self.size = size
+        self.access = access
+        self.reset = reset
+        self.volatile = volatile
+        self.fields = {field.name: field for field in fields}
+        self.mask = (1 << (8 * size)) - 1
+        self.cached = access is AccessMode.WO or not volatile
+
+    @classmethod
+    def from_dict(cls, desc, base: int = 0, size: int = 4):
+        access = _access(desc.get("access"))
+        address = desc.get("address", desc.get("addressOffset"))
+        if address is None:
+            raise ValueError(f"[JTAG_to_AXI] Register {desc.get('name')} has no address")
+        reset = desc.get("reset", desc.get("resetValue"))
+        return cls(
+            name=desc["name"],
+            address=base + _int(address),
+            size=_size(desc, size),
+            access=access,
+            reset=None if reset is None else _int(reset),
+            volatile=desc.get("volatile", True),
+            fields=[Field.from_dict(field, access) for field in desc.get("fields", ())],
+        )
+
+    def field(self, name: str):
+        try:
+            return self.fields[name]
+        except KeyError:
+            raise ValueError(f"[JTAG_to_AXI] Register {self.name} has no field {name}")
+
+
+class RegisterMap:
+    """Named register/field access on top of a host driver.
+
+    Field updates can be staged (stage() or inside a batch() block) and are
+    collapsed into a single value per register. On commit() the registers
+    that need their current value are read in one pipelined batch, then all
+    of them are written in another one. A register whose staged fields cover
+    every bit, or that is shadowed, is not read at all.
+    """
+
+    def __init__(self, jtag, registers=()):
+        self.jtag = jtag
+        self.registers = {}
+        self.shadow = {}
+        self._staged = {}
+        self._batching = 0
+        for reg in registers:
+            self.add(reg)
+
+    def add(self, reg: Register):
+        if self._lane(reg) + reg.size > self.jtag.data_width // 8:
+            raise ValueError(
+                f"[JTAG_to_AXI] Register {reg.name} does not fit in one AXI bus word"
+            )
+        self.registers[reg.name] = reg
+        if reg.cached and reg.reset is not None:
+            self.shadow[reg.name] = reg.reset
+
+    @classmethod
+    def from_dict(cls, jtag, desc):
+        """Build from {"base": .., "registers": [..]}, also accepts the SVD
+        style key names (baseAddress, addressOffset, resetValue, bitOffset,
+        bitWidth, size). Register sizes are given in bytes with "bytes", or in
+        bits with the SVD "size", and default to the bus width."""
+        base = _int(desc.get("base", desc.get("baseAddress", 0)))
+        size = _size(desc, jtag.data_width // 8)
+        return cls(
+            jtag,
+            [Register.from_dict(reg, base, size) for reg in desc.get("registers", ())],
+        )
+
+    @classmethod
+    def load(cls, jtag, path):
+        """Load a JSON or YAML (needs PyYAML) register description."""
+        with open(path, "r") as fh:
+            if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ImportError(
+                        "[JTAG_to_AXI] PyYAML is required to load YAML register maps"
+                    )
+                desc = yaml.safe_load(fh)
+            else:
+                desc = json.load(fh)
+        return cls.from_dict(jtag, desc)
+
+    def __getitem__(self, name: str):
+        try:
+            return self.registers[name]
+        except KeyError:
+            raise ValueError(f"[JTAG_to_AXI] Unknown register {name}")
+
+    # AXI access, with the register lanes placed on the bus byte lanes
+    def _lane(self, reg):
+        return reg.address % (self.jtag.data_width // 8)
+
+    def _check(self, reg, status_axi, op):
+        if status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+            raise RuntimeError(
+                f"[JTAG_to_AXI] Register {reg.name} {op} failed: {status_axi.status.name}"
+            )
+
+    def _read(self, regs):
+        values = {}
+        by_size = {}
+        for reg in regs:
+            by_size.setdefault(reg.size, []).append(reg)
+        for size, group in by_size.items():
+            results = self.jtag.read_axi_batch([reg.address for reg in group], size=size)
+            for reg, status_axi in zip(group, results):
+                self._check(reg, status_axi, "read")
+                value = (status_axi.data_rd >> (8 * self._lane(reg))) & reg.mask
+                values[reg.name] = value
+                if reg.cached:
+                    self.shadow[reg.name] = value
+        return values
+
+    def _write(self, values):
+        by_size = {}
+        for name, value in values.items():
+            reg = self.registers[name]
+            lane = self._lane(reg)
+            by_size.setdefault(reg.size, []).append(
+                (reg, (value << (8 * lane), ((1 << reg.size) - 1) << lane))
+            )
+        for size, group in by_size.items():
+            results = self.jtag.write_axi_batch(
+                [(reg.address,) + write for reg, write in group], size=size
+            )
+            for (reg, _), status_axi in zip(group, results):
+                self._check(reg, status_axi, "write")
+                if reg.cached:
+                    self.shadow[reg.name] = values[reg.name]
+
+    # Reads
+    def read_many(self, names):
+        """Read registers, shadowed ones come from the cache, the others in
+        one pipelined batch. Returns {name: value}."""
+        values = {}
+        pending = []
+        for name in names:
+            reg = self[name]
+            if reg.access is AccessMode.WO and name not in self.shadow:
+                raise ValueError(
+                    f"[JTAG_to_AXI] Write-only register {name} was never written"
+                )
+            if name in self.shadow:
+                values[name] = self.shadow[name]
+            else:
+                pending.append(reg)
+        values.update(self._read(pending))
+        return values
+
+    def read(self, name: str):
+        return self.read_many([name])[name]
+
+    def read_field(self, name: str, field: str):
+        return self[name].field(field).decode(self.read(name))
+
+    # Writes
+    def write(self, name: str, value: int):
+        """Write a whole register (discards anything staged for it)."""
+        reg = self[name]
+        if reg.access is AccessMode.RO:
+            raise ValueError(f"[JTAG_to_AXI] Register {name} is read-only")
+        if value > reg.mask:
+            raise ValueError(f"[JTAG_to_AXI] Value {value:#x} does not fit in {name}")
+        self._staged.pop(name, None)
+        self._write({name: value})
+
+    def stage(self, name: str, **fields):
+        """Stage field updates, they are written on commit()."""
+        reg = self[name]
+        if reg.access is AccessMode.RO:
+            raise ValueError(f"[JTAG_to_AXI] Register {name} is read-only")
+        mask, value = self._staged.get(name, (0, 0))
+        for field_name, field_value in fields.items():
+            field = reg.field(field_name)
+            if field.access is AccessMode.RO:
+                raise ValueError(
+                    f"[JTAG_to_AXI] Field {name}.{field_name} is read-only"
+                )
+            mask |= field.mask
+            value = (value & ~field.mask) | field.encode(field_value)
+        self._staged[name] = (mask, value)
+
+    def commit(self):
+        """Write every staged register: one read batch for the registers whose
+        other bits are unknown, then one write batch."""
+        staged, self._staged = self._staged, {}
+        need_read = []
+        for name, (mask, _) in staged.items():
+            reg = self.registers[name]
+            if mask != reg.mask and name not in self.shadow:
+                if reg.access is AccessMode.WO:
+                    raise ValueError(
+                        f"[JTAG_to_AXI] Partial update of write-only register {name}"
+                        " with unknown value"
+                    )
+                need_read.append(reg)
+        current = self._read(need_read)
+        values = {}
+        for name, (mask, value) in staged.items():
+            old = current.get(name, self.shadow.get(name, 0))
+            values[name] = (old & ~mask) | value
+        if values:
+            self._write(values)
+        return values
+
+    def set(self, name: str, **fields):
+        """Read-modify-write of some fields of a register, only staged when
+        called inside a batch() block."""
+        self.stage(name, **fields)
+        if not self._batching:
+            self.commit()
+
+    @contextmanager
+    def batch(self):
+        """Collapse every set() inside the block and commit them together."""
+        self._batching += 1
+        try:
+            yield self
+        except Exception:
+            self._staged.clear()
+            raise
+        finally:
+            self._batching -= 1
+        if not self._batching:
+            self.commit()
+
+    def invalidate(self, name: str = None):
+        """Drop the shadow value of a register (all of them when None)."""
+        if name is None:
+            self.shadow.clear()
+        else:
+            self.shadow.pop(name, None)
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_sampler.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import sys
+import time
+import struct
+import logging
+import threading
+from array import array
+from collections import namedtuple
+from .jtag_base import TxnType, bits_to_ff_hex
+
+log = logging.getLogger(__name__)
+
+SAMPLER_MAGIC = b"JAXS"
+SAMPLER_VERSION = 1
+# magic, version, number of addresses, data width
+SAMPLER_HEADER = struct.Struct("<4sHHH")
+SAMPLER_BLOCK = struct.Struct("<I")
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+# Room left in the .npy header for the final sample count
+NPY_HEADER_LEN = 256
+# Samples kept in the ring buffer between the sampler and the writer thread
+SAMPLER_CAPACITY = 4096
+
+# Returned by Sampler.run(), dropped lists (start, end, samples) intervals
+SampleReport = namedtuple("SampleReport", "samples seconds rate dropped intervals")
+
+
+def _npy_header(columns: int, count: int):
+    descr = [("timestamp", "<f8"), ("data", "<u8", (columns,)), ("status", "|u1", (columns,))]
+    header = repr({"descr": descr, "fortran_order": False, "shape": (count,)})
+    header = header.encode("latin1")
+    # Magic + header length + dict, padded with spaces and ended by \n
+    pad = NPY_HEADER_LEN - len(NPY_MAGIC) - 2 - len(header) - 1
+    return NPY_MAGIC + struct.pack("<H", NPY_HEADER_LEN - 10) + header + b" " * pad + b"\n"
+
+
+def _little(values):
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class _ColumnWriter:
+    # Header with the address list, then one block per flush: sample count,
+    # timestamps (f64), data (u64) and status (u8), column after column.
+    def __init__(self, fh, addresses, data_width):
+        self.fh = fh
+        fh.write(SAMPLER_HEADER.pack(SAMPLER_MAGIC, SAMPLER_VERSION, len(addresses), data_width))
+        fh.write(_little(array("Q", addresses)))
+
+    def write(self, timestamps, columns, status):
+        self.fh.write(SAMPLER_BLOCK.pack(len(timestamps)))
+        self.fh.write(_little(timestamps))
+        for column in columns:
+            self.fh.write(_little(column))
+        for column in status:
+            self.fh.write(column.tobytes())
+
+    def close(self, count):
+        pass
+
+
+class _NpyWriter:
+    # Structured .npy records (timestamp, data[n], status[n]), the shape in
+    # the header is patched with the sample count on close.
+    def __init__(self, fh, addresses, data_width):
+        self.fh = fh
+        self.columns = len(addresses)
+        fh.write(_npy_header(self.columns, 0))
+
+    def write(self, timestamps, columns, status):
+        rows = bytearray()
+        for idx, timestamp in enumerate(timestamps):
+            rows += struct.pack("<d", timestamp)
+            rows += struct.pack(f"<{self.columns}Q", *(column[idx] for column in columns))
+            rows += bytes(column[idx] for column in status)
+        self.fh.write(rows)
+
+    def close(self, count):
+        self.fh.seek(0)
+        self.fh.write(_npy_header(self.columns, count))
+
+
+def read_samples(path):
+    """Load a Sampler column file, returns (addresses, timestamps, data,
+    status) with one array per address in data and status."""
+    with open(path, "rb") as fh:
+        magic, version, count, data_width = SAMPLER_HEADER.unpack(
+            fh.read(SAMPLER_HEADER.size)
+        )
+        if magic != SAMPLER_MAGIC or version != SAMPLER_VERSION:
+            raise ValueError(f"[JTAG_to_AXI] {path} is not a sampler file")
+
+        def read(typecode, length):
+            values = array(typecode)
+            values.frombytes(fh.read(length * values.itemsize))
+            if sys.byteorder != "little":
+                values.byteswap()
+            return values
+
+        addresses = list(read("Q", count))
+        timestamps = array("d")
+        data = [array("Q") for _ in addresses]
+        status = [array("B") for _ in addresses]
+        while True:
+            block = fh.read(SAMPLER_BLOCK.size)
+            if len(block) < SAMPLER_BLOCK.size:
+                break
+            (samples,) = SAMPLER_BLOCK.unpack(block)
+            timestamps += read("d", samples)
+            for column in data:
+                column += read("Q", samples)
+            for column in status:
+                column += read("B", samples)
+    return addresses, timestamps, data, status
+
+
+class Sampler:
+    """Reads a list of AXI addresses back to back as pipelined batches and
+    streams the samples to path.
+
+    Every sample is one read batch over all the addresses, stamped with the
+    host time (time.time()) taken before it is shifted. Samples go into a
+    preallocated ring buffer of capacity entries that a writer thread
+    flushes to disk: a column file (see read_samples()), or structured .npy
+    records when path ends with .npy. If the writer falls behind and the
+    ring is full, samples are dropped rather than stalling the cable, the
+    gaps are reported as dropped intervals. With period set, samples are
+    paced to it and missed periods are reported the same way.
+
+    With speculate, batches wider than the AFIFO are submitted one chunk
+    ahead (see read_axi_block), only for registers that can be read twice.
+    Connections without the raw batch path (BridgeClient) sample through
+    read_axi_batch instead and ignore speculate.
+    """
+
+    def __init__(
+        self,
+        jtag,
+        addresses,
+        path,
+        capacity: int = SAMPLER_CAPACITY,
+        period: float = None,
+        speculate: bool = False,
+    ):
+        if not addresses:
+            raise ValueError("[JTAG_to_AXI] Sampler needs at least one address")
+        if jtag.data_width > 64:
+            raise ValueError("[JTAG_to_AXI] Sampler supports data widths up to 64 bits")
+        self.jtag = jtag
+        self.addresses = list(addresses)
+        self.path = path
+        self.capacity = capacity
+        self.period = period
+        self.speculate = speculate
+        size = jtag.data_width // 8
+        self._txns = [(TxnType.AXI_READ, address, 0, size, 0) for address in self.addresses]
+        self._raw = hasattr(jtag, "_axi_batch_raw")
+        columns = len(self.addresses)
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._data = [array("Q", bytes(8 * capacity)) for _ in range(columns)]
+        self._status = [array("B", bytes(capacity)) for _ in range(columns)]
+        self._mask = bits_to_ff_hex(jtag.data_width)
+        self._head = 0
+        self._tail = 0
+        self._cond = threading.Condition()
+        self._running = False
+        self._done = False
+        self._dropping = False
+        self.samples = 0
+        self.dropped = 0
+        self.intervals = []
+
+    def _drop(self, start, end, count):
+        # Consecutive drops extend the same interval
+        self.dropped += count
+        if self._dropping:
+            first, _, total = self.intervals[-1]
+            self.intervals[-1] = (first, end, total + count)
+        else:
+            self.intervals.append((start, end, count))
+        self._dropping = True
+
+    def sample(self):
+        """Take one sample, returns False when it was dropped (ring full)."""
+        timestamp = time.time()
+        if self._raw:
+            values = self.jtag._axi_batch_raw(self._txns, speculate=self.speculate)
+        else:
+            values = [
+                status_axi.get_jdr() for status_axi in self.jtag.read_axi_batch(self.addresses)
+            ]
+        with self._cond:
+            full = self._head - self._tail >= self.capacity
+        if full:
+            for _ in values:
+                pass
+            self._drop(timestamp, time.time(), 1)
+            return False
+        slot = self._head % self.capacity
+        self._timestamps[slot] = timestamp
+        mask = self._mask
+        for column, status, value in zip(self._data, self._status, values):
+            column[slot] = (value >> 4) & mask
+            status[slot] = value & 0xF
+        with self._cond:
+            self._head += 1
+            self._cond.notify()
+        self._dropping = False
+        self.samples += 1
+        return True
+
+    def _writer(self, out):
+        while True:
+            with self._cond:
+                while self._head == self._tail and not self._done:
+                    self._cond.wait()
+                head, tail = self._head, self._tail
+                if head == tail:
+                    break
+            # At most two contiguous runs, the ring may wrap around
+            while tail < head:
+                start = tail % self.capacity
+                end = min(start + (head - tail), self.capacity)
+                out.write(
+                    self._timestamps[start:end],
+                    [column[start:end] for column in self._data],
+                    [column[start:end] for column in self._status],
+                )
+                tail += end - start
+            with self._cond:
+                self._tail = tail
+        out.close(self._tail)
+
+    def run(self, duration: float = None, samples: int = None):
+        """Sample until stop(), duration (s) or samples (taken or dropped) is
+        reached, then wait for the writer to flush everything. The file is
+        rewritten on every run. Returns a SampleReport."""
+        self.samples = self.dropped = 0
+        self.intervals = []
+        self._head = self._tail = 0
+        self._done = False
+        self._dropping = False
+        with open(self.path, "wb") as fh:
+            writer = _NpyWriter if str(self.path).endswith(".npy") else _ColumnWriter
+            out = writer(fh, self.addresses, self.jtag.data_width)
+            thread = threading.Thread(target=self._writer, args=(out,), daemon=True)
+            thread.start()
+            self._running = True
+            start = time.monotonic()
+            deadline = start
+            try:
+                while self._running:
+                    if samples is not None and self.samples + self.dropped >= samples:
+                        break
+                    now = time.monotonic()
+                    if duration is not None and now - start >= duration:
+                        break
+                    if self.period is not None:
+                        if now < deadline:
+                            time.sleep(deadline - now)
+                        elif now - deadline >= self.period:
+                            # Whole periods missed since the last sample
+                            missed = int((now - deadline) // self.period)
+                            wall = time.time()
+                            self._drop(wall - (now - deadline), wall, missed)
+                            deadline += missed * self.period
+                        deadline += self.period
+                    self.sample()
+            finally:
+                self._running = False
+                with self._cond:
+                    self._done = True
+                    self._cond.notify()
+                thread.join()
+        seconds = time.monotonic() - start
+        rate = self.samples / seconds if seconds > 0 else 0.0
+        log.info(
+            "Sampled %d addresses: %d samples in %.3f s (%.1f samples/s), %d dropped",
+            len(self.addresses),
+            self.samples,
+            seconds,
+            rate,
+            self.dropped,
+        )
+        return SampleReport(self.samples, seconds, rate, self.dropped, list(self.intervals))
+
+    def stop(self):
+        self._running = False
@@ -4,18 +4,24 @@
 # License           : MIT license <Check LICENSE>
 # Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
 # Date              : 15.09.2024
-# Last Modified Date: 30.09.2024
+# Last Modified Date: 19.10.2026
 import os
+import logging
 from .jtag_base import *
 from cocotb.triggers import ClockCycles, Timer
 from cocotb.handle import SimHandleBase
+from cocotb.utils import get_sim_time
 from enum import Enum
 
+log = logging.getLogger(__name__)
+
 
 def bin_to_num(binary_list):
-    # Join the list into a string and convert to an integer using base 2
-    binary_string = "".join(map(str, binary_list))
-    return int(binary_string, 2)
+    # MSB first list of bits (ints or cocotb logic values) to an integer
+    value = 0
+    for bit in binary_list:
+        value = (value << 1) | int(bit)
+    return value
 
 
 def bin_list(value, bits):
@@ -31,13 +37,17 @@ class SimJtagToAXI(BaseJtagToAXI):
         dut: SimHandleBase = None,
         freq: int = 1e6,
         name: str = "JTAG to AXI IP",
+        device: str = "sim:",
         **kwargs,
     ):
         """Initialize the DUT JTAG interface."""
         self.dut = dut
+        self.device = device
         self.freq_period = (1 / freq) * 1e9
 
         super().__init__(**kwargs)
+        # TMS sequence per (current, target) TAP state, found once
+        self._tap_paths = {}
 
         dut.log.info("------------------------------")
         dut.log.info("|=> JTAG Interface created <=|")
@@ -106,7 +116,10 @@ class SimJtagToAXI(BaseJtagToAXI):
         current_state = self.tap_state
 
         # Find the path from the current state to the next state
-        tms_sequence = self._find_tap_path(current_state, next_state)
+        key = (current_state, next_state)
+        if key not in self._tap_paths:
+            self._tap_paths[key] = self._find_tap_path(current_state, next_state)
+        tms_sequence = self._tap_paths[key]
 
         if tms_sequence is not None:
             # Set the new TAP state
@@ -121,12 +134,14 @@ class SimJtagToAXI(BaseJtagToAXI):
             await self._update_tck()
 
     async def _shift_ir(self, instr):
+        self._count_scans([(ScanOp.IR, instr)])
         await self._shift_tap_state(JTAGState.SHIFT_IR)
 
+        code = IR_CODES[instr]
         tdo = []
-        for idx, tdi_val in enumerate(instr.value[0][2:][::-1]):
-            self.dut.tdi.value = int(tdi_val)
-            if idx == len(instr.value[0][2:]) - 1:
+        for idx in range(4):
+            self.dut.tdi.value = (code >> idx) & 0x1
+            if idx == 3:
                 break
             self.dut.tck.value = 0
             await Timer(self.freq_period / 2, units="ns")
@@ -139,14 +154,14 @@ class SimJtagToAXI(BaseJtagToAXI):
         await self._shift_tap_state(JTAGState.RUN_TEST_IDLE)
         return tdo[::-1]
 
-    async def _shift_dr(self, jdr_value, jdr_length):
-        jdr_value = bin_list(jdr_value, jdr_length)
+    async def _shift_dr(self, jdr_value, jdr_length, park: bool = True):
+        self._count_scans([(ScanOp.DR, jdr_value, jdr_length)])
         await self._shift_tap_state(JTAGState.SHIFT_DR)
 
         tdo = []
-        for idx, tdi_val in enumerate(jdr_value[::-1]):
-            self.dut.tdi.value = int(tdi_val)
-            if idx == len(jdr_value) - 1:
+        for idx in range(jdr_length):
+            self.dut.tdi.value = (jdr_value >> idx) & 0x1
+            if idx == jdr_length - 1:
                 break
             self.dut.tck.value = 0
             await Timer(self.freq_period / 2, units="ns")
@@ -162,9 +177,17 @@ class SimJtagToAXI(BaseJtagToAXI):
         await Timer(self.freq_period / 2, units="ns")
         self.tap_state = JTAGState.EXIT1_DR
         await self._shift_tap_state(JTAGState.UPDATE_DR)
-        await self._shift_tap_state(JTAGState.RUN_TEST_IDLE)
+        if park:
+            await self._shift_tap_state(JTAGState.RUN_TEST_IDLE)
         return tdo[::-1]
 
+    async def _run_test_idle(self, cycles):
+        self._count_scans([(ScanOp.IDLE, cycles)])
+        await self._shift_tap_state(JTAGState.RUN_TEST_IDLE)
+        self.dut.tms.value = 0
+        for _ in range(cycles):
+            await self._update_tck()
+
     async def _get_idcode(self):
         tdo = await self._shift_ir(InstJTAG.IDCODE)
         tdo = await self._shift_dr(0x00, 32)
@@ -172,12 +195,12 @@ class SimJtagToAXI(BaseJtagToAXI):
 
     async def _shift_jdr(self, jdr: InstJTAG, value: int):
         tdo = await self._shift_ir(jdr)
-        tdo = await self._shift_dr(value, self._dr_length(jdr))
+        tdo = await self._shift_dr(value, self.enc.dr_length[jdr])
         return bin_to_num(tdo)
 
     async def _get_jdr(self, jdr: InstJTAG):
         tdo = await self._shift_ir(jdr)
-        length = self._dr_length(jdr)
+        length = self.enc.dr_length[jdr]
         old = bin_to_num(await self._shift_dr(0x00, length))
         tdo = await self._shift_dr(old, length)
         return old
@@ -225,12 +248,44 @@ class SimJtagToAXI(BaseJtagToAXI):
         tdo = await self._shift_jdr(InstJTAG.CTRL_AXI_REG, value.get_jdr())
         return tdo
 
+    async def _shift_ctrl_word(self, value: int):
+        # CTRL_AXI_REG word from the encoding table, returns the captured CTRL
+        self.ctrl_axi_jdr = value
+        tdo = await self._shift_jdr(InstJTAG.CTRL_AXI_REG, value)
+        return JDRCtrlAXI.from_jdr(tdo, ocup_width=self.ocup_width)
+
     async def _shift_status_axi(self, value: JDRStatusAXI):
         self.status_axi_jdr = value
         tdo = await self._shift_jdr(InstJTAG.STATUS_AXI_REG, value.get_jdr())
         return tdo
 
+    async def _poll_status(self, address, txn_type, length=None):
+        wait = self.idle_wait
+        if length is None:
+            length = self.enc.dr_length[InstJTAG.STATUS_AXI_REG]
+        cycles = 0 if wait is None else wait.first_wait(address, txn_type)
+        start = self.metrics.tck_cycles
+        polls = 0
+        while True:
+            if cycles:
+                await self._run_test_idle(cycles)
+            await self._shift_ir(InstJTAG.STATUS_AXI_REG)
+            status_axi = JDRStatusAXI.from_jdr(
+                bin_to_num(await self._shift_dr(0, length)), data_width=self.data_width
+            )
+            if status_axi.status != JTAGToAXIStatus.JTAG_RUNNING:
+                break
+            polls += 1
+            self.metrics.status_polls += 1
+            if wait is not None:
+                cycles = wait.backoff(address, txn_type, polls)
+        if wait is not None:
+            elapsed = self.metrics.tck_cycles - start - (length + 2)
+            wait.learn(address, txn_type, elapsed, polls)
+        return status_axi
+
     async def write_axi(self, address, data, size, wstrb=0xF):
+        start = get_sim_time(units="ns")
         if self.addr_axi_jdr != address:
             if address < 2**self.addr_width:
                 await self._shift_addr_axi(address)
@@ -239,7 +294,8 @@ class SimJtagToAXI(BaseJtagToAXI):
                     "Address exceeds max of address width {self.addr_width}"
                 )
         else:
-            self.dut._log.debug("Skipping address shift due to value match")
+            self.metrics.skips += 1
+            log.debug("Skipping address shift due to value match")
 
         if self.data_write_axi_jdr != data:
             if data < 2**self.data_width:
@@ -249,42 +305,46 @@ class SimJtagToAXI(BaseJtagToAXI):
                     "Data write exceeds max of data width {self.data_width}"
                 )
         else:
-            self.dut._log.debug("Skipping data shift due to value match")
+            self.metrics.skips += 1
+            log.debug("Skipping data shift due to value match")
 
         if self.wstrb_axi_jdr != wstrb:
             await self._shift_wstrb_axi(wstrb)
         else:
-            self.dut._log.debug("Skipping data shift due to value match")
+            self.metrics.skips += 1
+            log.debug("Skipping write strobe shift due to value match")
 
-        empty_ctrl = JDRCtrlAXI(start=0)
-        send_write = JDRCtrlAXI(
-            start=1, txn_type=TxnType.AXI_WRITE, size_axi=self._convert_size(size)
-        )
-        current = JDRCtrlAXI.from_jdr(await self._shift_ctrl_axi(empty_ctrl))
+        size_axi = self._convert_size(size)
+        empty_ctrl = self.enc.ctrl_idle
+        send_write = self.enc.ctrl_start[(TxnType.AXI_WRITE, size)]
+        current = await self._shift_ctrl_word(empty_ctrl)
 
         # Check whether we have enough free slots to send
-        while current.fifo_ocup >= 4:
-            await self._shift_status_axi(JDRStatusAXI())
-            current = JDRCtrlAXI.from_jdr(await self._shift_ctrl_axi(empty_ctrl))
+        while current.fifo_ocup >= self.async_fifo_depth:
+            self.metrics.fifo_polls += 1
+            await self._shift_ir(InstJTAG.STATUS_AXI_REG)
+            await self._shift_dr(0, 4)
+            current = await self._shift_ctrl_word(empty_ctrl)
 
         # Send the TXN
-        current = JDRCtrlAXI.from_jdr(await self._shift_ctrl_axi(send_write))
-        self.dut.log.info(
-            f"[JTAG to AXI][WRITE] Addr = {hex(address)} / Data = {hex(data)}"
-            f" Size = {self._convert_size(size)} / WrStrb = {bin(wstrb)}"
+        current = await self._shift_ctrl_word(send_write)
+        log.info(
+            "[WRITE] Addr = %#x / Data = %#x / Size = %s / WrStrb = %#x",
+            address,
+            data,
+            size_axi,
+            wstrb,
         )
-        status_axi = JDRStatusAXI.from_jdr(
-            await self._shift_status_axi(JDRStatusAXI(data_width=self.data_width)),
-            data_width=self.data_width,
+        status_axi = await self._poll_status(
+            address, TxnType.AXI_WRITE, self._status_length(TxnType.AXI_WRITE)
+        )
+        self._txn_done(
+            "write", address, size, status_axi, (get_sim_time(units="ns") - start) * 1e-9
         )
-        while status_axi.status == JTAGToAXIStatus.JTAG_RUNNING:
-            status_axi = JDRStatusAXI.from_jdr(
-                await self._shift_status_axi(JDRStatusAXI(data_width=self.data_width)),
-                data_width=self.data_width,
-            )
         return status_axi
 
     async def read_axi(self, address, size):
+        start = get_sim_time(units="ns")
         if self.addr_axi_jdr != address:
             if address < 2**self.addr_width:
                 await self._shift_addr_axi(address)
@@ -293,43 +353,64 @@ class SimJtagToAXI(BaseJtagToAXI):
                     "Address exceeds max of address width {self.addr_width}"
                 )
         else:
-            self.dut._log.debug("Skipping address shift due to value match")
+            self.metrics.skips += 1
+            log.debug("Skipping address shift due to value match")
 
-        empty_ctrl = JDRCtrlAXI(start=0)
-        send_write = JDRCtrlAXI(
-            start=1, txn_type=TxnType.AXI_READ, size_axi=self._convert_size(size)
-        )
-        current = JDRCtrlAXI.from_jdr(await self._shift_ctrl_axi(empty_ctrl))
+        size_axi = self._convert_size(size)
+        empty_ctrl = self.enc.ctrl_idle
+        send_read = self.enc.ctrl_start[(TxnType.AXI_READ, size)]
+        current = await self._shift_ctrl_word(empty_ctrl)
 
         # Check whether we have enough free slots to send
-        while current.fifo_ocup >= 4:
-            await self._shift_status_axi(JDRStatusAXI())
-            current = JDRCtrlAXI.from_jdr(await self._shift_ctrl_axi(empty_ctrl))
+        while current.fifo_ocup >= self.async_fifo_depth:
+            self.metrics.fifo_polls += 1
+            await self._shift_ir(InstJTAG.STATUS_AXI_REG)
+            await self._shift_dr(0, 4)
+            current = await self._shift_ctrl_word(empty_ctrl)
 
         # Send the TXN
-        current = JDRCtrlAXI.from_jdr(await self._shift_ctrl_axi(send_write))
-        self.dut.log.info(
-            f"[JTAG to AXI][READ] Addr = {hex(address)} / Size = {self._convert_size(size)}"
-        )
+        current = await self._shift_ctrl_word(send_read)
+        log.info("[READ] Addr = %#x / Size = %s", address, size_axi)
 
-        status_axi = JDRStatusAXI.from_jdr(
-            await self._shift_status_axi(JDRStatusAXI(data_width=self.data_width)),
-            data_width=self.data_width,
+        status_axi = await self._poll_status(
+            address,
+            TxnType.AXI_READ,
+            self._status_length(TxnType.AXI_READ, address, size),
+        )
+        self._txn_done(
+            "read", address, size, status_axi, (get_sim_time(units="ns") - start) * 1e-9
         )
-        while status_axi.status == JTAGToAXIStatus.JTAG_RUNNING:
-            status_axi = JDRStatusAXI.from_jdr(
-                await self._shift_status_axi(JDRStatusAXI(data_width=self.data_width)),
-                data_width=self.data_width,
-            )
         return status_axi
 
     async def write_userdata(self, value):
         self.userdata_jdr = value
         return await self._shift_jdr(InstJTAG.USERDATA, value)
 
+    async def stream_userdata(self, data):
+        """Shift data (bytes or an iterable of words) through USERDATA, going
+        from Update-DR straight to Select-DR instead of parking in idle."""
+        width = self.userdata_width
+        start = get_sim_time(units="ns")
+        await self._shift_ir(InstJTAG.USERDATA)
+        tdo, word = [], None
+        for word in pack_words(data, width):
+            if self.tap_state == JTAGState.UPDATE_DR:
+                # Select-DR, Capture-DR, Shift-DR
+                for tms in (1, 0, 0):
+                    self.dut.tms.value = tms
+                    await self._update_tck()
+                self.tap_state = JTAGState.SHIFT_DR
+            tdo.append(bin_to_num(await self._shift_dr(word, width, park=False)))
+        await self._shift_tap_state(JTAGState.RUN_TEST_IDLE)
+        if word is not None:
+            self.userdata_jdr = word
+        seconds = (get_sim_time(units="ns") - start) * 1e-9
+        bits = len(tdo) * width
+        return StreamReport(len(tdo), bits, seconds, (bits / 8) / seconds, tdo)
+
     async def write_fwd_userdata(self, value):
         self.userdata_jdr = value
-        return await self._shift_dr(value, self._dr_length(InstJTAG.USERDATA))
+        return await self._shift_dr(value, self.enc.dr_length[InstJTAG.USERDATA])
 
     async def write_read_ic_reset(self, value):
         self.ic_reset_jdr = value
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_trace.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import struct
+import time
+from .jtag_base import InstJTAG, ScanOp, scan_tck_cycles
+
+TRACE_MAGIC = b"JTAXTRC1"
+# timestamp (s), batch id, kind, instruction, length, flags
+RECORD_HEADER = struct.Struct("<dIBBHB")
+RECORD_TRUNCATED = 0x1
+# First record of a scan program
+RECORD_FIRST = 0x2
+# DR shifted before the recorder saw any IR, its instruction is unknown
+RECORD_NO_IR = 0x4
+INST_FROM_CODE = {int(inst.value[0], 2): inst for inst in InstJTAG}
+
+
+class ScanRecorder:
+    """Ring buffer of IR/DR/idle scans shifted by a host driver.
+
+    Records have a fixed size, TDI/TDO values wider than value_bytes (and
+    lengths past 16 bits) are stored truncated and flagged. Once full, the
+    oldest records are overwritten, so the oldest program kept may have
+    lost its first records. DR records carry the IR loaded when they were
+    shifted, even when an earlier program selected it. Attach it with
+    jtag.recorder = ScanRecorder(); while the driver recorder is None,
+    nothing is recorded.
+    """
+
+    def __init__(self, max_records: int = 65536, value_bytes: int = 32):
+        self.max_records = max_records
+        self.value_bytes = value_bytes
+        self.record_size = RECORD_HEADER.size + (2 * value_bytes)
+        self.buffer = bytearray(max_records * self.record_size)
+        self.count = 0  # Total records seen, including overwritten ones
+        self.batches = 0
+        self._inst = None  # IR code loaded, as far as the recorder has seen
+
+    def __len__(self):
+        return min(self.count, self.max_records)
+
+    @property
+    def dropped(self):
+        return self.count - len(self)
+
+    def clear(self):
+        self.count = 0
+        self.batches = 0
+
+    def _append(self, timestamp, kind, inst, length, tdi, tdo, flags):
+        limit = 1 << (8 * self.value_bytes)
+        if tdi >= limit or tdo >= limit or length > 0xFFFF:
+            flags |= RECORD_TRUNCATED
+        offset = (self.count % self.max_records) * self.record_size
+        RECORD_HEADER.pack_into(
+            self.buffer,
+            offset,
+            timestamp,
+            self.batches,
+            kind,
+            inst,
+            min(length, 0xFFFF),
+            flags,
+        )
+        offset += RECORD_HEADER.size
+        self.buffer[offset : offset + self.value_bytes] = (tdi % limit).to_bytes(
+            self.value_bytes, "little"
+        )
+        offset += self.value_bytes
+        self.buffer[offset : offset + self.value_bytes] = (tdo % limit).to_bytes(
+            self.value_bytes, "little"
+        )
+        self.count += 1
+
+    def record(self, timestamp, scans, tdo):
+        """Record a scan program executed at timestamp with its TDO values."""
+        tdo = iter(tdo)
+        first = RECORD_FIRST
+        for scan in scans:
+            if scan[0] is ScanOp.IR:
+                self._inst = int(scan[1].value[0], 2)
+            inst, flags = self._inst, first
+            if inst is None:
+                inst, flags = 0, flags | RECORD_NO_IR
+            if scan[0] is ScanOp.IR:
+                self._append(timestamp, ScanOp.IR.value, inst, 4, inst, 0, flags)
+            elif scan[0] is ScanOp.DR:
+                self._append(
+                    timestamp, ScanOp.DR.value, inst, scan[2], scan[1], next(tdo), flags
+                )
+            else:
+                self._append(timestamp, ScanOp.IDLE.value, inst, scan[1], 0, 0, flags)
+            first = 0
+        self.batches += 1
+
+    def __iter__(self):
+        """Yield (timestamp, batch, kind, inst, length, tdi, tdo, flags)."""
+        first = self.count - len(self)
+        for idx in range(first, self.count):
+            offset = (idx % self.max_records) * self.record_size
+            timestamp, batch, kind, inst, length, flags = RECORD_HEADER.unpack_from(
+                self.buffer, offset
+            )
+            offset += RECORD_HEADER.size
+            tdi = int.from_bytes(
+                self.buffer[offset : offset + self.value_bytes], "little"
+            )
+            offset += self.value_bytes
+            tdo = int.from_bytes(
+                self.buffer[offset : offset + self.value_bytes], "little"
+            )
+            yield (
+                timestamp,
+                batch,
+                ScanOp(kind),
+                INST_FROM_CODE[inst],
+                length,
+                tdi,
+                tdo,
+                flags,
+            )
+
+    def save(self, path):
+        """Write the records in chronological order to a binary trace file."""
+        with open(path, "wb") as fh:
+            fh.write(TRACE_MAGIC)
+            fh.write(struct.pack("<IQ", self.value_bytes, len(self)))
+            first = self.count - len(self)
+            for idx in range(first, self.count):
+                offset = (idx % self.max_records) * self.record_size
+                fh.write(self.buffer[offset : offset + self.record_size])
+
+    @classmethod
+    def load(cls, path):
+        """Read back a trace file written by save()."""
+        with open(path, "rb") as fh:
+            if fh.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+                raise ValueError(f"[JTAG_to_AXI] {path} is not a scan trace file")
+            value_bytes, count = struct.unpack("<IQ", fh.read(12))
+            recorder = cls(max_records=max(count, 1), value_bytes=value_bytes)
+            data = fh.read(count * recorder.record_size)
+        recorder.buffer[: len(data)] = data
+        recorder.count = count
+        return recorder
+
+
+def _batches(trace):
+    # Group the records back into the scan programs they were shifted with.
+    # Also yields the IR a program expects to be loaded (the one of a DR
+    # shifted before any IR scan, None otherwise) and whether the program
+    # can be shifted again as recorded: not with truncated values, nor when
+    # the ring kept only its last records or its entry IR is unknown.
+    batch, scans, expected = None, [], []
+    for timestamp, bid, kind, inst, length, tdi, tdo, flags in trace:
+        if bid != batch:
+            if scans:
+                yield current, scans, expected, entry_ir, complete
+            scans, expected = [], []
+            batch, current = bid, timestamp
+            entry_ir, complete, seen_ir = None, bool(flags & RECORD_FIRST), False
+        if flags & RECORD_TRUNCATED:
+            complete = False
+        if kind is ScanOp.IR:
+            scans.append((ScanOp.IR, inst))
+            seen_ir = True
+        elif kind is ScanOp.DR:
+            if not seen_ir and entry_ir is None:
+                entry_ir = inst
+                if flags & RECORD_NO_IR:
+                    complete = False
+            scans.append((ScanOp.DR, tdi, length))
+            expected.append(None if flags & RECORD_TRUNCATED else tdo)
+        else:
+            scans.append((ScanOp.IDLE, length))
+    if scans:
+        yield current, scans, expected, entry_ir, complete
+
+
+def _replayable(trace, report):
+    # Programs that would shift made up data are skipped (and counted), the
+    # IR left loaded in the backend is tracked to tell whether a program
+    # starting with a DR scan finds the one it was recorded with
+    ir = None
+    for timestamp, scans, expected, entry_ir, complete in _batches(trace):
+        if not complete or (entry_ir is not None and entry_ir is not ir):
+            report["skipped"] += 1
+            continue
+        for scan in scans:
+            if scan[0] is ScanOp.IR:
+                ir = scan[1]
+        yield scans, expected
+
+
+def summarize(trace):
+    """Scan counts and TCK cycles per instruction of a recorded trace."""
+    summary = {}
+    for _, _, kind, inst, length, _, _, _ in trace:
+        entry = summary.setdefault(
+            inst.name, {"ir_scans": 0, "dr_scans": 0, "idle_cycles": 0, "tck": 0}
+        )
+        if kind is ScanOp.IR:
+            entry["ir_scans"] += 1
+            entry["tck"] += scan_tck_cycles((kind, inst))
+        elif kind is ScanOp.DR:
+            entry["dr_scans"] += 1
+            entry["tck"] += scan_tck_cycles((kind, 0, length))
+        else:
+            entry["idle_cycles"] += length
+            entry["tck"] += scan_tck_cycles((kind, length))
+    return summary
+
+
+def _report(trace):
+    stamps = [record[0] for record in trace]
+    return {
+        "batches": 0,
+        "skipped": 0,
+        "scans": 0,
+        "tck_cycles": 0,
+        "mismatches": [],
+        "recorded_s": (stamps[-1] - stamps[0]) if stamps else 0.0,
+        "replay_s": 0.0,
+    }
+
+
+def replay(trace, backend):
+    """Replay a trace against a host driver (e.g. VirtualJtagToAXI).
+
+    Each recorded scan program is shifted again through backend._execute(),
+    TDO values that differ from the recorded ones are reported as
+    (batch index, DR index, expected, got). Programs with truncated records,
+    cut by the ring buffer or starting with a DR scan while another IR is
+    loaded (e.g. after one of those) are not shifted, only counted as
+    skipped.
+    """
+    report = _report(trace)
+    start = time.perf_counter()
+    for scans, expected in _replayable(trace, report):
+        tdo = backend._execute(scans)
+        for idx, (exp, got) in enumerate(zip(expected, tdo)):
+            if exp is not None and exp != got:
+                report["mismatches"].append((report["batches"], idx, exp, got))
+        report["batches"] += 1
+        report["scans"] += len(scans)
+        report["tck_cycles"] += sum(scan_tck_cycles(scan) for scan in scans)
+    report["replay_s"] = time.perf_counter() - start
+    return report
+
+
+async def replay_sim(trace, sim):
+    """Replay a trace against a SimJtagToAXI, replay_s is the sim time."""
+    from cocotb.utils import get_sim_time
+    from .jtag_axi_sim import bin_to_num
+
+    report = _report(trace)
+    start = get_sim_time(units="ns")
+    for scans, expected in _replayable(trace, report):
+        tdo = []
+        for scan in scans:
+            if scan[0] is ScanOp.IR:
+                await sim._shift_ir(scan[1])
+            elif scan[0] is ScanOp.DR:
+                tdo.append(bin_to_num(await sim._shift_dr(scan[1], scan[2])))
+            else:
+                await sim._run_test_idle(scan[1])
+        for idx, (exp, got) in enumerate(zip(expected, tdo)):
+            if exp is not None and exp != got:
+                report["mismatches"].append((report["batches"], idx, exp, got))
+        report["batches"] += 1
+        report["scans"] += len(scans)
+        report["tck_cycles"] += sum(scan_tck_cycles(scan) for scan in scans)
+    report["replay_s"] = (get_sim_time(units="ns") - start) * 1e-9
+    return report
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_transport.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import sys
+from importlib import import_module
+
+# URL scheme -> "module:class" of the driver, imported on first use
+BUILTIN_TRANSPORTS = {
+    "ftdi": "jtag_axi.jtag_axi_hw:JtagToAXIFTDI",
+    "virtual": "jtag_axi.jtag_axi_virtual:VirtualJtagToAXI",
+    "sim": "jtag_axi.jtag_axi_sim:SimJtagToAXI",
+    "xvc": "jtag_axi.jtag_axi_xvc:JtagToAXIXVC",
+    "openocd": "jtag_axi.jtag_axi_openocd:JtagToAXIOpenOCD",
+}
+# Entry point group third-party packages register their transports in, e.g.
+#   entry_points={"jtag_axi.transports": ["mycable=my_pkg.cable:MyDriver"]}
+TRANSPORT_ENTRY_POINTS = "jtag_axi.transports"
+
+_transports = dict(BUILTIN_TRANSPORTS)
+_entry_points_loaded = False
+
+
+def _iter_entry_points():
+    if sys.version_info >= (3, 8):
+        from importlib.metadata import entry_points
+
+        eps = entry_points()
+        if hasattr(eps, "select"):
+            return eps.select(group=TRANSPORT_ENTRY_POINTS)
+        return eps.get(TRANSPORT_ENTRY_POINTS, ())
+    try:
+        import pkg_resources
+    except ImportError:
+        return ()
+    return pkg_resources.iter_entry_points(TRANSPORT_ENTRY_POINTS)
+
+
+def _load_entry_points():
+    # Only the entry point metadata is read here, the modules are imported
+    # when the transport is opened. Explicit registrations take precedence.
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    for ep in _iter_entry_points():
+        _transports.setdefault(ep.name, ep)
+
+
+def url_scheme(url: str):
+    """Scheme of a transport URL: ftdi://.., sim:, virtual://, .."""
+    scheme, sep, _ = url.partition(":")
+    if not sep or not scheme:
+        raise ValueError(f"[JTAG_to_AXI] Transport URL {url!r} has no scheme")
+    return scheme.lower()
+
+
+def register_transport(scheme: str, transport):
+    """Register a driver class (or a "module:class" string, imported on
+    first use) for a URL scheme, replacing any previous one."""
+    _transports[scheme.lower()] = transport
+
+
+def transports():
+    """Schemes of every transport available, built-in and entry points."""
+    _load_entry_points()
+    return sorted(_transports)
+
+
+def get_transport(scheme: str):
+    """Driver class of a scheme, importing its module if needed."""
+    scheme = scheme.lower()
+    if scheme not in _transports:
+        _load_entry_points()
+    try:
+        transport = _transports[scheme]
+    except KeyError:
+        raise ValueError(
+            f"[JTAG_to_AXI] Unknown transport {scheme!r}, available: "
+            f"{', '.join(transports())}"
+        )
+    if isinstance(transport, str):
+        module, _, attr = transport.partition(":")
+        transport = getattr(import_module(module), attr)
+    elif hasattr(transport, "load"):
+        transport = transport.load()
+    _transports[scheme] = transport
+    return transport
+
+
+def open(url: str, **kwargs):
+    """Open a host driver from a transport URL, e.g. open("ftdi://ftdi:2232/1",
+    freq=10e6), open("virtual://") or open("sim:", dut=dut). The keyword
+    arguments go to the driver constructor, along with device=url."""
+    return get_transport(url_scheme(url))(device=url, **kwargs)
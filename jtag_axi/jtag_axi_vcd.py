@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_vcd.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import time
+import shutil
+import subprocess
+from .jtag_base import IR_CODES, InstJTAG, JTAGState, ScanOp
+from .jtag_axi_trace import _batches
+from .jtag_axi_xvc import TapBitModel
+
+# Same hierarchy as jtag_axi_wrapper_tb, so the docs/gtkwave layouts
+# (waves_axi.gtkw, waves_3.gtkw) pick the host signals up
+VCD_TOP = "jtag_axi_wrapper_tb"
+VCD_TAP_SCOPE = ("u_jtag_axi_wrapper", "u_jtag_tap_wrapper", "u_instruction_register")
+# VCD identifier codes
+VCD_TRSTN, VCD_TCK, VCD_TMS, VCD_TDI, VCD_TDO, VCD_STATE, VCD_IR = "!\"#$%&'"
+
+
+def scan_vectors(scans, tdo, state=JTAGState.RUN_TEST_IDLE):
+    """TCK by TCK (tms, tdi, tdo) of a scan program starting from state
+    (Test-Logic-Reset, Run-Test/Idle or Update-DR/IR), as the transports
+    shift it: IR scans take 9 TCKs, DR scans length + 4, idle cycles + 1
+    (see scan_tck_cycles). tdo holds the captured value of every DR scan,
+    None where it is unknown (shown as x)."""
+    tdo = iter(tdo)
+    for scan in scans:
+        lead = [0] if state is JTAGState.TEST_LOGIC_RESET else []
+        if scan[0] is ScanOp.IR:
+            code = IR_CODES[scan[1]]
+            # Select-DR, Select-IR, Capture-IR, Shift-IR
+            for tms in lead + [1, 1, 0, 0]:
+                yield tms, 0, 0
+            for bit in range(4):
+                yield int(bit == 3), (code >> bit) & 0x1, (TapBitModel.IR_CAPTURE >> bit) & 0x1
+            yield 1, 0, 0
+            state = JTAGState.UPDATE_IR
+        elif scan[0] is ScanOp.DR:
+            value, length = scan[1], scan[2]
+            captured = next(tdo, None)
+            # Select-DR, Capture-DR, Shift-DR
+            for tms in lead + [1, 0, 0]:
+                yield tms, 0, 0
+            for bit in range(length):
+                out = None if captured is None else (captured >> bit) & 0x1
+                yield int(bit == length - 1), (value >> bit) & 0x1, out
+            yield 1, 0, 0
+            state = JTAGState.UPDATE_DR
+        else:
+            cycles = scan[1] + (0 if state is JTAGState.RUN_TEST_IDLE else 1)
+            for _ in range(cycles):
+                yield 0, 0, 0
+            state = JTAGState.RUN_TEST_IDLE
+
+
+class VCDRecorder:
+    """Writes the scan programs of a host driver as TCK/TMS/TDI/TDO
+    waveforms, with the TAP state decoded with the tap_ctrl_fsm_t encoding
+    of jtag_axi_pkg.sv (JTAGState) and the IR the design holds.
+
+    Attach it as jtag.recorder = VCDRecorder("host.vcd", freq=jtag.freq)
+    and close() it at the end. Signals follow the jtag_axi_wrapper_tb
+    hierarchy, so a hardware session opens with the docs/gtkwave layouts
+    and lines up with the simulation dumps. TCK toggles at freq. With
+    realtime, every program starts at its host timestamp, so the TCK gaps
+    between programs show the host/USB time. A path ending in .fst is
+    converted with vcd2fst (GTKWave) on close.
+    """
+
+    def __init__(self, path, freq: float = 1e6, realtime: bool = True):
+        self.path = path
+        self.fst = str(path).endswith(".fst")
+        if self.fst and shutil.which("vcd2fst") is None:
+            raise RuntimeError("[JTAG_to_AXI] vcd2fst (GTKWave) is needed for FST output")
+        self.vcd_path = f"{path}.vcd" if self.fst else path
+        # Time unit is 1 ns, a TCK period is at least 2 of them
+        self.half_period = max(1, int(round(5e8 / freq)))
+        self.realtime = realtime
+        self.state = JTAGState.RUN_TEST_IDLE
+        self.ir = IR_CODES[InstJTAG.IDCODE]
+        self._shift_ir = 0
+        self.time = 0
+        self._written = 0
+        self.cycles = 0
+        self.batches = 0
+        self._t0 = None
+        self._values = {}
+        self._fh = open(self.vcd_path, "w")
+        self._header()
+
+    def _header(self):
+        fh = self._fh
+        fh.write(f"$date {time.strftime('%Y-%m-%d %H:%M:%S')} $end\n")
+        fh.write("$version jtag_axi host scan recorder $end\n")
+        fh.write("$timescale 1ns $end\n")
+        fh.write(f"$scope module {VCD_TOP} $end\n")
+        for code, name in (
+            (VCD_TRSTN, "trstn"),
+            (VCD_TCK, "tck"),
+            (VCD_TMS, "tms"),
+            (VCD_TDI, "tdi"),
+            (VCD_TDO, "tdo"),
+        ):
+            fh.write(f"$var wire 1 {code} {name} $end\n")
+        for scope in VCD_TAP_SCOPE:
+            fh.write(f"$scope module {scope} $end\n")
+        fh.write(f"$var wire 4 {VCD_STATE} tap_state [3:0] $end\n")
+        fh.write(f"$var wire 4 {VCD_IR} ir_ff [3:0] $end\n")
+        fh.write("$upscope $end\n" * (len(VCD_TAP_SCOPE) + 1))
+        fh.write("$enddefinitions $end\n#0\n$dumpvars\n")
+        self._change(VCD_TRSTN, 1)
+        self._change(VCD_TCK, 0)
+        self._change(VCD_TMS, 0)
+        self._change(VCD_TDI, 0)
+        self._change(VCD_TDO, 0)
+        self._change(VCD_STATE, self.state.value)
+        self._change(VCD_IR, self.ir)
+        fh.write("$end\n")
+
+    def _change(self, code, value):
+        if self._values.get(code, -1) == value:
+            return
+        self._values[code] = value
+        if code in (VCD_STATE, VCD_IR):
+            self._fh.write(f"b{value:04b} {code}\n")
+        else:
+            self._fh.write(f"{'x' if value is None else value}{code}\n")
+
+    def _at(self, timestamp):
+        if timestamp != self._written:
+            self._fh.write(f"#{timestamp}\n")
+            self._written = timestamp
+
+    def record(self, timestamp, scans, tdo):
+        """Same interface as ScanRecorder.record()."""
+        if self.realtime:
+            if self._t0 is None:
+                self._t0 = timestamp
+            self.time = max(self.time, int((timestamp - self._t0) * 1e9))
+        half = self.half_period
+        for tms, tdi, tdo_bit in scan_vectors(scans, tdo, self.state):
+            # TMS/TDI/TDO settle while TCK is low, the TAP moves on its rise
+            self._at(self.time)
+            self._change(VCD_TCK, 0)
+            self._change(VCD_TMS, tms)
+            self._change(VCD_TDI, tdi)
+            self._change(VCD_TDO, tdo_bit)
+            self._at(self.time + half)
+            self._change(VCD_TCK, 1)
+            if self.state is JTAGState.CAPTURE_IR:
+                self._shift_ir = TapBitModel.IR_CAPTURE
+            elif self.state is JTAGState.SHIFT_IR:
+                self._shift_ir = (self._shift_ir >> 1) | (tdi << 3)
+            self.state = TapBitModel.NEXT[self.state][tms]
+            self._change(VCD_STATE, self.state.value)
+            if self.state is JTAGState.UPDATE_IR:
+                self.ir = self._shift_ir
+                self._change(VCD_IR, self.ir)
+            elif self.state is JTAGState.TEST_LOGIC_RESET:
+                self.ir = IR_CODES[InstJTAG.IDCODE]
+                self._change(VCD_IR, self.ir)
+            self.time += 2 * half
+            self.cycles += 1
+        self._at(self.time)
+        self._change(VCD_TCK, 0)
+        self.batches += 1
+
+    def close(self):
+        """Finish the file (and convert it to FST if asked)."""
+        if self._fh is None:
+            return
+        self._at(self.time + self.half_period)
+        self._fh.close()
+        self._fh = None
+        if self.fst:
+            subprocess.check_call(
+                ["vcd2fst", self.vcd_path, str(self.path)], stdout=subprocess.DEVNULL
+            )
+            os.remove(self.vcd_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def trace_to_vcd(trace, path, freq: float = 1e6, realtime: bool = True):
+    """Convert a ScanRecorder trace (live or loaded) to a VCD/FST file."""
+    with VCDRecorder(path, freq=freq, realtime=realtime) as vcd:
+        for timestamp, scans, expected, _, _ in _batches(trace):
+            vcd.record(timestamp, scans, expected)
+    return vcd
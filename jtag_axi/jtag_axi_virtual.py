@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_virtual.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+from collections import deque
+from .jtag_base import *
+from .jtag_axi_driver import JtagToAXIDriver
+
+IDCODE_VAL = 0xBADC0FFE
+
+
+class VirtualTap:
+    """Register level model of the jtag_axi design with an AXI memory behind.
+
+    It follows jtag_axi_data_registers.sv / jtag_axi_dispatch.sv at scan
+    granularity: every DR scan captures, shifts (possibly fewer or more bits
+    than the register length) and updates the register selected by the IR.
+    AXI txns complete latency TCK cycles after they reach the head of the
+    request FIFO, addresses beyond mem_size reply with SLVERR.
+    """
+
+    def __init__(
+        self,
+        addr_width: int = 32,
+        data_width: int = 32,
+        async_fifo_depth: int = 4,
+        ic_reset_width: int = 4,
+        userdata_width: int = 4,
+        idcode: int = IDCODE_VAL,
+        usercode: int = 0,
+        mem_size: int = 64 * 1024,
+        latency=8,
+    ):
+        self.addr_width = addr_width
+        self.data_width = data_width
+        self.async_fifo_depth = async_fifo_depth
+        self.ic_reset_width = ic_reset_width
+        self.userdata_width = userdata_width
+        self.idcode = idcode
+        self.usercode = usercode
+        self.mem = bytearray(mem_size)
+        # Either a fixed number of TCK cycles or fn(addr, txn_type) -> cycles
+        self.latency = latency
+        self.usercode_updates = 0
+        self.userdata_updates = 0
+        # Optional model of the logic behind usercode_i/userdata_o, with
+        # usercode(), usercode_update() and userdata_update(value) methods
+        self.sideband = None
+        self.tck = 0
+        self.reset()
+
+    def reset(self):
+        """TAP reset (trstn), JTAG clock domain registers go to their defaults."""
+        self.ir = InstJTAG.IDCODE
+        self.addr = 0
+        self.data_wr = 0
+        self.wstrb = (1 << (self.data_width // 8)) - 1
+        self.ctrl = 0
+        self.ic_rst = 0
+        self.userdata = 0
+        self.req_fifo = deque()
+        self.resp_fifo = deque()
+        self._busy_until = 0
+
+    def _ocup_width(self):
+        return self.async_fifo_depth.bit_length()
+
+    def _reg_length(self, ir):
+        return {
+            InstJTAG.BYPASS: 1,
+            InstJTAG.EXTEST: 1,
+            InstJTAG.IDCODE: 32,
+            InstJTAG.USERCODE: 32,
+            InstJTAG.SAMPLE_PRELOAD: max(self.data_width + 4, self.addr_width),
+            InstJTAG.IC_RESET: self.ic_reset_width,
+            InstJTAG.USERDATA: self.userdata_width,
+            InstJTAG.ADDR_AXI_REG: self.addr_width,
+            InstJTAG.DATA_W_AXI_REG: self.data_width,
+            InstJTAG.WSTRB_AXI_REG: self.data_width // 8,
+            InstJTAG.CTRL_AXI_REG: 5 + self._ocup_width(),
+            InstJTAG.STATUS_AXI_REG: self.data_width + 4,
+        }[ir]
+
+    def _status(self):
+        if self.resp_fifo:
+            status, data = self.resp_fifo[0]
+            return (data << 4) | status.value
+        if self.req_fifo:
+            return JTAGToAXIStatus.JTAG_RUNNING.value
+        return JTAGToAXIStatus.JTAG_IDLE.value
+
+    def _capture(self, ir):
+        if ir is InstJTAG.IDCODE:
+            return self.idcode
+        if ir is InstJTAG.USERCODE:
+            if self.sideband is not None:
+                return self.sideband.usercode()
+            return self.usercode
+        if ir is InstJTAG.IC_RESET:
+            return self.ic_rst
+        if ir is InstJTAG.USERDATA:
+            return self.userdata
+        if ir is InstJTAG.ADDR_AXI_REG:
+            return self.addr
+        if ir is InstJTAG.DATA_W_AXI_REG:
+            return self.data_wr
+        if ir is InstJTAG.WSTRB_AXI_REG:
+            return self.wstrb
+        if ir is InstJTAG.CTRL_AXI_REG:
+            ocup_mask = (1 << self._ocup_width()) - 1
+            return (self.ctrl & ~(ocup_mask << 3)) | (len(self.req_fifo) << 3)
+        if ir is InstJTAG.STATUS_AXI_REG:
+            return self._status()
+        return 0
+
+    def _update(self, ir, value):
+        if ir is InstJTAG.IC_RESET:
+            self.ic_rst = value
+        elif ir is InstJTAG.USERDATA:
+            self.userdata = value
+            self.userdata_updates += 1
+            if self.sideband is not None:
+                self.sideband.userdata_update(value)
+        elif ir is InstJTAG.USERCODE:
+            self.usercode_updates += 1
+            if self.sideband is not None:
+                self.sideband.usercode_update()
+        elif ir is InstJTAG.ADDR_AXI_REG:
+            self.addr = value
+        elif ir is InstJTAG.DATA_W_AXI_REG:
+            self.data_wr = value
+        elif ir is InstJTAG.WSTRB_AXI_REG:
+            self.wstrb = value
+        elif ir is InstJTAG.CTRL_AXI_REG:
+            self.ctrl = value
+            ctrl = JDRCtrlAXI.from_jdr(value, ocup_width=self._ocup_width())
+            if ctrl.start and len(self.req_fifo) < self.async_fifo_depth:
+                self._push_req(ctrl)
+        elif ir is InstJTAG.STATUS_AXI_REG:
+            if self.resp_fifo:
+                self.resp_fifo.popleft()
+
+    def _push_req(self, ctrl):
+        if callable(self.latency):
+            latency = self.latency(self.addr, ctrl.txn_type)
+        else:
+            latency = self.latency
+        start = max(self.tck, self._busy_until)
+        self._busy_until = start + latency
+        self.req_fifo.append(
+            (
+                self._busy_until,
+                ctrl.txn_type,
+                self.addr,
+                self.data_wr,
+                self.wstrb,
+                ctrl.size_axi,
+            )
+        )
+
+    def _complete(self, txn_type, addr, data, wstrb, size):
+        bus_bytes = self.data_width // 8
+        aligned = addr & ~(bus_bytes - 1)
+        if aligned + bus_bytes > len(self.mem):
+            return (JTAGToAXIStatus.JTAG_AXI_SLVERR, 0)
+        if txn_type is TxnType.AXI_WRITE:
+            lanes = data.to_bytes(bus_bytes, "little")
+            for lane in range(bus_bytes):
+                if (wstrb >> lane) & 0x1:
+                    self.mem[aligned + lane] = lanes[lane]
+            return (JTAGToAXIStatus.JTAG_AXI_OKAY, 0)
+        word = int.from_bytes(self.mem[aligned : aligned + bus_bytes], "little")
+        return (JTAGToAXIStatus.JTAG_AXI_OKAY, word)
+
+    def _advance(self, cycles):
+        self.tck += cycles
+        while (
+            self.req_fifo
+            and self.req_fifo[0][0] <= self.tck
+            and len(self.resp_fifo) < self.async_fifo_depth
+        ):
+            req = self.req_fifo.popleft()
+            self.resp_fifo.append(self._complete(*req[1:]))
+
+    def execute(self, scans):
+        """Run a scan program, returns the TDO value of every ScanOp.DR entry."""
+        tdo = []
+        for scan in scans:
+            if scan[0] is ScanOp.IR:
+                self._advance(scan_tck_cycles(scan))
+                self.ir = scan[1]
+            elif scan[0] is ScanOp.DR:
+                value, length = scan[1], scan[2]
+                reg_length = self._reg_length(self.ir)
+                # Select-DR, Capture-DR
+                self._advance(2)
+                value &= (1 << length) - 1
+                combined = self._capture(self.ir) | (value << reg_length)
+                tdo.append(combined & ((1 << length) - 1))
+                self._advance(length + 2)
+                self._update(self.ir, (combined >> length) & ((1 << reg_length) - 1))
+            else:
+                self._advance(scan_tck_cycles(scan))
+        return tdo
+
+    def read_mem(self, address, length):
+        return bytes(self.mem[address : address + length])
+
+    def write_mem(self, address, data):
+        self.mem[address : address + len(data)] = data
+
+
+class VirtualJtagToAXI(JtagToAXIDriver):
+    """Host driver running on top of a VirtualTap instead of an FTDI adapter."""
+
+    def __init__(self, tap: VirtualTap = None, device="virtual://", **kwargs):
+        self.tap = tap
+        super().__init__(device=device, **kwargs)
+
+    def _open(self, device, freq, trst):
+        if self.tap is None:
+            self.tap = VirtualTap(**self.get_profile())
+
+    def set_frequency(self, freq):
+        self.freq = freq
+        return self.freq
+
+    def reset(self):
+        """Reset the JTAG interface."""
+        self.tap.reset()
+
+    def _shift_scans(self, scans):
+        return self.tap.execute(scans)
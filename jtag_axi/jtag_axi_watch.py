@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_watch.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import time
+import logging
+from collections import namedtuple
+from .jtag_base import AccessMode, InstJTAG, JDRCtrlAXI, JTAGToAXIStatus, ScanOp
+from .jtag_base import JDR_SHADOWS
+
+log = logging.getLogger(__name__)
+
+WatchEvent = namedtuple("WatchEvent", "name old new timestamp")
+
+
+class _Source:
+    def __init__(self, name, mask, callback):
+        self.name = name
+        self.mask = mask
+        self.callback = callback
+        self.value = None
+
+
+class Watcher:
+    """Samples JDRs and AXI addresses at a fixed rate, reports changes only.
+
+    Every sample is one scan batch for all the watched JDRs plus pipelined
+    AXI read batches for the watched addresses. Read-only JDRs (IDCODE,
+    USERCODE) take a single scan, RW ones shift their shadow value back in
+    the same scan so no restore scan is needed. Changes are handed to the
+    source callback, to queue.put() when a queue is given, or both.
+
+    Note that every USERCODE/USERDATA scan still pulses usercode_update_o /
+    userdata_update_o in the design.
+    """
+
+    def __init__(self, jtag, rate: float = 100.0, queue=None):
+        self.jtag = jtag
+        self.rate = rate
+        self.queue = queue
+        self.samples = 0
+        self.achieved_rate = 0.0
+        self._jdrs = {}
+        self._axi = {}
+        self._running = False
+
+    def watch_jdr(self, jdr: InstJTAG, name=None, mask=None, callback=None):
+        if jdr is InstJTAG.STATUS_AXI_REG:
+            raise ValueError(
+                "[JTAG_to_AXI] STATUS_AXI_REG cannot be watched, every scan acks"
+                " an AXI response"
+            )
+        if jdr not in JDR_SHADOWS:
+            raise ValueError(f"[JTAG_to_AXI] {jdr.name} cannot be watched")
+        if jdr.value[2] is AccessMode.RW and jdr is not InstJTAG.CTRL_AXI_REG:
+            attr = JDR_SHADOWS[jdr]
+            if getattr(self.jtag, attr, None) is None:
+                setattr(self.jtag, attr, self.jtag._get_jdr(jdr))
+        self._jdrs[jdr] = _Source(name or jdr.name, mask, callback)
+
+    def watch_axi(self, address: int, name=None, mask=None, callback=None):
+        self._axi[address] = _Source(name or hex(address), mask, callback)
+
+    def unwatch(self, source):
+        """Stop watching a JDR or an AXI address."""
+        self._jdrs.pop(source, None)
+        self._axi.pop(source, None)
+
+    def _jdr_scans(self):
+        scans = []
+        for jdr in self._jdrs:
+            length = self.jtag._dr_length(jdr)
+            if jdr is InstJTAG.CTRL_AXI_REG:
+                # Never shift START, it would dispatch a new AXI txn
+                value = JDRCtrlAXI(start=0, ocup_width=self.jtag.ocup_width).get_jdr()
+            elif jdr.value[2] is AccessMode.RW:
+                value = getattr(self.jtag, JDR_SHADOWS[jdr])
+            else:
+                value = 0
+            scans += [(ScanOp.IR, jdr), (ScanOp.DR, value, length)]
+        return scans
+
+    def _report(self, source, value, timestamp, events):
+        if source.mask is not None:
+            value &= source.mask
+        if value == source.value:
+            return
+        event = WatchEvent(source.name, source.value, value, timestamp)
+        source.value = value
+        events.append(event)
+        if source.callback is not None:
+            source.callback(event)
+        if self.queue is not None:
+            self.queue.put(event)
+
+    def sample(self):
+        """Sample every source once, returns the WatchEvents of the changes."""
+        events = []
+        timestamp = time.time()
+        if self._jdrs:
+            values = self.jtag._execute(self._jdr_scans())
+            for source, value in zip(self._jdrs.values(), values):
+                self._report(source, value, timestamp, events)
+        if self._axi:
+            results = self.jtag.read_axi_batch(list(self._axi))
+            for source, status_axi in zip(self._axi.values(), results):
+                if status_axi.status != JTAGToAXIStatus.JTAG_AXI_OKAY:
+                    log.warning(
+                        "Watch %s read failed: %s", source.name, status_axi.status.name
+                    )
+                    continue
+                self._report(source, status_axi.data_rd, timestamp, events)
+        self.samples += 1
+        return events
+
+    def run(self, duration: float = None, samples: int = None):
+        """Sample at rate until stop(), duration (s) or samples is reached.
+
+        Returns the sampling rate achieved (Hz), also kept in achieved_rate.
+        """
+        period = 1.0 / self.rate
+        self._running = True
+        first = self.samples
+        start = time.monotonic()
+        deadline = start
+        while self._running:
+            if samples is not None and (self.samples - first) >= samples:
+                break
+            now = time.monotonic()
+            if duration is not None and (now - start) >= duration:
+                break
+            if now < deadline:
+                time.sleep(deadline - now)
+            self.sample()
+            # Skip the slots we are late for instead of bursting to catch up
+            deadline = max(deadline + period, time.monotonic())
+        self._running = False
+        elapsed = time.monotonic() - start
+        if elapsed > 0:
+            self.achieved_rate = (self.samples - first) / elapsed
+        return self.achieved_rate
+
+    def stop(self):
+        self._running = False
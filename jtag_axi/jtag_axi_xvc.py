@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : jtag_axi_xvc.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import socket
+import struct
+import logging
+from .jtag_base import *
+from .jtag_axi_driver import JtagToAXIDriver
+
+log = logging.getLogger(__name__)
+
+XVC_PORT = 2542
+# Bytes of TMS + TDI a shift: request may carry, as advertised by getinfo:
+XVC_MAX_VECTOR_LEN = 2048
+# Max. TDO bytes left unread on the socket before the replies are drained
+XVC_MAX_PENDING_TDO = 64 * 1024
+# TMS from Update-xR (or Run-Test/Idle): Select-DR, Select-IR, Capture-IR,
+# Shift-IR, and Select-DR, Capture-DR, Shift-DR, LSB first
+XVC_IR_HEADER = (0b0011, 4)
+XVC_DR_HEADER = (0b001, 3)
+# Five TMS=1 reach Test-Logic-Reset from anywhere, then Run-Test/Idle
+XVC_RESET_TMS = (0b011111, 6)
+U32 = struct.Struct("<I")
+
+INST_FROM_CODE = {code: inst for inst, code in IR_CODES.items()}
+
+
+def _recv_exact(sock, length: int):
+    data = bytearray()
+    while len(data) < length:
+        chunk = sock.recv(length - len(data))
+        if not chunk:
+            raise ConnectionError("[JTAG_to_AXI] XVC connection closed")
+        data += chunk
+    return bytes(data)
+
+
+def _recv_until(sock, end: bytes, limit: int = 64):
+    data = bytearray()
+    while not data.endswith(end):
+        if len(data) >= limit:
+            raise ConnectionError(f"[JTAG_to_AXI] Unexpected XVC reply {bytes(data)!r}")
+        data += _recv_exact(sock, 1)
+    return bytes(data)
+
+
+def _address(device: str):
+    # xvc://host[:port]
+    hostport = device.split("://", 1)[-1].strip("/")
+    host, sep, port = hostport.rpartition(":")
+    if sep and port.isdigit():
+        return (host or "127.0.0.1", int(port))
+    return (hostport or "127.0.0.1", XVC_PORT)
+
+
+class JtagToAXIXVC(JtagToAXIDriver):
+    """JtagToAXIDriver over a Xilinx Virtual Cable server (xvc://host:port).
+
+    A whole scan program becomes one TMS/TDI bit vector, split into as few
+    shift: requests as the server vector length allows. The requests are
+    sent back to back and their TDO replies read afterwards, so a batch
+    costs about one network round trip.
+    """
+
+    def __init__(self, device=f"xvc://127.0.0.1:{XVC_PORT}", **kwargs):
+        super().__init__(device=device, **kwargs)
+
+    def _open(self, device, freq, trst):
+        self.sock = socket.create_connection(_address(device))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.sendall(b"getinfo:")
+        info = _recv_until(self.sock, b"\n").decode().strip()
+        name, _, vector_len = info.rpartition(":")
+        if not name.startswith("xvcServer_v1") or not vector_len.isdigit():
+            raise ConnectionError(f"[JTAG_to_AXI] Not an XVC server: {info!r}")
+        self.xvc_info = name
+        # TMS and TDI vectors share the advertised length
+        self.max_shift_bits = 8 * (int(vector_len) // 2)
+        self.set_frequency(freq)
+        self.reset()
+
+    def close(self):
+        self.sock.close()
+
+    def set_frequency(self, freq):
+        """Change the TCK frequency, returns the actual frequency programmed."""
+        self.sock.sendall(b"settck:" + U32.pack(max(1, int(1e9 / freq))))
+        period = U32.unpack(_recv_exact(self.sock, U32.size))[0]
+        self.freq = 1e9 / period if period else freq
+        return self.freq
+
+    def reset(self):
+        """Reset the JTAG interface (TMS reset, then Run-Test/Idle)."""
+        tms, length = XVC_RESET_TMS
+        self._shift_vectors(tms, 0, length)
+
+    def _shift_vectors(self, tms: int, tdi: int, length: int):
+        """Shift length bits, sending every shift: request before reading the
+        replies back (up to XVC_MAX_PENDING_TDO bytes). Returns TDO as int."""
+        sock = self.sock
+        pending = []
+        pending_bytes = 0
+        tdo = 0
+        for offset in range(0, length, self.max_shift_bits):
+            bits = min(self.max_shift_bits, length - offset)
+            nbytes = (bits + 7) // 8
+            mask = (1 << bits) - 1
+            sock.sendall(
+                b"shift:"
+                + U32.pack(bits)
+                + ((tms >> offset) & mask).to_bytes(nbytes, "little")
+                + ((tdi >> offset) & mask).to_bytes(nbytes, "little")
+            )
+            pending.append((offset, nbytes))
+            pending_bytes += nbytes
+            if pending_bytes >= XVC_MAX_PENDING_TDO:
+                for offset, nbytes in pending:
+                    reply = _recv_exact(sock, nbytes)
+                    tdo |= int.from_bytes(reply, "little") << offset
+                pending, pending_bytes = [], 0
+        for offset, nbytes in pending:
+            tdo |= int.from_bytes(_recv_exact(sock, nbytes), "little") << offset
+        return tdo
+
+    def _shift_scans(self, scans):
+        """Shift a scan program as TMS/TDI vectors, parking in Run-Test/Idle."""
+        tms, tdi, pos = 0, 0, 0
+        offsets = []
+        for scan in scans:
+            if scan[0] is ScanOp.IR:
+                header, header_len = XVC_IR_HEADER
+                tms |= (header | (0b11 << (header_len + 3))) << pos
+                tdi |= IR_CODES[scan[1]] << (pos + header_len)
+                pos += header_len + 5
+            elif scan[0] is ScanOp.DR:
+                value, length = scan[1], scan[2]
+                header, header_len = XVC_DR_HEADER
+                tms |= (header | (0b11 << (header_len + length - 1))) << pos
+                tdi |= (value & ((1 << length) - 1)) << (pos + header_len)
+                offsets.append((pos + header_len, length))
+                pos += header_len + length + 1
+            else:
+                # Update-xR -> Run-Test/Idle, then the idle cycles (TMS=0)
+                pos += scan[1] + 1
+        if not scans or scans[-1][0] is not ScanOp.IDLE:
+            pos += 1
+        tdo = self._shift_vectors(tms, tdi, pos)
+        return [(tdo >> offset) & ((1 << length) - 1) for offset, length in offsets]
+
+
+class TapBitModel:
+    """Bit level IEEE 1149.1 TAP controller in front of a VirtualTap, so it
+    can be driven by TMS/TDI vectors. Every TCK advances the VirtualTap
+    clock, its registers are captured/updated through the DR states."""
+
+    # {state: (next with TMS=0, next with TMS=1)}
+    NEXT = {
+        JTAGState.TEST_LOGIC_RESET: (JTAGState.RUN_TEST_IDLE, JTAGState.TEST_LOGIC_RESET),
+        JTAGState.RUN_TEST_IDLE: (JTAGState.RUN_TEST_IDLE, JTAGState.SELECT_DR_SCAN),
+        JTAGState.SELECT_DR_SCAN: (JTAGState.CAPTURE_DR, JTAGState.SELECT_IR_SCAN),
+        JTAGState.CAPTURE_DR: (JTAGState.SHIFT_DR, JTAGState.EXIT1_DR),
+        JTAGState.SHIFT_DR: (JTAGState.SHIFT_DR, JTAGState.EXIT1_DR),
+        JTAGState.EXIT1_DR: (JTAGState.PAUSE_DR, JTAGState.UPDATE_DR),
+        JTAGState.PAUSE_DR: (JTAGState.PAUSE_DR, JTAGState.EXIT2_DR),
+        JTAGState.EXIT2_DR: (JTAGState.SHIFT_DR, JTAGState.UPDATE_DR),
+        JTAGState.UPDATE_DR: (JTAGState.RUN_TEST_IDLE, JTAGState.SELECT_DR_SCAN),
+        JTAGState.SELECT_IR_SCAN: (JTAGState.CAPTURE_IR, JTAGState.TEST_LOGIC_RESET),
+        JTAGState.CAPTURE_IR: (JTAGState.SHIFT_IR, JTAGState.EXIT1_IR),
+        JTAGState.SHIFT_IR: (JTAGState.SHIFT_IR, JTAGState.EXIT1_IR),
+        JTAGState.EXIT1_IR: (JTAGState.PAUSE_IR, JTAGState.UPDATE_IR),
+        JTAGState.PAUSE_IR: (JTAGState.PAUSE_IR, JTAGState.EXIT2_IR),
+        JTAGState.EXIT2_IR: (JTAGState.SHIFT_IR, JTAGState.UPDATE_IR),
+        JTAGState.UPDATE_IR: (JTAGState.RUN_TEST_IDLE, JTAGState.SELECT_DR_SCAN),
+    }
+    # IR capture value, IEEE 1149.1 requires the 2 LSBs to be 01
+    IR_CAPTURE = 0b0001
+
+    def __init__(self, tap):
+        self.tap = tap
+        self.state = JTAGState.TEST_LOGIC_RESET
+        self.shift = 0
+        self.length = 0
+
+    def tdo(self):
+        """TDO as driven in the current state."""
+        if self.state in (JTAGState.SHIFT_DR, JTAGState.SHIFT_IR):
+            return self.shift & 0x1
+        return 0
+
+    def clock(self, tms: int, tdi: int):
+        """One TCK, returns the TDO value sampled before the rising edge."""
+        tap = self.tap
+        state = self.state
+        tdo = self.tdo()
+        if state is JTAGState.CAPTURE_DR:
+            self.length = tap._reg_length(tap.ir)
+            self.shift = tap._capture(tap.ir)
+        elif state is JTAGState.CAPTURE_IR:
+            self.length = 4
+            self.shift = self.IR_CAPTURE
+        elif state in (JTAGState.SHIFT_DR, JTAGState.SHIFT_IR):
+            self.shift = (self.shift >> 1) | (tdi << (self.length - 1))
+        tap._advance(1)
+        self.state = self.NEXT[state][tms]
+        if self.state is JTAGState.UPDATE_DR:
+            tap._update(tap.ir, self.shift & ((1 << self.length) - 1))
+        elif self.state is JTAGState.UPDATE_IR:
+            tap.ir = INST_FROM_CODE.get(self.shift & 0xF, InstJTAG.BYPASS)
+        elif self.state is JTAGState.TEST_LOGIC_RESET:
+            tap.ir = InstJTAG.IDCODE
+        return tdo
+
+    def shift_vectors(self, tms: int, tdi: int, length: int):
+        tdo = 0
+        for idx in range(length):
+            tdo |= self.clock((tms >> idx) & 0x1, (tdi >> idx) & 0x1) << idx
+        return tdo
+
+
+class XVCServer:
+    """XVC 1.0 server in front of a VirtualTap, a stand-in for a board on a
+    remote lab machine. Serves one client at a time until close()."""
+
+    def __init__(
+        self,
+        tap,
+        host: str = "127.0.0.1",
+        port: int = XVC_PORT,
+        max_vector_len: int = XVC_MAX_VECTOR_LEN,
+    ):
+        self.tap = tap
+        self.model = TapBitModel(tap)
+        self.max_vector_len = max_vector_len
+        self.period = 1000
+        self.shifts = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((host, port))
+        self.sock.listen(1)
+        self.address = self.sock.getsockname()
+        self._running = False
+
+    def serve_forever(self):
+        self._running = True
+        while self._running:
+            try:
+                conn, peer = self.sock.accept()
+            except OSError:
+                break
+            log.info("XVC client connected from %s:%d", *peer)
+            with conn:
+                try:
+                    self.handle(conn)
+                except (ConnectionError, OSError):
+                    pass
+
+    def close(self):
+        self._running = False
+        self.sock.close()
+
+    def handle(self, conn):
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        while True:
+            cmd = _recv_until(conn, b":", limit=8)
+            if cmd == b"getinfo:":
+                conn.sendall(b"xvcServer_v1.0:%d\n" % self.max_vector_len)
+            elif cmd == b"settck:":
+                self.period = U32.unpack(_recv_exact(conn, U32.size))[0]
+                conn.sendall(U32.pack(self.period))
+            elif cmd == b"shift:":
+                length = U32.unpack(_recv_exact(conn, U32.size))[0]
+                nbytes = (length + 7) // 8
+                if 2 * nbytes > self.max_vector_len:
+                    raise ConnectionError(
+                        f"[JTAG_to_AXI] XVC shift of {length} bits exceeds the vector length"
+                    )
+                vectors = _recv_exact(conn, 2 * nbytes)
+                tms = int.from_bytes(vectors[:nbytes], "little")
+                tdi = int.from_bytes(vectors[nbytes:], "little")
+                tdo = self.model.shift_vectors(tms, tdi, length)
+                self.shifts += 1
+                conn.sendall(tdo.to_bytes(nbytes, "little"))
+            else:
+                raise ConnectionError(f"[JTAG_to_AXI] Unknown XVC command {cmd!r}")
@@ -4,9 +4,65 @@
 # License           : MIT license <Check LICENSE>
 # Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
 # Date              : 20.09.2024
-# Last Modified Date: 30.09.2024
+# Last Modified Date: 19.10.2026
+import logging
 from enum import Enum
 from abc import abstractmethod
+from functools import lru_cache
+from collections import Counter, namedtuple
+from .jtag_axi_metrics import DriverMetrics
+
+__all__ = [
+    "LOG_FORMAT",
+    "TxnEvent",
+    "StreamReport",
+    "enable_logging",
+    "AccessMode",
+    "InstJTAG",
+    "JTAGState",
+    "ScanOp",
+    "scan_tck_cycles",
+    "AXISize",
+    "TxnType",
+    "AXI_SIZES",
+    "TXN_TYPES",
+    "JDRCtrlAXI",
+    "JTAGToAXIStatus",
+    "STATUS_CODES",
+    "JTAG_IDLE_CODE",
+    "JTAG_RUNNING_CODE",
+    "pack_words",
+    "bits_to_ff_hex",
+    "JDRStatusAXI",
+    "JDR_SHADOWS",
+    "IR_CODES",
+    "EncodingTable",
+    "DEVICE_PROFILE_FIELDS",
+    "BaseJtagToAXI",
+]
+
+LOG_FORMAT = "[JTAG_to_AXI] %(message)s"
+
+# Handed to the txn hooks once an AXI txn completes, latency in seconds
+TxnEvent = namedtuple("TxnEvent", "op address size status data latency")
+# Returned by stream_userdata(), bandwidth in payload bytes/s and tdo holds
+# the value captured by each shift (USERDATA before that word was updated)
+StreamReport = namedtuple("StreamReport", "words bits seconds bandwidth tdo")
+
+
+def enable_logging(level=logging.DEBUG, handler=None):
+    """Print the jtag_axi log records, nothing is output by default.
+
+    Transactions are logged at INFO, shifts/polling details at DEBUG.
+    """
+    logger = logging.getLogger("jtag_axi")
+    if handler is None:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
+    logger.setLevel(level)
+    return logger
 
 
 class AccessMode(Enum):
@@ -52,6 +108,26 @@ class JTAGState(Enum):
     UPDATE_IR = 15
 
 
+# Scan program entries: (ScanOp.IR, InstJTAG), (ScanOp.DR, value, length)
+# or (ScanOp.IDLE, tck_cycles)
+class ScanOp(Enum):
+    IR = 0
+    DR = 1
+    IDLE = 2
+
+
+def scan_tck_cycles(scan):
+    """TCK cycles spent by a scan program entry, starting from Update-xR."""
+    if scan[0] is ScanOp.IR:
+        # Select-DR, Select-IR, Capture-IR, Shift-IR, 4 bits, Update-IR
+        return 9
+    if scan[0] is ScanOp.DR:
+        # Select-DR, Capture-DR, Shift-DR, n bits, Update-DR
+        return scan[2] + 4
+    # Run-Test/Idle, n cycles
+    return scan[1] + 1
+
+
 class AXISize(Enum):
     AXI_BYTE = 0
     AXI_HALF_WORD = 1
@@ -68,43 +144,58 @@ class TxnType(Enum):
     AXI_WRITE = 1
 
 
+# Enum members by encoding, indexing these is much cheaper than Enum(value)
+AXI_SIZES = tuple(AXISize)
+TXN_TYPES = tuple(TxnType)
+
+
 class JDRCtrlAXI:
+    __slots__ = ("start", "txn_type", "ocup_width", "fifo_ocup", "size_axi")
+
     def __init__(
         self,
         start=0,
         txn_type=TxnType.AXI_READ,
         fifo_ocup=0,
         size_axi=AXISize.AXI_BYTE,
+        ocup_width: int = 3,
     ):
         self.start = start & 0x1  # 1 bit
         self.txn_type = txn_type  # 1 bit
-        self.fifo_ocup = fifo_ocup & 0x7  # 3 bits
+        self.ocup_width = ocup_width
+        self.fifo_ocup = fifo_ocup & ((1 << ocup_width) - 1)  # clog2(depth)+1 bits
         self.size_axi = size_axi  # 3 bits
 
     def get_jdr(self):
         """
-        Packs the fields into an 8-bit register and returns the formatted value.
+        Packs the fields into an 8-bit register (default AFIFO depth of 4) and
+        returns the formatted value.
         | START [7] | TXN TYPE [6] | fifo_ocup [5:3] | SIZE_AXI [2:0] |
         """
         jdr = (
-            (self.start << 7)
-            | (self.txn_type.value << 6)
+            (self.start << (self.ocup_width + 4))
+            | (self.txn_type.value << (self.ocup_width + 3))
             | (self.fifo_ocup << 3)
             | (self.size_axi.value)
         )
         return jdr
 
     @classmethod
-    def from_jdr(cls, jdr_value):
+    def from_jdr(cls, jdr_value, ocup_width: int = 3):
         """
-        Takes an 8-bit value and decodes it into the class attributes.
+        Takes an 8-bit value (default AFIFO depth of 4) and decodes it into the
+        class attributes.
         """
-        start = (jdr_value >> 7) & 0x1
-        txn_type = TxnType((jdr_value >> 6) & 0x1)
-        fifo_ocup = (jdr_value >> 3) & 0x7
-        size_axi = AXISize(jdr_value & 0x7)
+        start = (jdr_value >> (ocup_width + 4)) & 0x1
+        txn_type = TXN_TYPES[(jdr_value >> (ocup_width + 3)) & 0x1]
+        fifo_ocup = (jdr_value >> 3) & ((1 << ocup_width) - 1)
+        size_axi = AXI_SIZES[jdr_value & 0x7]
         return cls(
-            start=start, txn_type=txn_type, fifo_ocup=fifo_ocup, size_axi=size_axi
+            start=start,
+            txn_type=txn_type,
+            fifo_ocup=fifo_ocup,
+            size_axi=size_axi,
+            ocup_width=ocup_width,
         )
 
     def __str__(self):
@@ -128,6 +219,39 @@ class JTAGToAXIStatus(Enum):
     JTAG_AXI_DECERR = 10
 
 
+STATUS_CODES = tuple(JTAGToAXIStatus)
+JTAG_IDLE_CODE = JTAGToAXIStatus.JTAG_IDLE.value
+JTAG_RUNNING_CODE = JTAGToAXIStatus.JTAG_RUNNING.value
+
+
+def pack_words(data, width: int):
+    """Split data into width bit words.
+
+    Bytes-like data is packed as a little endian bit stream (the last word is
+    zero padded), any other iterable must yield ints that fit in width bits.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        mask = (1 << width) - 1
+        acc, nbits = 0, 0
+        for byte in bytes(data):
+            acc |= byte << nbits
+            nbits += 8
+            while nbits >= width:
+                yield acc & mask
+                acc >>= width
+                nbits -= width
+        if nbits:
+            yield acc
+    else:
+        for word in data:
+            if word >> width:
+                raise ValueError(
+                    f"[JTAG_to_AXI] Word {hex(word)} does not fit in {width} bits"
+                )
+            yield word
+
+
+@lru_cache(maxsize=None)
 def bits_to_ff_hex(num_bits):
     # Calculate the number of bytes needed (each byte is 8 bits)
     num_bytes = (num_bits + 7) // 8  # Add 7 to round up to the nearest byte
@@ -139,6 +263,8 @@ def bits_to_ff_hex(num_bits):
 
 
 class JDRStatusAXI:
+    __slots__ = ("data_width", "data_rd", "status")
+
     def __init__(
         self,
         data_rd=0,
@@ -148,7 +274,10 @@ class JDRStatusAXI:
         # Mask based on the configured data width (rounded to bytes)
         self.data_width = data_width
         self.data_rd = data_rd & bits_to_ff_hex(data_width)
-        self.status = JTAGToAXIStatus(status & 0xF)  # 4 bits
+        code = status & 0xF  # 4 bits
+        if code >= len(STATUS_CODES):
+            raise ValueError(f"{code} is not a valid JTAGToAXIStatus")
+        self.status = STATUS_CODES[code]
 
     def get_jdr(self):
         """
@@ -176,6 +305,68 @@ class JDRStatusAXI:
         return False
 
 
+# Shadow attribute of the host interfaces for every JDR
+JDR_SHADOWS = {
+    InstJTAG.IDCODE: "idcode_jdr",
+    InstJTAG.USERCODE: "usercode_jdr",
+    InstJTAG.IC_RESET: "ic_reset_jdr",
+    InstJTAG.ADDR_AXI_REG: "addr_axi_jdr",
+    InstJTAG.DATA_W_AXI_REG: "data_write_axi_jdr",
+    InstJTAG.STATUS_AXI_REG: "status_axi_jdr",
+    InstJTAG.CTRL_AXI_REG: "ctrl_axi_jdr",
+    InstJTAG.WSTRB_AXI_REG: "wstrb_axi_jdr",
+    InstJTAG.USERDATA: "userdata_jdr",
+}
+
+# 4-bit IR code of every instruction
+IR_CODES = {inst: int(inst.value[0], 2) for inst in InstJTAG}
+
+
+class EncodingTable:
+    """Encodings derived from a host interface profile (DR lengths, limits,
+    AXI size codes and CTRL_AXI_REG words for every direction/size), built
+    once so the per txn work is a handful of lookups. set_profile()
+    rebuilds it."""
+
+    __slots__ = (
+        "dr_length",
+        "bus_bytes",
+        "addr_limit",
+        "data_limit",
+        "wstrb_max",
+        "size_codes",
+        "ctrl_idle",
+        "ctrl_start",
+    )
+
+    def __init__(self, jtag):
+        self.dr_length = {jdr: jtag._dr_length(jdr) for jdr in InstJTAG}
+        self.bus_bytes = jtag.data_width // 8
+        self.addr_limit = 1 << jtag.addr_width
+        self.data_limit = 1 << jtag.data_width
+        self.wstrb_max = (1 << self.bus_bytes) - 1
+        self.size_codes = {1 << size.value: size for size in AXISize}
+        ocup_width = jtag.ocup_width
+        self.ctrl_idle = JDRCtrlAXI(start=0, ocup_width=ocup_width).get_jdr()
+        self.ctrl_start = {
+            (txn_type, nbytes): JDRCtrlAXI(
+                start=1, txn_type=txn_type, size_axi=size, ocup_width=ocup_width
+            ).get_jdr()
+            for txn_type in TxnType
+            for nbytes, size in self.size_codes.items()
+        }
+
+
+# Design parameters a host interface needs to know to size every DR shift
+DEVICE_PROFILE_FIELDS = (
+    "addr_width",
+    "data_width",
+    "ic_reset_width",
+    "userdata_width",
+    "async_fifo_depth",
+)
+
+
 class BaseJtagToAXI:
     @abstractmethod
     def __init__(
@@ -203,6 +394,14 @@ class BaseJtagToAXI:
         self.userdata_jdr = 0
         self.async_fifo_depth = async_fifo_depth
         self.tap_state = JTAGState.TEST_LOGIC_RESET
+        # Optional scan recorder (see jtag_axi_trace.ScanRecorder)
+        self.recorder = None
+        self.metrics = DriverMetrics()
+        self._metrics_jdr = InstJTAG.IDCODE
+        self.txn_hooks = []
+        # Learned Run-Test/Idle waits before polling STATUS (jtag_axi_idle)
+        self.idle_wait = None
+        self.enc = EncodingTable(self)
 
         # {current_state: {next_state: [TMS_sequence]}}
         self.state_transitions = {
@@ -287,15 +486,101 @@ class BaseJtagToAXI:
         if jdr is InstJTAG.STATUS_AXI_REG:
             # STATUS = {data_rd[data_width-1:0], status[3:0]}
             return self.data_width + 4
+        if jdr is InstJTAG.CTRL_AXI_REG:
+            # CTRL = {start, txn_type, fifo_ocup[clog2(depth):0], size[2:0]}
+            return 5 + self.ocup_width
         # Default to enum-specified length
         return jdr.value[1]
 
+    @property
+    def ocup_width(self):
+        """Width of the CTRL_AXI_REG fifo_ocup field, clog2(depth)+1."""
+        return self.async_fifo_depth.bit_length()
+
+    def set_profile(self, profile):
+        """Apply a device profile (dict of widths/depth) to this interface."""
+        for attr in DEVICE_PROFILE_FIELDS:
+            if attr in profile:
+                setattr(self, attr, profile[attr])
+        self.enc = EncodingTable(self)
+
+    def get_profile(self):
+        """Return the widths/depth currently in use as a device profile."""
+        return {attr: getattr(self, attr) for attr in DEVICE_PROFILE_FIELDS}
+
+    def _count_scans(self, scans):
+        """Account a scan program in the driver metrics."""
+        metrics = self.metrics
+        for scan in scans:
+            if scan[0] is ScanOp.IR:
+                self._metrics_jdr = scan[1]
+            elif scan[0] is ScanOp.DR:
+                metrics.count_scan(self._metrics_jdr.name)
+            metrics.tck_cycles += scan_tck_cycles(scan)
+
+    def _status_length(self, txn_type, address=0, size=0):
+        """Bits of STATUS_AXI_REG worth shifting for a txn completion.
+
+        The status nibble sits in the LSBs, so writes only need those 4 bits
+        and reads the data up to the last byte lane returned (rdata comes
+        unaligned from the bus, the lane offset of address counts).
+        """
+        if txn_type is TxnType.AXI_WRITE:
+            return 4
+        bus_bytes = self.data_width // 8
+        lanes = min(bus_bytes, (address % bus_bytes) + size)
+        return 4 + (8 * lanes)
+
+    def add_txn_hook(self, hook):
+        """Call hook(event: TxnEvent) after every AXI txn."""
+        self.txn_hooks.append(hook)
+
+    def remove_txn_hook(self, hook):
+        self.txn_hooks.remove(hook)
+
+    def _txn_done(self, op, address, size, status_axi, latency):
+        self._observe_txn(
+            op, address, size, status_axi.status, status_axi.data_rd, latency
+        )
+
+    def _observe_txn(self, op, address, size, status, data, latency):
+        self.metrics.observe(op, latency, status)
+        if self.txn_hooks:
+            event = TxnEvent(op, address, size, status, data, latency)
+            for hook in self.txn_hooks:
+                hook(event)
+
+    def _observe_txns(self, txns, values, latency):
+        # A batch chunk of (TxnType, address, data, size, wstrb) txns and
+        # their raw STATUS values, all completed together. Without hooks
+        # there is no event to build, the metrics are accounted per status.
+        if self.txn_hooks:
+            data_mask = bits_to_ff_hex(self.data_width)
+            for (txn_type, address, _, size, _), value in zip(txns, values):
+                self._observe_txn(
+                    "write" if txn_type is TxnType.AXI_WRITE else "read",
+                    address,
+                    size,
+                    STATUS_CODES[value & 0xF],
+                    (value >> 4) & data_mask,
+                    latency,
+                )
+            return
+        codes = Counter((txn[0], value & 0xF) for txn, value in zip(txns, values))
+        for (txn_type, code), count in codes.items():
+            self.metrics.observe(
+                "write" if txn_type is TxnType.AXI_WRITE else "read",
+                latency,
+                STATUS_CODES[code],
+                count,
+            )
+
     def _convert_size(self, value):
         """Convert byte size into asize."""
-        for size in AXISize:
-            if (2**size.value) == value:
-                return size
-        raise ValueError(f"No asize value found for {value} number of bytes")
+        size = self.enc.size_codes.get(value)
+        if size is None:
+            raise ValueError(f"No asize value found for {value} number of bytes")
+        return size
 
     @abstractmethod
     def write_axi(self, addr, data, size):
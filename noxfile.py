@@ -29,7 +29,8 @@ def run(session):
         "pytest-split",
         "cocotb >= 1.9.0",
         "cocotbext-axi",
-        "pyftdi"
+        "pyftdi",
+        "numpy"
     )
     session.run("py.test",
                 "-n", "auto", "-rP", "tests", *session.posargs)
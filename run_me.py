@@ -4,7 +4,7 @@
 # License           : MIT license <Check LICENSE>
 # Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
 # Date              : 29.09.2024
-# Last Modified Date: 29.09.2024
+# Last Modified Date: 19.10.2026
 from jtag_axi import JtagToAXIFTDI
 import time
 import random
@@ -48,7 +48,7 @@ def main():
     jtag = JtagToAXIFTDI(
             device='ftdi://ftdi:2232:3:4/1',
             debug=False,
-            freq=10e6
+            calibrate=True
     )
     jtag.read_jdrs()
 
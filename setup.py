@@ -28,11 +28,15 @@ setup(
     },
     include_package_data=False,
     python_requires=">=3.6",
-    install_requires=["pyftdi"],
+    entry_points={
+        "console_scripts": ["jtag-axi=jtag_axi.jtag_axi_cli:main"],
+    },
     extras_require={
+        "ftdi": ["pyftdi"],
         "test": [
             "pytest",
-            "pyftdi"
+            "pyftdi",
+            "numpy"
         ],
     },
     keywords=["soc", "vip", "hdl", "verilog", "systemverilog", "jtag"],
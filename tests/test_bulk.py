@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_bulk.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import random
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import JDRCtrlAXI, JDRStatusAXI, JTAGToAXIStatus
+from jtag_axi import jtag_axi_bulk
+from jtag_axi.jtag_axi_bulk import decode_status_words
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI
+
+
+@pytest.fixture(params=["numpy", "array"])
+def decoder(request, monkeypatch):
+    # Vectorised (NumPy) and pure Python decoding
+    if request.param == "numpy":
+        np = pytest.importorskip("numpy")
+        monkeypatch.setattr(jtag_axi_bulk, "np", np)
+    else:
+        monkeypatch.setattr(jtag_axi_bulk, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("data_width", [32, 64, 128])
+def test_decode_status_words(decoder, data_width):
+    words = [
+        (random.getrandbits(data_width) << 4) | random.choice((7, 9))
+        for _ in range(100)
+    ]
+    data, status = decode_status_words(words, data_width)
+    if decoder == "numpy" and data_width < 64:
+        assert isinstance(data, jtag_axi_bulk.np.ndarray)
+    for word, got_data, got_status in zip(words, data, status):
+        ref = JDRStatusAXI.from_jdr(word, data_width=data_width)
+        assert int(got_data) == ref.data_rd
+        assert int(got_status) == ref.status.value
+
+
+def test_read_axi_block(decoder):
+    jtag = VirtualJtagToAXI()
+    # Decoded in two chunks, the last one partial
+    words = jtag_axi_bulk.BULK_DECODE_WORDS + 100
+    blob = bytes(random.getrandbits(8) for _ in range(4 * words))
+    jtag.tap.write_mem(0x100, blob)
+    block = jtag.read_axi_block(0x100, words)
+    assert len(block) == words
+    assert block.ok and block.failed() == []
+    assert block.tobytes() == blob
+    assert block[3] == JDRStatusAXI(
+        data_rd=int.from_bytes(blob[12:16], "little"), status=7
+    )
+    assert jtag.metrics.status["JTAG_AXI_OKAY"] == words
+    if decoder == "numpy":
+        assert int(block.to_numpy()["data"][3]) == block[3].data_rd
+    assert jtag.metrics.latency["read"].count == words
+    # Past the end of memory, reported one event per txn to the hooks
+    events = []
+    jtag.add_txn_hook(events.append)
+    block = jtag.read_axi_block(0xFFF8, 4)
+    assert block.failed() == [2, 3]
+    assert block[2].status == JTAGToAXIStatus.JTAG_AXI_SLVERR
+    assert [event.address for event in events] == [0xFFF8, 0xFFFC, 0x10000, 0x10004]
+    assert events[1].data == block[1].data_rd
+    assert jtag.metrics.status["JTAG_AXI_SLVERR"] == 2
+
+
+def test_slots():
+    status = JDRStatusAXI.from_jdr(0x17, data_width=32)
+    with pytest.raises(AttributeError):
+        status.extra = 1
+    with pytest.raises(ValueError):
+        JDRStatusAXI(status=0xF)
+    ctrl = JDRCtrlAXI.from_jdr(JDRCtrlAXI(start=1, ocup_width=3).get_jdr())
+    assert ctrl.start == 1
+    with pytest.raises(AttributeError):
+        ctrl.extra = 1
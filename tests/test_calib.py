@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_calib.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import json
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import ScanOp
+from jtag_axi.jtag_axi_cache import cache_load, cache_store
+from jtag_axi.jtag_axi_calib import calibrate_freq, check_scan_integrity
+from jtag_axi.jtag_axi_virtual import IDCODE_VAL, VirtualJtagToAXI, VirtualTap
+
+
+class MarginalJtagToAXI(VirtualJtagToAXI):
+    """Cable whose TDO gets corrupted above max_freq, which also leaves the
+    TAP out of step (scans are lost) until it is reset."""
+
+    def __init__(self, max_freq, **kwargs):
+        self.max_freq = max_freq
+        self.freqs = []
+        self.lost = False
+        super().__init__(**kwargs)
+
+    def set_frequency(self, freq):
+        self.freqs.append(freq)
+        return super().set_frequency(freq)
+
+    def reset(self):
+        self.freqs.append("reset")
+        self.lost = False
+        super().reset()
+
+    def _shift_scans(self, scans):
+        if self.lost:
+            return [0x1 for scan in scans if scan[0] is ScanOp.DR]
+        tdo = super()._shift_scans(scans)
+        if self.freq > self.max_freq:
+            self.lost = True
+            tdo = [value ^ 0x1 for value in tdo]
+        return tdo
+
+
+def test_scan_integrity():
+    jtag = MarginalJtagToAXI(5e6, tap=VirtualTap())
+    jtag.set_frequency(5e6)
+    assert check_scan_integrity(jtag, IDCODE_VAL)
+    jtag.set_frequency(6e6)
+    assert not check_scan_integrity(jtag, IDCODE_VAL)
+    jtag.set_frequency(1e6)
+    assert not check_scan_integrity(jtag, 0x12345678)
+
+
+def test_calibrate_sweep(tmp_path, monkeypatch):
+    monkeypatch.setenv("JTAG_AXI_CACHE", str(tmp_path))
+    tap = VirtualTap()
+    tap.userdata = 0xA
+    jtag = MarginalJtagToAXI(10e6, tap=tap)
+    freq = calibrate_freq(jtag)
+    # Stops at the first failing step (15 MHz) and resets the TAP before
+    # restoring USERDATA, then uses 10 MHz derated by 20 %
+    steps = [1e6, 2e6, 3e6, 5e6, 6e6, 7.5e6, 10e6, 15e6]
+    assert jtag.freqs == [1e6] + steps + [1e6, "reset", 8e6]
+    assert freq == jtag.freq == pytest.approx(8e6)
+    # USERDATA driven to the design survives the read-back checks
+    assert tap.userdata == jtag.userdata_jdr == 0xA
+    entry = cache_load("freq", f"virtual://:{IDCODE_VAL:#010x}")
+    assert entry == {"freq": freq, "max_ok": 10e6}
+    with open(tmp_path / "freq.json") as fh:
+        assert list(json.load(fh)) == [f"virtual://:{IDCODE_VAL:#010x}"]
+
+    assert calibrate_freq(MarginalJtagToAXI(10e6, tap=tap), margin=0.5, cache=False) == 5e6
+
+
+def test_calibrate_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("JTAG_AXI_CACHE", str(tmp_path))
+    tap = VirtualTap()
+    MarginalJtagToAXI(10e6, tap=tap, calibrate=True)
+
+    # Second connect only re-validates the cached frequency
+    updates = tap.userdata_updates
+    jtag = MarginalJtagToAXI(10e6, tap=tap, calibrate=True)
+    assert jtag.freqs == [1e6, 8e6]
+    assert tap.userdata_updates == updates
+
+    # The board got worse, the cached value fails and a new sweep runs
+    jtag = MarginalJtagToAXI(5e6, tap=tap, calibrate=True)
+    assert jtag.freqs[:4] == [1e6, 8e6, 1e6, "reset"]
+    assert jtag.freq == pytest.approx(4e6)
+    assert cache_load("freq", f"virtual://:{IDCODE_VAL:#010x}")["max_ok"] == 5e6
+
+
+def test_calibrate_fails(tmp_path, monkeypatch):
+    monkeypatch.setenv("JTAG_AXI_CACHE", str(tmp_path))
+    cache_store("freq", "other", {"freq": 1})
+    with pytest.raises(RuntimeError):
+        calibrate_freq(MarginalJtagToAXI(0.5e6, tap=VirtualTap()), cache=False)
+    assert cache_load("freq", "other") == {"freq": 1}
+    assert cache_load("freq", "missing", default=0) == 0
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_cli.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import io
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pyftdi.jtag import JtagError
+from jtag_axi.jtag_axi_cli import Session, main
+from jtag_axi.jtag_axi_daemon import OP, OP_READ, OP_WRITE
+from jtag_axi.jtag_axi_trace import ScanRecorder
+from jtag_axi.jtag_axi_transport import register_transport
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI
+
+
+def test_cli_batch_text(tmp_path, capsys):
+    blob = bytes(range(256)) * 4 + b"\x01\x02\x03"
+    (tmp_path / "in.bin").write_bytes(blob)
+    script = tmp_path / "script.txt"
+    script.write_text(
+        "# bring-up\n"
+        "write 0x0 0x11 0x22\n"
+        "read 0x0 2\n"
+        "fill 0x100 0x10 0xAA\n"
+        "read 0x10c\n"
+        f"load 0x1000 {tmp_path / 'in.bin'}\n"
+        f"dump 0x1000 {len(blob)} {tmp_path / 'out.bin'}\n"
+        "wait 0x100 0xff 0xaa 0.5\n"
+        "read 0x200000\n"
+    )
+    assert main(["--device", "virtual://", "batch", str(script)]) == 1
+    out, err = capsys.readouterr()
+    assert out.split("\n")[:3] == [
+        "0x00000000: 0x00000011",
+        "0x00000004: 0x00000022",
+        "0x0000010c: 0x000000aa",
+    ]
+    assert "0x00200000: JTAG_AXI_SLVERR" in err
+    assert (tmp_path / "out.bin").read_bytes() == blob
+
+
+def test_cli_batch_binary():
+    jtag = VirtualJtagToAXI()
+    jtag.recorder = ScanRecorder()
+    ops = b""
+    for idx in range(64):
+        ops += OP.pack(OP_WRITE, 4, 0xF, idx * 4) + (idx * 3).to_bytes(4, "little")
+    for idx in range(64):
+        ops += OP.pack(OP_READ, 4, 0, idx * 4)
+    out = io.BytesIO()
+    session = Session(jtag)
+    session.run_binary(io.BytesIO(ops), out)
+    replies = out.getvalue()
+    assert len(replies) == 128 * 5
+    reads = [replies[off : off + 5] for off in range(64 * 5, 128 * 5, 5)]
+    assert [int.from_bytes(r[1:], "little") for r in reads] == [i * 3 for i in range(64)]
+    # One pipelined batch per AFIFO worth of ops, not one per op
+    assert jtag.recorder.batches == 128 // jtag.async_fifo_depth
+
+
+class UnpluggedJtagToAXI(VirtualJtagToAXI):
+    def read_axi_batch(self, addresses, size=None):
+        raise JtagError("[JTAG_to_AXI] Unable to read data from FTDI")
+
+
+def test_cli_cable_error(capsys):
+    register_transport("unplugged", UnpluggedJtagToAXI)
+    assert main(["--device", "unplugged://", "read", "0x0"]) == 1
+    assert capsys.readouterr().err == "[JTAG_to_AXI] Unable to read data from FTDI\n"
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_connect.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import AXISize, InstJTAG, JDRCtrlAXI, ScanOp, TxnType
+from jtag_axi.jtag_axi_trace import ScanRecorder
+from jtag_axi.jtag_axi_virtual import IDCODE_VAL, VirtualJtagToAXI, VirtualTap
+
+
+class RecordedJtagToAXI(VirtualJtagToAXI):
+    """Records the scans issued while connecting too."""
+
+    def _open(self, device, freq, trst):
+        super()._open(device, freq, trst)
+        self.recorder = ScanRecorder()
+
+
+def _irs(recorder):
+    return [record[3] for record in recorder if record[2] is ScanOp.IR]
+
+
+def test_lazy_connect():
+    jtag = RecordedJtagToAXI(tap=VirtualTap())
+    assert _irs(jtag.recorder) == [InstJTAG.IDCODE]
+    assert jtag.idcode_jdr == IDCODE_VAL
+    assert jtag.addr_axi_jdr is None and jtag.wstrb_axi_jdr is None
+
+    jtag.recorder.clear()
+    jtag.write_axi(0x10, 0x1234)
+    irs = _irs(jtag.recorder)
+    for jdr in (InstJTAG.ADDR_AXI_REG, InstJTAG.DATA_W_AXI_REG, InstJTAG.WSTRB_AXI_REG):
+        assert jdr in irs
+    assert (jtag.addr_axi_jdr, jtag.data_write_axi_jdr) == (0x10, 0x1234)
+
+
+def test_eager_connect():
+    tap = VirtualTap(usercode=0xCAFE)
+    tap.userdata = 0x5
+    tap.addr = 0x40
+    jtag = RecordedJtagToAXI(tap=tap, lazy=False)
+    # IDCODE, then every JDR in one batch and the RW ones restored in another
+    assert jtag.recorder.batches == 3
+    assert (jtag.usercode_jdr, jtag.userdata_jdr, jtag.addr_axi_jdr) == (0xCAFE, 0x5, 0x40)
+    assert (tap.userdata, tap.addr) == (0x5, 0x40)
+
+
+def test_connect_clears_start():
+    tap = VirtualTap()
+    ctrl = JDRCtrlAXI(start=1, txn_type=TxnType.AXI_WRITE, size_axi=AXISize.AXI_WORD)
+    tap.ctrl = ctrl.get_jdr()
+    tap.mem[0:4] = b"\xff" * 4
+    jtag = RecordedJtagToAXI(tap=tap, lazy=False)
+    assert jtag.ctrl_axi_jdr == ctrl.get_jdr()
+    # The restored CTRL_AXI_REG does not dispatch the last txn again
+    assert not tap.req_fifo and not tap.resp_fifo
+    assert not JDRCtrlAXI.from_jdr(tap.ctrl).start
+    assert tap.read_mem(0, 4) == b"\xff" * 4
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_daemon.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import random
+import socket
+import threading
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import JTAGToAXIStatus, TxnType
+from jtag_axi.jtag_axi_daemon import BridgeClient, BridgeDaemon, FRAME, STATUS_FAILED
+from jtag_axi.jtag_axi_daemon import _Client, _Request, _recv_exact
+from jtag_axi.jtag_axi_regmap import Register, RegisterMap
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI, VirtualTap
+
+
+def _start(address):
+    jtag = VirtualJtagToAXI()
+    daemon = BridgeDaemon(jtag, address=address)
+    threading.Thread(target=daemon.serve_forever, daemon=True).start()
+    return jtag, daemon
+
+
+@pytest.mark.parametrize("unix", [False, True])
+def test_daemon_clients(tmp_path, unix):
+    address = str(tmp_path / "bridge.sock") if unix else ("127.0.0.1", 0)
+    jtag, daemon = _start(address)
+    errors = []
+
+    def client(base):
+        try:
+            with BridgeClient(daemon.address) as bridge:
+                words = [random.getrandbits(32) for _ in range(200)]
+                writes = [(base + 4 * idx, word) for idx, word in enumerate(words)]
+                statuses = bridge.write_axi_batch(writes)
+                assert all(s.status == JTAGToAXIStatus.JTAG_AXI_OKAY for s in statuses)
+                reads = bridge.read_axi_batch([addr for addr, _ in writes])
+                assert [r.data_rd for r in reads] == words
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=client, args=(0x1000 * n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    # 1600 ops from 4 clients, run at most quantum (16) ops per client a time
+    assert 1600 // (4 * daemon.quantum) <= daemon.batches <= 1600 // daemon.quantum
+    daemon.close()
+
+
+def test_daemon_api():
+    jtag, daemon = _start(("127.0.0.1", 0))
+    with BridgeClient(daemon.address) as bridge:
+        assert bridge.data_width == jtag.data_width
+        assert bridge.write_axi(0x10, 0xCAFE).status == JTAGToAXIStatus.JTAG_AXI_OKAY
+        assert bridge.read_axi(0x10).data_rd == 0xCAFE
+        assert bridge.read_axi(0x100000).status == JTAGToAXIStatus.JTAG_AXI_SLVERR
+        with pytest.raises(ValueError):
+            bridge.read_axi(1 << 32)
+        # Higher layers run on top of the client as on a driver
+        regs = RegisterMap(bridge, [Register("R", 0x11, size=1)])
+        regs.write("R", 0x5A)
+        assert jtag.tap.read_mem(0x10, 4) == b"\xfe\x5a\x00\x00"
+    daemon.close()
+
+
+class GlitchJtagToAXI(VirtualJtagToAXI):
+    """Cable losing the TDO of a scan program, glitch programs from now."""
+
+    glitch = None
+
+    def _shift_scans(self, scans):
+        tdo = super()._shift_scans(scans)
+        if self.glitch is not None:
+            self.glitch -= 1
+            if self.glitch < 0:
+                self.glitch = None
+                raise ConnectionError("[JTAG_to_AXI] cable glitch")
+        return tdo
+
+
+def test_daemon_failed_batch():
+    # Slow slave, the dispatched reads are still running when the batch fails
+    jtag = GlitchJtagToAXI(tap=VirtualTap(latency=4000), idle_wait=True)
+    daemon = BridgeDaemon(jtag, address=("127.0.0.1", 0))
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    image = bytes(random.getrandbits(8) for _ in range(64))
+    jtag.tap.write_mem(0, image)
+    words = [int.from_bytes(image[addr : addr + 4], "little") for addr in range(0, 64, 4)]
+    with BridgeClient(daemon.address) as bridge:
+        for glitch in range(3):
+            jtag.glitch = glitch
+            with pytest.raises(RuntimeError):
+                bridge.read_axi_batch(range(0, 64, 4))
+            assert thread.is_alive()
+            # Responses left behind were drained, not matched to this batch
+            assert [r.data_rd for r in bridge.read_axi_batch(range(0, 64, 4))] == words
+    daemon.close()
+
+
+def _unpack_reply(sock, bus_bytes):
+    length, _, count = FRAME.unpack(_recv_exact(sock, FRAME.size))
+    body = _recv_exact(sock, length)
+    return [body[offset] for offset in range(0, count * (1 + bus_bytes), 1 + bus_bytes)]
+
+
+def test_daemon_partial_batch():
+    jtag = GlitchJtagToAXI()
+    daemon = BridgeDaemon(jtag, address=("127.0.0.1", 0), quantum=64)
+    depth = jtag.async_fifo_depth
+    writer, reader = socket.socketpair(), socket.socketpair()
+    writes = _Request(
+        _Client(writer[0], None),
+        1,
+        [(TxnType.AXI_WRITE, 4 * idx, idx, 4, 0xF) for idx in range(depth)],
+    )
+    reads = _Request(
+        _Client(reader[0], None),
+        2,
+        [(TxnType.AXI_READ, 4 * idx, 0, 4, 0) for idx in range(depth)],
+    )
+    # The writes fill the first chunk, the cable fails on the second one
+    jtag.glitch = 1
+    daemon._run([(writes, idx) for idx in range(depth)] + [(reads, idx) for idx in range(depth)])
+    assert _unpack_reply(writer[1], daemon.bus_bytes) == [JTAGToAXIStatus.JTAG_AXI_OKAY.value] * depth
+    assert _unpack_reply(reader[1], daemon.bus_bytes) == [STATUS_FAILED] * depth
+    assert jtag.tap.read_mem(4, 4) == b"\x01\x00\x00\x00"
+    daemon.close()
+
+
+def test_daemon_rejects_wstrb():
+    jtag, daemon = _start(("127.0.0.1", 0))
+    with BridgeClient(daemon.address) as bridge:
+        # Strobes outside the lanes of the transfer
+        with pytest.raises(ValueError):
+            bridge.write_axi(0x10, 0xAB, size=1, wstrb=0x2)
+        with pytest.raises(ValueError):
+            bridge.write_axi(0x12, 0xAB00, size=2, wstrb=0xF)
+        assert bridge.write_axi(0x11, 0xAB00, size=1, wstrb=0x2).status == JTAGToAXIStatus.JTAG_AXI_OKAY
+        assert jtag.tap.read_mem(0x11, 1) == b"\xab"
+    daemon.close()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_encoding.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import random
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pyftdi.bits import BitSequence
+from pyftdi.jtag import JtagController
+from pyftdi.ftdi import Ftdi
+from jtag_axi.jtag_base import AXISize, InstJTAG, JDRCtrlAXI, JTAGState, ScanOp, TxnType
+from jtag_axi.jtag_axi_hw import decode_tdo, encode_scans, tdo_bytes
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI
+
+
+class FakeFtdi:
+    is_connected = True
+
+    def __init__(self, rx=b""):
+        self.rx = bytearray(rx)
+        self.tx = bytearray()
+
+    def write_data(self, data):
+        self.tx += data
+
+    def read_data_bytes(self, count, attempt=1):
+        data = bytes(self.rx[:count])
+        del self.rx[:count]
+        return data
+
+
+def _controller(rx=b""):
+    ctrl = JtagController.__new__(JtagController)
+    ctrl._ftdi = FakeFtdi(rx)
+    ctrl._write_buff = bytearray()
+    ctrl._last = None
+    return ctrl
+
+
+def test_encoding_table():
+    jtag = VirtualJtagToAXI(data_width=64, async_fifo_depth=8)
+    enc = jtag.enc
+    assert enc.dr_length[InstJTAG.STATUS_AXI_REG] == 68
+    assert enc.dr_length[InstJTAG.CTRL_AXI_REG] == 5 + jtag.ocup_width
+    for txn_type in TxnType:
+        for size in AXISize:
+            ref = JDRCtrlAXI(
+                start=1, txn_type=txn_type, size_axi=size, ocup_width=jtag.ocup_width
+            )
+            assert enc.ctrl_start[(txn_type, 1 << size.value)] == ref.get_jdr()
+    with pytest.raises(ValueError):
+        jtag._convert_size(3)
+    jtag.set_profile({"addr_width": 16, "async_fifo_depth": 4})
+    assert jtag.enc.addr_limit == 1 << 16
+    assert jtag.enc.dr_length[InstJTAG.CTRL_AXI_REG] == 8
+
+
+@pytest.mark.parametrize("length", [1, 2, 8, 9, 32, 36, 37, 68, 132])
+def test_dr_packing_matches_bitsequence(length):
+    for _ in range(50):
+        value = random.getrandbits(length)
+        cmd, lengths, state = encode_scans([(ScanOp.DR, value, length)])
+        assert lengths == [length] and state is JTAGState.UPDATE_DR
+        # Update-DR -> Shift-DR, the scan, Exit1-DR -> Update-DR with TDO
+        ref = _controller()
+        ref.write_tms(BitSequence("100"))
+        if length > 1:
+            ref.write_with_read(
+                BitSequence(value, msb=False, length=length), use_last=True
+            )
+        else:
+            ref._last = value & 0x1
+        ref.write_tms(BitSequence("11"), should_read=True)
+        assert cmd == ref._ftdi.tx + bytes((Ftdi.SEND_IMMEDIATE,))
+
+        rx = bytes(random.getrandbits(8) for _ in range(tdo_bytes([length])))
+        ref = _controller(rx)
+        tdo = ref.read_from_buffer(length - 1) if length > 1 else BitSequence()
+        last = ref.read_from_buffer(2)
+        tdo.append(BitSequence(last.tobyte() & 0x1, length=1))
+        assert decode_tdo(rx, [length]) == [int(tdo)]
+
+
+def test_ir_and_idle_packing():
+    ref = _controller()
+    # Test-Logic-Reset -> Shift-IR, IR bits with the MSB on Exit1-IR
+    ref.write_tms(BitSequence("00110", msb=True))
+    ref.write(BitSequence("1110", msb=True), use_last=True)
+    ref.write_tms(BitSequence("11"))
+    ref.write_tms(BitSequence(0, length=7))
+    ref.write_tms(BitSequence(0, length=4))
+    ref.sync()
+    cmd, lengths, state = encode_scans(
+        [(ScanOp.IR, InstJTAG.IDCODE), (ScanOp.IDLE, 10)], JTAGState.TEST_LOGIC_RESET
+    )
+    assert cmd == ref._ftdi.tx and not lengths
+    assert state is JTAGState.RUN_TEST_IDLE
+    # Already in Run-Test/Idle, no extra TMS 0 for the state change
+    assert encode_scans([(ScanOp.IDLE, 3)], state)[0] == bytes(
+        (Ftdi.WRITE_BITS_TMS_NVE, 2, 0)
+    )
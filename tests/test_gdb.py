@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_gdb.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import socket
+import random
+import threading
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_axi_gdb import AXIMemory, GdbServer, gdb_packet
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI, VirtualTap
+
+
+class GdbClient:
+    def __init__(self, port):
+        self.sock = socket.create_connection(("127.0.0.1", port))
+        self.buffer = b""
+
+    def request(self, payload: bytes):
+        self.sock.sendall(gdb_packet(payload))
+        while True:
+            start = self.buffer.find(b"$")
+            end = self.buffer.find(b"#", start)
+            if start >= 0 and end >= 0 and len(self.buffer) >= end + 3:
+                reply = self.buffer[start + 1 : end]
+                self.buffer = self.buffer[end + 3 :]
+                return reply
+            self.buffer += self.sock.recv(65536)
+
+
+def _escape(data):
+    out = bytearray()
+    for byte in data:
+        if byte in b"#$}*":
+            out += bytes((0x7D, byte ^ 0x20))
+        else:
+            out.append(byte)
+    return bytes(out)
+
+
+def test_gdb_memory():
+    jtag = VirtualJtagToAXI()
+    server = GdbServer(jtag, port=0, cache=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    gdb = GdbClient(server.port)
+    assert b"PacketSize=4000" in gdb.request(b"qSupported:multiprocess+")
+    assert gdb.request(b"QStartNoAckMode") == b"OK"
+    assert gdb.request(b"?") == b"S05"
+
+    # Unaligned binary load, then read back through the cache
+    blob = bytes(random.getrandbits(8) for _ in range(1000)) + b"#$}*"
+    assert gdb.request(b"X103,%x:" % len(blob) + _escape(blob)) == b"OK"
+    assert jtag.tap.read_mem(0x103, len(blob)) == blob
+    assert bytes.fromhex(gdb.request(b"m103,%x" % len(blob)).decode()) == blob
+    reads = jtag.metrics.latency["read"].count
+    assert gdb.request(b"m200,10") == blob[0xFD:0x10D].hex().encode()
+    assert jtag.metrics.latency["read"].count == reads
+
+    # Writes drop the cached lines they touch
+    assert gdb.request(b"M201,2:beef") == b"OK"
+    assert gdb.request(b"m200,4") == (blob[0xFD:0xFE] + b"\xbe\xef" + blob[0x100:0x101]).hex().encode()
+    # Changes made behind the server show up after a flush
+    jtag.tap.write_mem(0x200, b"\x00")
+    assert gdb.request(b"qRcmd," + b"flush".hex().encode()) == b"OK"
+    assert gdb.request(b"m200,1") == b"00"
+    assert gdb.request(b"m100000,4") == b"E01"
+    assert gdb.request(b"g") == b""
+    gdb.request(b"k")
+    server.close()
+
+
+def test_gdb_uncached():
+    # The memory ends mid line, like a peripheral region followed by a hole
+    jtag = VirtualJtagToAXI(VirtualTap(mem_size=0x1010))
+    memory = AXIMemory(jtag)
+    jtag.tap.write_mem(0x1000, b"\x11\x22\x33\x44")
+    assert memory.read(0x1001, 2) == b"\x22\x33"
+    # Without the cache every read reaches the bus
+    jtag.tap.write_mem(0x1001, b"\x00")
+    assert memory.read(0x1001, 2) == b"\x00\x33"
+    assert not memory.lines
+
+    # The 64-byte line runs past the region, only the asked words are read
+    memory = AXIMemory(jtag, cache=True)
+    assert memory.read(0x1000, 4) == b"\x11\x00\x33\x44"
+    assert not memory.lines
+    with pytest.raises(RuntimeError):
+        memory.read(0x100C, 8)
+
+
+class FailingJtagToAXI(VirtualJtagToAXI):
+    unplugged = False
+
+    def _shift_scans(self, scans):
+        if self.unplugged:
+            raise ConnectionError("[JTAG_to_AXI] cable unplugged")
+        return super()._shift_scans(scans)
+
+
+def test_gdb_bad_sessions():
+    jtag = FailingJtagToAXI()
+    server = GdbServer(jtag, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    gdb = GdbClient(server.port)
+    # Unparsable checksums are NAKed like wrong ones
+    for packet in (b"$m0,4#zz", b"$m0,4#-1"):
+        gdb.sock.sendall(packet)
+        assert gdb.sock.recv(1) == b"-"
+    assert gdb.request(b"m0,4") == b"00000000"
+
+    # A cable error ends the session, not the server
+    jtag.unplugged = True
+    gdb.sock.sendall(gdb_packet(b"m8000,4"))
+    gdb.sock.settimeout(5)
+    while gdb.sock.recv(64):
+        pass
+    jtag.unplugged = False
+    gdb = GdbClient(server.port)
+    assert gdb.request(b"m0,4") == b"00000000"
+    gdb.request(b"k")
+    server.close()
+    thread.join(5)
+    assert not thread.is_alive()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_idle_wait.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import TxnType, JTAGToAXIStatus
+from jtag_axi.jtag_axi_idle import IdleWait
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI, VirtualTap
+
+
+def _slow_region(address, txn_type):
+    # 0x8000 and above is a slow peripheral, below it a fast memory
+    return 300 if address >= 0x8000 else 20
+
+
+def _run(idle_wait):
+    jtag = VirtualJtagToAXI(tap=VirtualTap(latency=_slow_region))
+    jtag.idle_wait = idle_wait
+    for idx in range(100):
+        jtag.write_axi(0x8000 + (idx * 4), idx)
+    jtag.metrics.reset()
+    status = []
+    for idx in range(100):
+        status.append(jtag.read_axi(0x8000 + (idx * 4)).status)
+    return jtag.metrics, status
+
+
+def test_idle_wait_polls():
+    blind, _ = _run(None)
+    learned, status = _run(IdleWait())
+    assert learned.status_polls * 10 < blind.status_polls
+    assert status.count(JTAGToAXIStatus.JTAG_AXI_OKAY) >= 95
+
+
+def test_idle_wait_learn():
+    wait = IdleWait(region_bits=12, initial=16)
+    wait.learn(0x1000, TxnType.AXI_READ, 200, polls=2)
+    # Raised at once to what the txn took, per region and txn type
+    assert wait.estimate(0x1FFC, TxnType.AXI_READ) == 200
+    assert wait.estimate(0x1000, TxnType.AXI_WRITE) == 16
+    assert wait.estimate(0x2000, TxnType.AXI_READ) == 16
+    # Then decays slowly while txns complete on the first scan
+    wait.learn(0x1000, TxnType.AXI_READ, 200, polls=0)
+    assert 180 < wait.estimate(0x1000, TxnType.AXI_READ) < 200
+    assert wait.backoff(0x1000, TxnType.AXI_READ, 2) > wait.backoff(
+        0x1000, TxnType.AXI_READ, 1
+    )
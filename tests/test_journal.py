@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_journal.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import json
+import random
+import pytest
+import threading
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_axi_cli import main
+from jtag_axi.jtag_axi_daemon import BridgeClient, BridgeDaemon
+from jtag_axi.jtag_axi_journal import LoadJournal, journaled_load, resume_load
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI, VirtualTap
+
+
+class FlakyJtagToAXI(VirtualJtagToAXI):
+    """Cable that drops out after a number of write batches."""
+
+    def __init__(self, batches, **kwargs):
+        self.batches = batches
+        super().__init__(**kwargs)
+
+    def write_axi_batch(self, writes, size=None, wstrb=None):
+        if self.batches == 0:
+            raise ConnectionError("[JTAG_to_AXI] cable unplugged")
+        self.batches -= 1
+        return super().write_axi_batch(writes, size, wstrb)
+
+
+def test_resume_after_glitch(tmp_path):
+    image = bytes(random.getrandbits(8) for _ in range(1000))
+    journal = tmp_path / "load.journal"
+    tap = VirtualTap()
+    with pytest.raises(ConnectionError):
+        journaled_load(FlakyJtagToAXI(5, tap=tap), 0x100, image, str(journal), chunk=64)
+    assert LoadJournal(str(journal)).done() == 5 * 64
+    # The last journalled chunk did not survive the glitch
+    tap.write_mem(0x100 + 4 * 64, bytes(64))
+    with open(journal, "a") as fh:
+        fh.write('{"offset": 320, "len')
+
+    report = resume_load(VirtualJtagToAXI(tap=tap), str(journal), image)
+    assert tap.read_mem(0x100, len(image)) == image
+    assert report.skipped == 4 * 64 and report.verified == 64
+    assert report.written == len(image) - 4 * 64
+    entries = LoadJournal(str(journal))
+    assert entries.done() == len(image)
+    with pytest.raises(ValueError):
+        resume_load(VirtualJtagToAXI(tap=tap), str(journal), image[:-1])
+
+
+def test_resume_over_bridge(tmp_path):
+    image = bytes(random.getrandbits(8) for _ in range(512))
+    journal = tmp_path / "load.journal"
+    tap = VirtualTap()
+    with pytest.raises(ConnectionError):
+        journaled_load(FlakyJtagToAXI(3, tap=tap), 0x200, image, str(journal), chunk=64)
+    tap.write_mem(0x200 + 2 * 64, bytes(64))
+
+    daemon = BridgeDaemon(VirtualJtagToAXI(tap=tap), address=("127.0.0.1", 0))
+    threading.Thread(target=daemon.serve_forever, daemon=True).start()
+    with BridgeClient(daemon.address) as bridge:
+        report = resume_load(bridge, str(journal), image)
+    daemon.close()
+    assert tap.read_mem(0x200, len(image)) == image
+    assert report.skipped == 2 * 64 and report.verified == 64
+
+
+def test_cli_load_journal(tmp_path, capsys):
+    image = bytes(range(256)) * 3
+    (tmp_path / "fw.bin").write_bytes(image)
+    journal = tmp_path / "fw.journal"
+    args = ["--device", "virtual://", "load", "0x0", str(tmp_path / "fw.bin")]
+    assert main(args + ["--journal", str(journal), "--chunk", "256"]) == 0
+    lines = journal.read_text().splitlines()
+    assert json.loads(lines[0])["source"] == str(tmp_path / "fw.bin")
+    assert len(lines) == 1 + 3
+    # A new (empty) virtual target fails the read back of the last 2 chunks,
+    # the load carries on from the oldest one
+    assert main(["--device", "virtual://", "resume", str(journal)]) == 0
+    assert "512 bytes written, 256 already done" in capsys.readouterr().out
+    assert json.loads(journal.read_text().splitlines()[4]) == {"rewind": 256}
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_mailbox.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import random
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_axi_mailbox import Mailbox, MailboxDevice
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI
+
+
+def _setup(userdata_width=4, rx_depth=16):
+    jtag = VirtualJtagToAXI(userdata_width=userdata_width)
+    device = MailboxDevice(userdata_width=userdata_width, rx_depth=rx_depth)
+    jtag.tap.sideband = device
+    return jtag, device, Mailbox(jtag, credits=rx_depth)
+
+
+def test_mailbox_downlink():
+    jtag, device, mbox = _setup()
+    frames = [bytes(random.getrandbits(8) for _ in range(n)) for n in (0, 1, 100)]
+    seqs = [mbox.send(frame) for frame in frames]
+    mbox.flush()
+    device.process()
+    assert list(device.rx_frames) == list(zip(seqs, frames))
+    # Credits kept the design RX FIFO from overflowing
+    assert device.overflows == 0
+
+
+def test_mailbox_uplink():
+    jtag, device, mbox = _setup(userdata_width=7)
+    frames = [bytes(random.getrandbits(8) for _ in range(n)) for n in (5, 64, 3)]
+    for frame in frames:
+        device.send(frame)
+    for seq, frame in enumerate(frames):
+        assert mbox.recv() == (seq, frame)
+    assert mbox.errors == 0
+
+    # Words lost on the design side are caught by the word sequence number
+    device.send(b"lost")
+    device.tx_words.popleft()
+    device.send(b"ok")
+    assert mbox.recv() == (4, b"ok")
+    assert mbox.errors == 1
+
+
+def test_mailbox_userdata_shadow():
+    jtag, device, mbox = _setup()
+    mbox.send(b"\x12\x34")
+    mbox.flush()
+    # Anything restoring USERDATA from the shadow (e.g. Watcher) shifts back
+    # the last mailbox word rather than a stale one
+    assert jtag.userdata_jdr == jtag.tap.userdata
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_metrics.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import json
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import InstJTAG, JTAGToAXIStatus
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI, VirtualTap
+
+
+def test_metrics_counters():
+    # Long enough for the first STATUS scan to see the txn still running, the
+    # response lands between two polls (not during one, which would ack it)
+    jtag = VirtualJtagToAXI(tap=VirtualTap(latency=76))
+    jtag.metrics.reset()
+    for _ in range(4):
+        jtag.write_axi(0x10, 0xCAFE)
+    jtag.read_axi(0x10)
+    jtag.read_axi(0x100000)
+
+    metrics = jtag.metrics.as_dict()
+    # Address/data/strobe are only shifted when they change
+    assert metrics["scans"][InstJTAG.ADDR_AXI_REG.name] == 2
+    assert metrics["skips"] >= 3 * 3
+    assert metrics["status_polls"] >= 6
+    assert metrics["status"] == {"JTAG_AXI_OKAY": 5, "JTAG_AXI_SLVERR": 1}
+    assert metrics["latency"]["write"]["count"] == 4
+    assert metrics["latency"]["read"]["count"] == 2
+    assert metrics["tck_cycles"] > 0
+    json.loads(jtag.metrics.to_json())
+
+
+def test_metrics_prometheus():
+    jtag = VirtualJtagToAXI()
+    jtag.read_axi(0x0)
+    text = jtag.metrics.to_prometheus(labels={"board": "b0"})
+    assert '# TYPE jtag_axi_latency_seconds histogram' in text
+    assert 'jtag_axi_latency_seconds_count{board="b0",op="read"} 1' in text
+    assert 'jtag_axi_txn_status_total{board="b0",status="JTAG_AXI_OKAY"} 1' in text
+
+
+def test_txn_hooks(capsys):
+    jtag = VirtualJtagToAXI()
+    events = []
+    jtag.add_txn_hook(events.append)
+    jtag.write_axi(0x20, 0x1234)
+    jtag.read_axi(0x20, size=2)
+    jtag.remove_txn_hook(events.append)
+    jtag.read_axi(0x20)
+
+    assert [event.op for event in events] == ["write", "read"]
+    assert events[1].address == 0x20
+    assert events[1].size == 2
+    assert events[1].data == 0x1234
+    assert events[1].status == JTAGToAXIStatus.JTAG_AXI_OKAY
+    assert events[1].latency >= 0
+    # Nothing is printed unless logging is enabled
+    assert capsys.readouterr().out == ""
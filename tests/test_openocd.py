@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_openocd.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import re
+import sys
+import time
+import shutil
+import socket
+import random
+import threading
+import subprocess
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import jtag_axi
+from jtag_axi.jtag_base import ScanOp
+from jtag_axi.jtag_axi_virtual import IDCODE_VAL, VirtualTap
+from jtag_axi.jtag_axi_openocd import OPENOCD_RPC_END, RemoteBitbangServer
+from jtag_axi.jtag_axi_xvc import INST_FROM_CODE
+
+
+class FakeOpenOCD:
+    """Tcl RPC endpoint understanding the scripts JtagToAXIOpenOCD sends,
+    running them on a VirtualTap at scan level."""
+
+    def __init__(self, tap):
+        self.tap = tap
+        self.scripts = 0
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(1)
+        self.port = self.sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        conn, _ = self.sock.accept()
+        buffer = b""
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                return
+            buffer += chunk
+            while OPENOCD_RPC_END in buffer:
+                script, buffer = buffer.split(OPENOCD_RPC_END, 1)
+                conn.sendall(self._eval(script.decode()).encode() + OPENOCD_RPC_END)
+
+    def _eval(self, script):
+        self.scripts += 1
+        scans = []
+        for line in script.splitlines():
+            match = re.match(r"irscan \S+ (0x[0-9a-f]+)$", line)
+            if match:
+                scans.append((ScanOp.IR, INST_FROM_CODE[int(match.group(1), 16)]))
+                continue
+            match = re.match(r"lappend r \[drscan \S+ (\d+) (0x[0-9a-f]+)\]$", line)
+            if match:
+                scans.append((ScanOp.DR, int(match.group(2), 16), int(match.group(1))))
+                continue
+            match = re.match(r"runtest (\d+)$", line)
+            if match:
+                scans.append((ScanOp.IDLE, int(match.group(1))))
+            elif line.startswith("adapter speed"):
+                return "adapter speed: 1000 kHz"
+        return " ".join(f"{value:08x}" for value in self.tap.execute(scans))
+
+
+def test_openocd_batches_one_rpc():
+    tap = VirtualTap()
+    server = FakeOpenOCD(tap)
+    jtag = jtag_axi.open(f"openocd://127.0.0.1:{server.port}/jtag_axi.tap")
+    assert jtag.idcode_jdr == IDCODE_VAL and jtag.freq == 1e6
+    data = [random.getrandbits(32) for _ in range(jtag.async_fifo_depth)]
+    addresses = [0x200 + 4 * idx for idx in range(len(data))]
+    scripts = server.scripts
+    jtag.write_axi_batch(list(zip(addresses, data)))
+    assert server.scripts - scripts == 1
+    assert [r.data_rd for r in jtag.read_axi_batch(addresses)] == data
+    jtag.close()
+
+
+def test_remote_bitbang_idcode():
+    server = RemoteBitbangServer(VirtualTap(), port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    sock = socket.create_connection(server.address)
+    # TMS reset, Run-Test/Idle, Select-DR, Capture-DR, Shift-DR (IDCODE)
+    out = b"".join(b"%d%d" % (tms << 1, 4 | (tms << 1)) for tms in (1, 1, 1, 1, 1, 0, 1, 0, 0))
+    for bit in range(32):
+        out += b"R" + (b"0" if bit < 31 else b"2") + (b"4" if bit < 31 else b"6")
+    sock.sendall(out + b"Q")
+    tdo = b""
+    while len(tdo) < 32:
+        tdo += sock.recv(64)
+    assert int(tdo[::-1], 2) == IDCODE_VAL
+    sock.close()
+    server.close()
+
+
+@pytest.mark.skipif(shutil.which("openocd") is None, reason="openocd not installed")
+def test_openocd_remote_bitbang():
+    tap = VirtualTap()
+    server = RemoteBitbangServer(tap, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    rpc_port = probe.getsockname()[1]
+    probe.close()
+    openocd = subprocess.Popen(
+        [
+            "openocd",
+            "-c", "adapter driver remote_bitbang",
+            "-c", "remote_bitbang host 127.0.0.1",
+            "-c", f"remote_bitbang port {server.address[1]}",
+            "-c", "transport select jtag",
+            "-c", f"jtag newtap jtag_axi tap -irlen 4 -expected-id {IDCODE_VAL:#x}",
+            "-c", f"tcl_port {rpc_port}",
+            "-c", "gdb_port disabled",
+            "-c", "telnet_port disabled",
+            "-c", "init",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        for _ in range(50):
+            try:
+                jtag = jtag_axi.open(f"openocd://127.0.0.1:{rpc_port}")
+                break
+            except ConnectionRefusedError:
+                time.sleep(0.1)
+        assert jtag.idcode_jdr == IDCODE_VAL
+        jtag.write_axi(0x10, 0x12345678)
+        assert jtag.read_axi(0x10).data_rd == 0x12345678
+        jtag.close()
+    finally:
+        openocd.terminate()
+        openocd.wait()
+        server.close()
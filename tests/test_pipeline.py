@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_pipeline.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import time
+import logging
+import random
+import threading
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pyftdi.ftdi import Ftdi
+from pyftdi.jtag import JtagError
+from jtag_axi.jtag_base import InstJTAG, JTAGState, JTAGToAXIStatus, ScanOp
+from jtag_axi.jtag_axi_daemon import BridgeClient, BridgeDaemon
+from jtag_axi.jtag_axi_hw import JtagToAXIFTDI, MPSSEPipeline
+from jtag_axi.jtag_axi_virtual import IDCODE_VAL, VirtualJtagToAXI, VirtualTap
+from jtag_axi.jtag_axi_xvc import TapBitModel
+
+
+class FakeMPSSE:
+    """FTDI MPSSE engine running the JTAG commands used by encode_scans() on
+    a TapBitModel, with the TDO bytes queued for read_data_bytes()."""
+
+    def __init__(self, tap, usb_delay=0.0):
+        self.model = TapBitModel(tap)
+        self.usb_delay = usb_delay
+        self.writes = 0
+        self.fail_writes = 0
+        self.purges = 0
+        self.rx = bytearray()
+        self.cond = threading.Condition()
+
+    def _bits(self, count, tms, tdi):
+        # Bits read by the MPSSE come in from the MSB of the byte
+        byte = 0
+        for idx in range(count):
+            bit = self.model.clock((tms >> idx) & 0x1, (tdi >> idx) & 0x1)
+            byte = (byte >> 1) | (bit << 7)
+        return byte
+
+    def write_data(self, data):
+        time.sleep(self.usb_delay)
+        if self.fail_writes:
+            self.fail_writes -= 1
+            raise JtagError("[JTAG_to_AXI] USB write failed")
+        out = bytearray()
+        pos = 0
+        while pos < len(data):
+            op = data[pos]
+            if op == Ftdi.SEND_IMMEDIATE:
+                pos += 1
+            elif op == Ftdi.RW_BYTES_PVE_NVE_LSB:
+                count = data[pos + 1] + (data[pos + 2] << 8) + 1
+                for byte in data[pos + 3 : pos + 3 + count]:
+                    out.append(self._bits(8, 0, byte))
+                pos += 3 + count
+            else:
+                count, byte = data[pos + 1] + 1, data[pos + 2]
+                if op in (Ftdi.WRITE_BITS_TMS_NVE, Ftdi.RW_BITS_TMS_PVE_NVE):
+                    tdo = self._bits(count, byte, 0xFF if byte >> 7 else 0)
+                elif op in (Ftdi.WRITE_BITS_NVE_LSB, Ftdi.RW_BITS_PVE_NVE_LSB):
+                    tdo = self._bits(count, 0, byte)
+                else:
+                    raise AssertionError(f"unexpected MPSSE command {op:#x}")
+                if op in (Ftdi.RW_BITS_TMS_PVE_NVE, Ftdi.RW_BITS_PVE_NVE_LSB):
+                    out.append(tdo)
+                pos += 3
+        with self.cond:
+            self.writes += 1
+            self.rx += out
+            self.cond.notify_all()
+        return len(data)
+
+    def set_frequency(self, freq):
+        # Writes done when the frequency changed
+        self.freq_writes = self.writes
+        return freq
+
+    def read_data_bytes(self, count, attempt=1):
+        with self.cond:
+            self.cond.wait_for(lambda: self.rx, timeout=0.05)
+            data = bytes(self.rx[:count])
+            del self.rx[:count]
+        return data
+
+    def purge_buffers(self):
+        with self.cond:
+            self.purges += 1
+            self.rx.clear()
+
+
+class FakeEngine:
+    """TMS reset of the pyftdi JtagEngine, clocked on the FakeMPSSE TAP."""
+
+    def __init__(self, ftdi):
+        self.ftdi = ftdi
+
+    def reset(self):
+        for _ in range(5):
+            self.ftdi.model.clock(1, 0)
+
+    def sync(self):
+        pass
+
+
+class FakeJtagToAXIFTDI(JtagToAXIFTDI):
+    def __init__(self, tap, usb_delay=0.0, **kwargs):
+        self.tap = tap
+        self.usb_delay = usb_delay
+        super().__init__(**kwargs)
+
+    def _open(self, device, freq, trst):
+        self.ftdi = FakeMPSSE(self.tap, self.usb_delay)
+        self.jtag = FakeEngine(self.ftdi)
+        self._tap_state = JTAGState.TEST_LOGIC_RESET
+        self.pipeline = MPSSEPipeline(self.ftdi)
+
+    def close(self):
+        self.pipeline.close()
+
+
+def test_ftdi_pipeline_axi():
+    tap = VirtualTap()
+    jtag = FakeJtagToAXIFTDI(tap, lazy=False)
+    assert jtag.idcode_jdr == IDCODE_VAL
+    assert jtag.write_axi(0x40, 0xCAFEF00D).status == JTAGToAXIStatus.JTAG_AXI_OKAY
+    assert jtag.read_axi(0x40).data_rd == 0xCAFEF00D
+    data = [random.getrandbits(32) for _ in range(3 * jtag.async_fifo_depth + 1)]
+    addresses = [0x100 + 4 * idx for idx in range(len(data))]
+    jtag.write_axi_batch(list(zip(addresses, data)))
+    assert tap.read_mem(0x100, 4 * len(data)) == b"".join(
+        word.to_bytes(4, "little") for word in data
+    )
+    assert [r.data_rd for r in jtag.read_axi_block(0x100, len(data))] == data
+    jtag.close()
+
+
+def test_ftdi_pipeline_overlaps_stream():
+    tap = VirtualTap(userdata_width=8)
+    jtag = FakeJtagToAXIFTDI(tap, usb_delay=0.01, userdata_width=8)
+    payload = bytes(random.getrandbits(8) for _ in range(64))
+    writes = jtag.ftdi.writes
+    report = jtag.stream_userdata(payload, batch=8)
+    # Every batch is its own USB write, and they are all in order
+    assert jtag.ftdi.writes - writes == 9
+    assert report.words == 64 and tap.userdata == payload[-1]
+    assert report.tdo[1:] == list(payload[:-1])
+    jtag.close()
+
+
+def test_pipeline_read_error_fails_tickets():
+    class DeadFtdi:
+        def write_data(self, data):
+            return len(data)
+
+        def read_data_bytes(self, count, attempt=1):
+            return b""
+
+    pipeline = MPSSEPipeline(DeadFtdi(), timeout=0.01)
+    first = pipeline.submit(b"\x00", [8])
+    second = pipeline.submit(b"\x00", [])
+    with pytest.raises(JtagError):
+        pipeline.collect(first)
+    with pytest.raises(JtagError):
+        pipeline.collect(second)
+    pipeline.close()
+
+
+@pytest.mark.parametrize("latency", [8, 4000])
+def test_speculative_block_reads(latency, caplog):
+    # With a slow bus chunks are still RUNNING when decoded, the one
+    # submitted behind has to be thrown away and sent again.
+    tap = VirtualTap(latency=latency)
+    tap.write_mem(0, bytes(random.getrandbits(8) for _ in range(256)))
+    jtag = VirtualJtagToAXI(tap=tap, idle_wait=True)
+    with caplog.at_level(logging.DEBUG, logger="jtag_axi.jtag_axi_driver"):
+        block = jtag.read_axi_block(0, 64)
+    assert ("still running" in caplog.text) == (latency > 8)
+    assert [r.data_rd for r in block] == [
+        int.from_bytes(tap.read_mem(4 * idx, 4), "little") for idx in range(64)
+    ]
+    assert jtag.read_axi(0x10).data_rd == int.from_bytes(tap.read_mem(0x10, 4), "little")
+
+
+def test_ftdi_set_frequency_waits_pipeline():
+    tap = VirtualTap()
+    jtag = FakeJtagToAXIFTDI(tap, usb_delay=0.01)
+    writes = jtag.ftdi.writes
+    tickets = [
+        jtag._submit([(ScanOp.IR, InstJTAG.IDCODE), (ScanOp.DR, 0, 32)])
+        for _ in range(4)
+    ]
+    assert jtag.set_frequency(2e6) == 2e6
+    # Every program queued before went out at the old frequency
+    assert jtag.ftdi.freq_writes == writes + 4
+    assert [jtag._collect(ticket) for ticket in tickets] == [[IDCODE_VAL]] * 4
+    jtag.close()
+
+
+def test_ftdi_reset_recovers_pipeline():
+    tap = VirtualTap()
+    jtag = FakeJtagToAXIFTDI(tap)
+    assert jtag.write_axi(0x40, 0x1234).status == JTAGToAXIStatus.JTAG_AXI_OKAY
+    jtag.ftdi.fail_writes = 1
+    idcode = [(ScanOp.IR, InstJTAG.IDCODE), (ScanOp.DR, 0, 32)]
+    tickets = [jtag._submit(idcode) for _ in range(3)]
+    for ticket in tickets:
+        with pytest.raises(JtagError):
+            jtag._collect(ticket)
+    jtag.reset()
+    assert jtag.ftdi.purges == 1 and jtag.pipeline.error is None
+    assert jtag._collect(jtag._submit(idcode)) == [IDCODE_VAL]
+    assert jtag.read_axi(0x40).data_rd == 0x1234
+    jtag.close()
+
+
+def test_ftdi_daemon_recovers():
+    tap = VirtualTap()
+    jtag = FakeJtagToAXIFTDI(tap)
+    daemon = BridgeDaemon(jtag, address=("127.0.0.1", 0))
+    threading.Thread(target=daemon.serve_forever, daemon=True).start()
+    with BridgeClient(daemon.address) as bridge:
+        jtag.ftdi.fail_writes = 1
+        with pytest.raises(RuntimeError):
+            bridge.write_axi_batch([(0x80, 0x55)])
+        assert bridge.write_axi(0x80, 0xAA).status == JTAGToAXIStatus.JTAG_AXI_OKAY
+        assert bridge.read_axi(0x80).data_rd == 0xAA
+    daemon.close()
+    jtag.close()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_profile.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import json
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import InstJTAG, JTAGToAXIStatus
+from jtag_axi.jtag_axi_cache import cache_load, cache_store
+from jtag_axi.jtag_axi_profile import PROFILE_JDRS, discover_profile, profile_key
+from jtag_axi.jtag_axi_profile import measure_dr_length, measure_dr_lengths
+from jtag_axi.jtag_axi_trace import ScanRecorder
+from jtag_axi.jtag_axi_virtual import IDCODE_VAL, VirtualJtagToAXI, VirtualTap
+
+PROFILE = {
+    "addr_width": 40,
+    "data_width": 64,
+    "ic_reset_width": 4,
+    "userdata_width": 8,
+    "async_fifo_depth": 8,
+}
+
+
+def test_measure_dr_length():
+    tap = VirtualTap(**PROFILE)
+    tap.userdata, tap.ic_rst = 0xA5, 0x3
+    jtag = VirtualJtagToAXI(tap=tap)
+    assert measure_dr_length(jtag, InstJTAG.ADDR_AXI_REG) == 40
+    assert measure_dr_length(jtag, InstJTAG.STATUS_AXI_REG) == 68
+    assert measure_dr_length(jtag, InstJTAG.CTRL_AXI_REG) == 9
+    # RW registers get their value back
+    assert measure_dr_length(jtag, InstJTAG.USERDATA) == 8
+    assert measure_dr_length(jtag, InstJTAG.IC_RESET) == 4
+    assert (tap.userdata, tap.ic_rst) == (0xA5, 0x3)
+    assert not tap.req_fifo
+    with pytest.raises(RuntimeError):
+        measure_dr_length(jtag, InstJTAG.SAMPLE_PRELOAD, max_length=16)
+
+
+def test_discover_profile(tmp_path, monkeypatch):
+    monkeypatch.setenv("JTAG_AXI_CACHE", str(tmp_path))
+    tap = VirtualTap(usercode=0x1234, **PROFILE)
+    jtag = VirtualJtagToAXI(tap=tap, discover=True)
+    assert jtag.get_profile() == PROFILE
+    lengths = measure_dr_lengths(jtag, PROFILE_JDRS)
+    assert cache_load("profile", profile_key(IDCODE_VAL, lengths)) == PROFILE
+    status = jtag.write_axi(0x100, (1 << 64) - 2, wstrb=0xFF).status
+    assert status == JTAGToAXIStatus.JTAG_AXI_OKAY
+    assert jtag.read_axi(0x100).data_rd == (1 << 64) - 2
+
+    # IDCODE, every length in one program and the RW ones restored, USERCODE
+    # is never scanned (no usercode_update_o pulse)
+    jtag.recorder = ScanRecorder()
+    tap.usercode = 0x5678
+    assert discover_profile(jtag) == PROFILE
+    assert jtag.recorder.batches == 3
+    assert InstJTAG.USERCODE not in [record[3] for record in jtag.recorder]
+    assert tap.usercode_updates == 0
+    with open(tmp_path / "profile.json") as fh:
+        assert list(json.load(fh)) == [f"{IDCODE_VAL:#010x}:40,64,4,8,9"]
+
+    # An entry can carry the exact depth, the derived one is a power of two
+    cache_store("profile", profile_key(IDCODE_VAL, lengths), dict(PROFILE, async_fifo_depth=6))
+    assert discover_profile(jtag)["async_fifo_depth"] == 6
+
+    # Another bitstream with other lengths gets its own entry
+    tap.userdata_width = 16
+    assert discover_profile(jtag)["userdata_width"] == 16
+    assert discover_profile(jtag, cache=False)["async_fifo_depth"] == 8
+    with open(tmp_path / "profile.json") as fh:
+        assert len(json.load(fh)) == 2
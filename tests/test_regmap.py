@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_regmap.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import json
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_axi_regmap import RegisterMap
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI
+
+REGMAP = {
+    "base": "0x100",
+    "registers": [
+        {
+            "name": "CTRL",
+            "address": "0x0",
+            "fields": [
+                {"name": "EN", "bits": "0"},
+                {"name": "MODE", "bits": "3:1"},
+                {"name": "DIV", "offset": 8, "width": 8},
+            ],
+        },
+        {
+            "name": "CFG",
+            "address": "0x4",
+            "volatile": False,
+            "fields": [{"name": "LEN", "bits": "15:0"}],
+        },
+        {"name": "KEY", "address": "0x8", "access": "write-only", "reset": 0},
+        {
+            "name": "STAT",
+            "addressOffset": "0xD",
+            "size": 8,
+            "access": "read-only",
+            "fields": [{"name": "BUSY", "bitOffset": 7, "bitWidth": 1}],
+        },
+    ],
+}
+
+
+def _setup(tmp_path):
+    jtag = VirtualJtagToAXI()
+    path = tmp_path / "regs.json"
+    path.write_text(json.dumps(REGMAP))
+    return jtag, RegisterMap.load(jtag, str(path))
+
+
+def _word(jtag, address):
+    return int.from_bytes(jtag.tap.read_mem(address, 4), "little")
+
+
+def test_regmap_fields(tmp_path):
+    jtag, regs = _setup(tmp_path)
+    jtag.tap.write_mem(0x100, (0xAB00).to_bytes(4, "little"))
+    regs.set("CTRL", EN=1, MODE=5)
+    assert _word(jtag, 0x100) == 0xAB0B
+    assert regs.read_field("CTRL", "DIV") == 0xAB
+    # Narrow read-only register on lane 1 of its bus word
+    jtag.tap.write_mem(0x10C, b"\x11\x80\x22\x33")
+    assert regs.read("STAT") == 0x80
+    assert regs.read_field("STAT", "BUSY") == 1
+    with pytest.raises(ValueError):
+        regs.set("STAT", BUSY=0)
+    with pytest.raises(ValueError):
+        regs.set("CTRL", MODE=8)
+
+
+def test_regmap_rmw_collapse(tmp_path):
+    jtag, regs = _setup(tmp_path)
+    jtag.metrics.reset()
+    with regs.batch():
+        for div in range(100):
+            regs.set("CTRL", DIV=div)
+        regs.set("CTRL", EN=1)
+        regs.set("CFG", LEN=0x1234)
+    # One read and one write per register, each kind in a single batch
+    assert jtag.metrics.latency["read"].count == 2
+    assert jtag.metrics.latency["write"].count == 2
+    assert jtag.metrics.scans["STATUS_AXI_REG"] == 4
+    assert _word(jtag, 0x100) == (99 << 8) | 1
+    assert _word(jtag, 0x104) == 0x1234
+    # Non-volatile and write-only registers are served from the shadow
+    regs.write("KEY", 0xC0FFEE)
+    jtag.metrics.reset()
+    assert regs.read_many(["CFG", "KEY"]) == {"CFG": 0x1234, "KEY": 0xC0FFEE}
+    assert "read" not in jtag.metrics.latency
+    # CFG is now shadowed, updating its fields needs no read
+    regs.set("CFG", LEN=0x55)
+    assert "read" not in jtag.metrics.latency
+    regs.invalidate("CFG")
+    assert regs.read("CFG") == 0x55
+    assert jtag.metrics.latency["read"].count == 1
+
+
+def test_regmap_sizes():
+    jtag = VirtualJtagToAXI()
+    regs = RegisterMap.from_dict(
+        jtag,
+        {
+            "baseAddress": "0x200",
+            "size": 16,
+            "registers": [
+                {"name": "A", "addressOffset": "0x0"},
+                {"name": "B", "addressOffset": "0x4", "size": 32},
+                {"name": "C", "address": "0x8", "bytes": 1},
+            ],
+        },
+    )
+    # SVD sizes are in bits, "bytes" in bytes
+    assert [regs[name].size for name in "ABC"] == [2, 4, 1]
+    assert regs["B"].mask == 0xFFFFFFFF
+    with pytest.raises(ValueError):
+        RegisterMap.from_dict(jtag, {"registers": [{"name": "D", "address": 0, "size": 12}]})
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_sampler.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import time
+import struct
+import threading
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import JTAGToAXIStatus
+from jtag_axi.jtag_axi_cli import main
+from jtag_axi.jtag_axi_daemon import BridgeDaemon
+from jtag_axi.jtag_axi_sampler import NPY_HEADER_LEN, Sampler, _ColumnWriter, read_samples
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI
+
+
+def test_sampler_columns(tmp_path):
+    jtag = VirtualJtagToAXI()
+    for idx in range(6):
+        jtag.write_axi(4 * idx, 0x100 + idx)
+    addresses = [4 * idx for idx in range(6)] + [0x200000]
+    path = str(tmp_path / "samples.bin")
+    report = Sampler(jtag, addresses, path).run(samples=100)
+    assert report.samples == 100 and report.dropped == 0 and report.rate > 0
+    got, timestamps, data, status = read_samples(path)
+    assert got == addresses and len(timestamps) == 100
+    assert list(timestamps) == sorted(timestamps)
+    for idx in range(6):
+        assert set(data[idx]) == {0x100 + idx}
+        assert set(status[idx]) == {JTAGToAXIStatus.JTAG_AXI_OKAY.value}
+    assert set(status[6]) == {JTAGToAXIStatus.JTAG_AXI_SLVERR.value}
+
+
+def test_sampler_npy_and_drops(tmp_path, monkeypatch):
+    jtag = VirtualJtagToAXI()
+    jtag.write_axi(0x10, 0xABCD)
+    path = tmp_path / "samples.npy"
+    report = Sampler(jtag, [0x10, 0x14], str(path)).run(samples=10)
+    raw = path.read_bytes()
+    assert b"'shape': (10,)" in raw[:NPY_HEADER_LEN]
+    assert len(raw) == NPY_HEADER_LEN + 10 * (8 + 2 * 8 + 2)
+    row = raw[NPY_HEADER_LEN : NPY_HEADER_LEN + 26]
+    assert struct.unpack("<QQ", row[8:24]) == (0xABCD, 0) and row[24:] == b"\x07\x07"
+
+    # A writer that cannot keep up: the ring fills and samples are dropped
+    write = _ColumnWriter.write
+
+    def slow_write(self, *args):
+        time.sleep(0.05)
+        write(self, *args)
+
+    monkeypatch.setattr(_ColumnWriter, "write", slow_write)
+    path = str(tmp_path / "slow.bin")
+    report = Sampler(jtag, [0x10], path, capacity=4).run(samples=200)
+    assert report.dropped > 0 and report.intervals
+    assert report.samples + report.dropped == 200
+    assert sum(count for _, _, count in report.intervals) == report.dropped
+    assert len(read_samples(path)[1]) == report.samples
+
+
+def test_cli_sample(tmp_path, capsys):
+    path = str(tmp_path / "cli.bin")
+    assert main(["--device", "virtual://", "sample", "0x0", "0x4", "-o", path, "--duration", "0.05"]) == 0
+    assert "samples/s" in capsys.readouterr().out
+    assert read_samples(path)[0] == [0, 4]
+
+
+def test_cli_sample_bridge(tmp_path, capsys):
+    jtag = VirtualJtagToAXI()
+    jtag.write_axi(0x8, 0x5A5A)
+    daemon = BridgeDaemon(jtag, address=("127.0.0.1", 0))
+    threading.Thread(target=daemon.serve_forever, daemon=True).start()
+    path = str(tmp_path / "bridge.bin")
+    bridge = f"127.0.0.1:{daemon.address[1]}"
+    assert main(["--bridge", bridge, "sample", "0x8", "0x200000", "-o", path, "--duration", "0.05"]) == 0
+    daemon.close()
+    assert "samples/s" in capsys.readouterr().out
+    _, timestamps, data, status = read_samples(path)
+    assert timestamps and set(data[0]) == {0x5A5A}
+    assert set(status[0]) == {JTAGToAXIStatus.JTAG_AXI_OKAY.value}
+    assert set(status[1]) == {JTAGToAXIStatus.JTAG_AXI_SLVERR.value}
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_status_scan.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import InstJTAG, ScanOp, TxnType, JTAGToAXIStatus
+from jtag_axi.jtag_axi_trace import ScanRecorder
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI
+
+
+def _status_lengths(recorder):
+    return [
+        length
+        for _, _, kind, inst, length, _, _, _ in recorder
+        if kind is ScanOp.DR and inst is InstJTAG.STATUS_AXI_REG
+    ]
+
+
+def test_status_length():
+    jtag = VirtualJtagToAXI()
+    assert jtag._status_length(TxnType.AXI_WRITE) == 4
+    assert jtag._status_length(TxnType.AXI_READ, 0x0, 1) == 12
+    assert jtag._status_length(TxnType.AXI_READ, 0x2, 2) == 36
+    assert jtag._status_length(TxnType.AXI_READ, 0x3, 4) == 36
+
+
+def test_truncated_status_scans():
+    jtag = VirtualJtagToAXI()
+    jtag.recorder = ScanRecorder()
+    jtag.write_axi(0x100, 0x44332211)
+    assert set(_status_lengths(jtag.recorder)) == {4}
+
+    jtag.recorder.clear()
+    status = jtag.read_axi(0x101, size=1)
+    assert set(_status_lengths(jtag.recorder)) == {20}
+    assert status.status == JTAGToAXIStatus.JTAG_AXI_OKAY
+    # Lanes above the one read are not shifted out
+    assert status.data_rd == 0x2211
+
+    assert jtag.read_axi(0x100).data_rd == 0x44332211
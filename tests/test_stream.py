@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_stream.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import random
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import pack_words
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI, VirtualTap
+
+
+def test_pack_words():
+    assert list(pack_words(b"\x21\x43", 4)) == [0x1, 0x2, 0x3, 0x4]
+    assert list(pack_words(b"\xff\x01", 12)) == [0x1FF, 0x0]
+    assert list(pack_words([0x5, 0x7], 3)) == [0x5, 0x7]
+    with pytest.raises(ValueError):
+        list(pack_words([0x8], 3))
+
+
+def test_stream_userdata():
+    jtag = VirtualJtagToAXI(tap=VirtualTap(userdata_width=12), userdata_width=12)
+    data = bytes(random.getrandbits(8) for _ in range(300))
+    words = list(pack_words(data, 12))
+
+    report = jtag.stream_userdata(data, batch=64)
+    assert report.words == len(words) == jtag.tap.userdata_updates
+    # Each shift captures the word updated by the previous one
+    assert report.tdo[1:] == words[:-1]
+    assert jtag.tap.userdata == jtag.userdata_jdr == words[-1]
+    assert report.bandwidth > 0
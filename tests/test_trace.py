@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_trace.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import random
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import InstJTAG, ScanOp, JTAGToAXIStatus
+from jtag_axi.jtag_axi_trace import RECORD_TRUNCATED, ScanRecorder, replay, summarize
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI
+
+
+def _session(jtag, txns=16):
+    for idx in range(txns):
+        jtag.write_axi(idx * 4, random.getrandbits(32))
+    for idx in range(txns):
+        jtag.read_axi(idx * 4)
+
+
+def test_virtual_axi():
+    jtag = VirtualJtagToAXI()
+    values = [random.getrandbits(32) for _ in range(8)]
+    for idx, value in enumerate(values):
+        assert jtag.write_axi(idx * 4, value).status == JTAGToAXIStatus.JTAG_AXI_OKAY
+    for idx, value in enumerate(values):
+        assert jtag.read_axi(idx * 4).data_rd == value
+    assert jtag.read_axi(0x100000).status == JTAGToAXIStatus.JTAG_AXI_SLVERR
+
+
+def test_trace_replay(tmp_path):
+    jtag = VirtualJtagToAXI()
+    jtag.recorder = ScanRecorder()
+    _session(jtag)
+    path = tmp_path / "session.trc"
+    jtag.recorder.save(path)
+
+    trace = ScanRecorder.load(path)
+    assert len(trace) == len(jtag.recorder)
+    summary = summarize(trace)
+    assert summary[InstJTAG.STATUS_AXI_REG.name]["dr_scans"] >= 32
+
+    report = replay(trace, VirtualJtagToAXI())
+    assert report["mismatches"] == [] and report["skipped"] == 0
+    assert report["scans"] == len(trace)
+
+
+def test_trace_ring():
+    recorder = ScanRecorder(max_records=4, value_bytes=1)
+    scans = [(ScanOp.IR, InstJTAG.USERDATA), (ScanOp.DR, 0x1FF, 9)]
+    for _ in range(3):
+        recorder.record(0.0, scans, [0x3])
+    assert len(recorder) == 4
+    assert recorder.dropped == 2
+    records = list(recorder)
+    assert records[-1][2] is ScanOp.DR
+    assert records[-1][7] == RECORD_TRUNCATED  # TDI wider than value_bytes
+    recorder.record(0.0, [(ScanOp.IDLE, 70000)], [])
+    assert list(recorder)[-1][7] & RECORD_TRUNCATED  # Length past 16 bits
+
+
+def test_replay_skips_partial():
+    recorder = ScanRecorder(max_records=6, value_bytes=1)
+    # The ring keeps only the DR of the first program, the second one relies
+    # on the IR it loaded
+    recorder.record(0.0, [(ScanOp.IR, InstJTAG.USERDATA), (ScanOp.DR, 0x5, 4)], [0])
+    recorder.record(0.0, [(ScanOp.DR, 0x6, 4)], [0x5])
+    recorder.record(0.0, [(ScanOp.IR, InstJTAG.IDCODE), (ScanOp.DR, 0, 32)], [0])
+    recorder.record(0.0, [(ScanOp.IR, InstJTAG.USERDATA), (ScanOp.DR, 0x1FF, 9)], [0])
+    records = list(recorder)
+    assert records[0][2] is ScanOp.DR and records[1][3] is InstJTAG.USERDATA
+
+    backend = VirtualJtagToAXI()
+    report = replay(recorder, backend)
+    # Cut by the ring, wrong IR loaded, replayed, TDI truncated
+    assert (report["batches"], report["skipped"]) == (1, 3)
+    assert report["mismatches"] == [(0, 0, 0, backend.idcode_jdr)]
+    assert backend.tap.userdata == 0
+
+    # Recorder attached while an unknown IR was loaded
+    recorder = ScanRecorder()
+    recorder.record(0.0, [(ScanOp.DR, 0x6, 4)], [0])
+    assert replay(recorder, backend)["skipped"] == 1
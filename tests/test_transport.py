@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_transport.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import subprocess
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import jtag_axi
+from jtag_axi.jtag_axi_transport import register_transport, url_scheme
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI
+
+
+def test_import_does_not_load_pyftdi():
+    code = (
+        "import sys, jtag_axi; from jtag_axi import *;"
+        " assert 'pyftdi' not in sys.modules; jtag_axi.open('virtual://')"
+    )
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    subprocess.check_call([sys.executable, "-c", code], cwd=root)
+
+
+def test_open_builtin_and_registered():
+    jtag = jtag_axi.open("virtual://", data_width=64)
+    assert isinstance(jtag, VirtualJtagToAXI)
+    assert jtag.device == "virtual://" and jtag.data_width == 64
+    jtag.write_axi(0x10, 0x1122334455667788, wstrb=0xFF)
+    assert jtag.read_axi(0x10).data_rd == 0x1122334455667788
+
+    register_transport("Loop", "jtag_axi.jtag_axi_virtual:VirtualJtagToAXI")
+    assert "loop" in jtag_axi.transports()
+    assert isinstance(jtag_axi.open("loop://board0"), VirtualJtagToAXI)
+
+
+def test_bad_urls():
+    assert url_scheme("FTDI://ftdi:2232/1") == "ftdi"
+    with pytest.raises(ValueError):
+        url_scheme("no-scheme")
+    with pytest.raises(ValueError):
+        jtag_axi.open("nope://")
+
+
+def test_star_import():
+    scope = {}
+    exec("from jtag_axi import *", scope)
+    assert "open" not in scope and "sys" not in scope
+    for name in ("InstJTAG", "calibrate_freq", "transports", "BaseJtagToAXI"):
+        assert name in scope
+    # Neither the jtag_base imports nor the lazily loaded drivers
+    for name in ("logging", "Enum", "namedtuple", "DriverMetrics", "JtagToAXIFTDI"):
+        assert name not in scope
+    assert jtag_axi.VirtualJtagToAXI is VirtualJtagToAXI
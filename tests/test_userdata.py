@@ -4,7 +4,7 @@
 # License           : MIT license <Check LICENSE>
 # Author            : Anderson Ignacio da Silva (aignacio) <anderson@aignacio.com>
 # Date              : 12.07.2023
-# Last Modified Date: 30.09.2024
+# Last Modified Date: 19.10.2026
 import cocotb
 import logging
 import pytest
@@ -19,7 +19,7 @@ from pathlib import Path
 from random import randrange
 from const.const import cfg
 from const.help_fn import reset_fsm, select_instruction, move_to_shift_dr
-from jtag_axi.jtag_base import JTAGToAXIStatus, JDRStatusAXI, InstJTAG
+from jtag_axi.jtag_base import JTAGToAXIStatus, JDRStatusAXI, InstJTAG, pack_words
 from jtag_axi.jtag_axi_sim import SimJtagToAXI
 from cocotb.triggers import ClockCycles, RisingEdge
 from cocotb.clock import Clock
@@ -95,6 +95,28 @@ async def run_test(dut):
     dut.log.info(f"Throughput: {bw:.2} MiB/s")
 
 
+@cocotb.test()
+async def run_stream_test(dut):
+    jtag = SimJtagToAXI(dut, freq=10e6, addr_width=32, data_width=32)
+    cocotb.start_soon(Clock(dut.clk_axi, *cfg.CLK_100MHz).start())
+
+    dut.ares_axi.value = 1
+    await ClockCycles(dut.clk_axi, 10)
+    dut.ares_axi.value = 0
+
+    await jtag.reset()
+
+    userdata_width = InstJTAG.USERDATA.value[1]
+    data = bytes(rnd_val(8) for _ in range(256))
+    words = list(pack_words(data, userdata_width))
+
+    report = await jtag.stream_userdata(data)
+    # Each shift captures the word updated by the previous one
+    assert report.words == len(words)
+    assert report.tdo[1:] == words[:-1]
+    dut.log.info(f"Stream throughput: {report.bandwidth/1024/1024:.2} MiB/s")
+
+
 def test_userdata():
     """
     Test USERDATA
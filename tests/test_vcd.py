@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_vcd.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import JTAGState
+from jtag_axi.jtag_axi_trace import ScanRecorder, summarize
+from jtag_axi.jtag_axi_vcd import VCDRecorder, trace_to_vcd
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI, VirtualTap
+from jtag_axi.jtag_axi_xvc import TapBitModel
+
+
+def _rising_edges(path):
+    # [tms, tdi, tdo, tap_state] at every TCK rising edge, the state is None
+    # when it did not change on that edge
+    codes, values, edges = {}, {}, []
+    with open(path) as fh:
+        for line in fh:
+            words = line.split()
+            if words[0] == "$var":
+                codes[words[3]] = words[4]
+            elif line[0] == "b":
+                name = codes[words[1]]
+                values[name] = int(words[0][1:], 2)
+                if name == "tap_state" and edges:
+                    edges[-1][3] = values[name]
+            elif line[0] in "01x" and line[1:].strip() in codes:
+                name = codes[line[1:].strip()]
+                values[name] = None if line[0] == "x" else int(line[0])
+                if name == "tck" and values[name] == 1:
+                    edges.append([values["tms"], values["tdi"], values["tdo"], None])
+    return edges
+
+
+def _session(jtag):
+    jtag.write_axi_batch([(0x10, 0x1234), (0x14, 0x5678)])
+    jtag.read_axi(0x14)
+    jtag.stream_userdata([1, 2, 3])
+
+
+def test_vcd_replays_on_tap(tmp_path):
+    jtag = VirtualJtagToAXI(tap=VirtualTap())
+    path = str(tmp_path / "host.vcd")
+    with VCDRecorder(path, freq=jtag.freq, realtime=False) as vcd:
+        jtag.recorder = vcd
+        _session(jtag)
+    edges = _rising_edges(path)
+    assert len(edges) == vcd.cycles
+
+    # The same TMS/TDI bits on a bit level TAP give the same TDO and states
+    shadow = VirtualJtagToAXI(tap=VirtualTap())
+    model = TapBitModel(shadow.tap)
+    model.state = JTAGState.UPDATE_DR
+    for tms, tdi, tdo, state in edges:
+        assert model.clock(tms, tdi) == tdo
+        if state is not None:
+            assert model.state.value == state
+    assert shadow.tap.read_mem(0x10, 8) == jtag.tap.read_mem(0x10, 8)
+    assert shadow.tap.userdata == 3
+
+    # A saved scan trace converts to the same waveform
+    jtag = VirtualJtagToAXI(tap=VirtualTap())
+    jtag.recorder = ScanRecorder()
+    _session(jtag)
+    trace = jtag.recorder
+    trace_to_vcd(trace, str(tmp_path / "trace.vcd"), freq=jtag.freq, realtime=False)
+    assert _rising_edges(str(tmp_path / "trace.vcd")) == edges
+    assert len(edges) == sum(summary["tck"] for summary in summarize(trace).values())
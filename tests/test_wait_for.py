@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_wait_for.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import JTAGToAXIStatus
+from jtag_axi.jtag_axi_trace import ScanRecorder
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI, VirtualTap
+
+
+def _setup(ready_after):
+    # The ready bit rises once the design saw ready_after reads
+    dispatched = []
+
+    def latency(address, txn_type):
+        dispatched.append(address)
+        if len(dispatched) >= ready_after:
+            tap.mem[0x40] = 0x81
+        return 8
+
+    tap = VirtualTap(latency=latency)
+    return VirtualJtagToAXI(tap=tap), tap
+
+
+def test_wait_for():
+    jtag, tap = _setup(ready_after=50)
+    jtag.metrics.reset()
+    jtag.recorder = ScanRecorder()
+    iterations = jtag.wait_for(0x40, mask=0x1, value=0x1)
+    assert iterations >= 50
+    # Only CTRL start and STATUS scans per read, the address is shifted once
+    scans = jtag.metrics.scans
+    assert scans["ADDR_AXI_REG"] == 1
+    assert scans["CTRL_AXI_REG"] <= iterations + 16 + 1
+    assert jtag.recorder.batches < iterations // 4
+    assert jtag.metrics.latency["wait"].count == 1
+    # Nothing left in flight, following txns keep their responses
+    assert not tap.req_fifo and not tap.resp_fifo
+    assert jtag.read_axi(0x40).data_rd == 0x81
+    assert jtag.wait_for(0x40, mask=0xFF, value=0x81) == 1
+
+
+def test_wait_for_timeout():
+    jtag, tap = _setup(ready_after=1 << 30)
+    with pytest.raises(TimeoutError):
+        jtag.wait_for(0x40, mask=0x1, value=0x1, max_iterations=20)
+    with pytest.raises(TimeoutError):
+        jtag.wait_for(0x40, mask=0x1, value=0x1, timeout=0.05)
+    assert jtag.read_axi(0x44).status == JTAGToAXIStatus.JTAG_AXI_OKAY
+    with pytest.raises(RuntimeError):
+        jtag.wait_for(0x100000, mask=0x1, value=0x1)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_watch.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import queue
+import random
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jtag_axi.jtag_base import InstJTAG, JTAGToAXIStatus
+from jtag_axi.jtag_axi_virtual import VirtualJtagToAXI
+from jtag_axi.jtag_axi_watch import Watcher
+
+
+def test_axi_batch():
+    jtag = VirtualJtagToAXI(async_fifo_depth=4)
+    writes = [(addr * 4, random.getrandbits(32)) for addr in range(10)]
+    results = jtag.write_axi_batch(writes)
+    assert [r.status for r in results] == [JTAGToAXIStatus.JTAG_AXI_OKAY] * 10
+    results = jtag.read_axi_batch([addr for addr, _ in writes] + [0x100000])
+    assert [r.data_rd for r in results[:-1]] == [data for _, data in writes]
+    assert results[-1].status == JTAGToAXIStatus.JTAG_AXI_SLVERR
+    # Same responses as the single txn path, narrow reads included
+    assert jtag.read_axi_batch([5], size=1)[0].data_rd == jtag.read_axi(5, size=1).data_rd
+    assert jtag.metrics.status["JTAG_AXI_OKAY"] == 22
+    # One scan batch per AFIFO worth of txns
+    jtag.metrics.reset()
+    jtag.read_axi_batch([addr for addr, _ in writes])
+    assert jtag.metrics.scans["CTRL_AXI_REG"] == 10 + (2 * 3)
+
+
+def test_watch_jdr():
+    jtag = VirtualJtagToAXI()
+    events = queue.Queue()
+    seen = []
+    watcher = Watcher(jtag, queue=events)
+    watcher.watch_jdr(InstJTAG.USERCODE, callback=seen.append)
+    watcher.watch_jdr(InstJTAG.IC_RESET)
+    assert len(watcher.sample()) == 2
+    assert watcher.sample() == []
+    jtag.tap.usercode = 0x1234
+    changes = watcher.sample()
+    assert [(e.name, e.old, e.new) for e in changes] == [("USERCODE", 0, 0x1234)]
+    assert seen[-1].new == 0x1234
+    assert events.qsize() == 3
+    # RW registers keep their value, read-only ones take a single scan
+    jtag.write_ic_reset(0x5)
+    jtag.metrics.reset()
+    assert [e.new for e in watcher.sample()] == [0x5]
+    assert jtag.tap.ic_rst == 0x5
+    assert jtag.metrics.scans == {"USERCODE": 1, "IC_RESET": 1}
+    with pytest.raises(ValueError):
+        watcher.watch_jdr(InstJTAG.STATUS_AXI_REG)
+
+
+def test_watch_axi():
+    jtag = VirtualJtagToAXI()
+    watcher = Watcher(jtag, rate=1000.0)
+    watcher.watch_axi(0x10, name="counter")
+    watcher.watch_axi(0x20, mask=0xFF)
+    watcher.sample()
+    jtag.tap.write_mem(0x10, (7).to_bytes(4, "little"))
+    jtag.tap.write_mem(0x21, b"\x55")
+    changes = watcher.sample()
+    assert [(e.name, e.new) for e in changes] == [("counter", 7)]
+    rate = watcher.run(samples=20)
+    assert watcher.samples == 22
+    assert 0 < rate <= 1100.0
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : test_xvc.py
+# License           : MIT license <Check LICENSE>
+# Author            : Anderson I. da Silva (aignacio) <anderson@aignacio.com>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+import os
+import sys
+import random
+import threading
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import jtag_axi
+from jtag_axi.jtag_base import JTAGToAXIStatus
+from jtag_axi.jtag_axi_virtual import IDCODE_VAL, VirtualTap
+from jtag_axi.jtag_axi_xvc import XVCServer
+
+
+@pytest.fixture(params=[2048, 16])
+def xvc(request):
+    tap = VirtualTap()
+    server = XVCServer(tap, port=0, max_vector_len=request.param)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    jtag = jtag_axi.open(f"xvc://127.0.0.1:{server.address[1]}")
+    yield jtag, server, tap
+    jtag.close()
+    server.close()
+
+
+def test_xvc_axi(xvc):
+    jtag, server, tap = xvc
+    assert jtag.idcode_jdr == IDCODE_VAL
+    assert jtag.write_axi(0x40, 0xCAFEF00D).status == JTAGToAXIStatus.JTAG_AXI_OKAY
+    assert jtag.read_axi(0x40).data_rd == 0xCAFEF00D
+    assert tap.read_mem(0x40, 4) == (0xCAFEF00D).to_bytes(4, "little")
+
+
+def test_xvc_batch_vectors(xvc):
+    jtag, server, tap = xvc
+    data = [random.getrandbits(32) for _ in range(jtag.async_fifo_depth)]
+    addresses = [0x100 + 4 * idx for idx in range(len(data))]
+    shifts = server.shifts
+    jtag.write_axi_batch(list(zip(addresses, data)))
+    if server.max_vector_len == 2048:
+        # The whole batch fits in a single shift: request
+        assert server.shifts - shifts == 1
+    assert [r.data_rd for r in jtag.read_axi_batch(addresses)] == data